@@ -9,7 +9,11 @@ from .sub_agents.infrastructure_agent import infrastructure_agent
 from .sub_agents.medassist_agent import medassist_agent
 from .sub_agents.queue_management_agent import queue_management_agent
 from .sub_agents.security_agent import security_agent
-from .sub_agents.tools import graph_search_tool, get_entity_relationships_tool, get_entity_timeline_tool
+from .sub_agents.tools import (
+    graph_search_tool, get_entity_relationships_tool, get_entity_timeline_tool, spatial_query_tool,
+    locate_zone_tool, hybrid_search_tool, batch_search_tool
+)
+from .sub_agents.tools.metrics import start_metrics_server
 
 # Load environment variables
 load_dotenv()
@@ -19,6 +23,9 @@ project_id = os.environ.get('PROJECT_ID', 'noted-throne-466513-v6')
 location = os.environ.get('LOCATION', 'us-central1')
 vertexai.init(project=project_id, location=location)
 
+# Prometheus endpoint for the graph tool metrics (only when GRAPH_METRICS_ENABLED)
+start_metrics_server()
+
 # Create the root supervisor agent with sub-agents
 root_agent = Agent(
     name="drishti_supervisor",
@@ -31,7 +38,10 @@ root_agent = Agent(
         queue_management_agent,
         security_agent
     ],
-    tools=[graph_search_tool, get_entity_relationships_tool, get_entity_timeline_tool]
+    tools=[
+        graph_search_tool, get_entity_relationships_tool, get_entity_timeline_tool, spatial_query_tool,
+        locate_zone_tool, hybrid_search_tool, batch_search_tool
+    ]
 )
 
 # # Create the AdkApp wrapper for the supervisor agent  
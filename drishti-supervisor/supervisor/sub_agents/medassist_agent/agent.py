@@ -5,7 +5,10 @@ from vertexai.preview.reasoning_engines import AdkApp
 import vertexai
 
 from .prompt import MEDICAL_ASSISTANCE_PROMPT
-from ..tools.tools import graph_search_tool, get_entity_relationships_tool, get_entity_timeline_tool
+from ..tools.tools import (
+    graph_search_tool, get_entity_relationships_tool, get_entity_timeline_tool, spatial_query_tool,
+    locate_zone_tool, hybrid_search_tool, batch_search_tool
+)
 
 # Load environment variables
 load_dotenv()
@@ -21,7 +24,10 @@ medassist_agent = Agent(
     model="gemini-2.0-flash-001",
     description="Medical Assistance Agent that coordinates emergency medical response, health monitoring, medical resource deployment, and healthcare support for comprehensive event medical management.",
     instruction=MEDICAL_ASSISTANCE_PROMPT,
-    tools=[graph_search_tool, get_entity_relationships_tool, get_entity_timeline_tool]
+    tools=[
+        graph_search_tool, get_entity_relationships_tool, get_entity_timeline_tool, spatial_query_tool,
+        locate_zone_tool, hybrid_search_tool, batch_search_tool
+    ]
 )
 
 # Create the AdkApp wrapper
@@ -5,7 +5,10 @@ from vertexai.preview.reasoning_engines import AdkApp
 import vertexai
 
 from .prompt import QUEUE_MANAGEMENT_PROMPT
-from ..tools.tools import graph_search_tool, get_entity_relationships_tool, get_entity_timeline_tool
+from ..tools.tools import (
+    graph_search_tool, get_entity_relationships_tool, get_entity_timeline_tool, spatial_query_tool,
+    locate_zone_tool, hybrid_search_tool, batch_search_tool
+)
 
 # Load environment variables
 load_dotenv()
@@ -21,7 +24,10 @@ queue_management_agent = Agent(
     model="gemini-2.0-flash-001",
     description="Queue Management Agent that optimizes crowd flow, manages entry/exit processes, prevents bottlenecks, and ensures safe and efficient people movement throughout event venues.",
     instruction=QUEUE_MANAGEMENT_PROMPT,
-    tools=[graph_search_tool, get_entity_relationships_tool, get_entity_timeline_tool]
+    tools=[
+        graph_search_tool, get_entity_relationships_tool, get_entity_timeline_tool, spatial_query_tool,
+        locate_zone_tool, hybrid_search_tool, batch_search_tool
+    ]
 )
 
 # Create the AdkApp wrapper
@@ -2,6 +2,12 @@
 Tools for Drishti Event Management System
 """
 
-from .tools import graph_search_tool, get_entity_relationships_tool, get_entity_timeline_tool
+from .tools import (
+    graph_search_tool, get_entity_relationships_tool, get_entity_timeline_tool, spatial_query_tool,
+    locate_zone_tool, hybrid_search_tool, batch_search_tool
+)
 
-__all__ = ['graph_search_tool', 'get_entity_relationships_tool', 'get_entity_timeline_tool']
\ No newline at end of file
+__all__ = [
+    'graph_search_tool', 'get_entity_relationships_tool', 'get_entity_timeline_tool', 'spatial_query_tool',
+    'locate_zone_tool', 'hybrid_search_tool', 'batch_search_tool'
+]
\ No newline at end of file
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Offline ingestion benchmark for the geo graph builder.
+
+Runs load -> chunk -> extract -> add against a local stand-in for
+GraphitiClient that simulates backend latency, jitter and errors, so ingest
+throughput can be measured without Neo4j or Vertex AI.
+
+Examples:
+    python benchmark_ingest.py                          # bundled venue + 1k + 10k synthetic zones
+    python benchmark_ingest.py --venues real --repeat 5 --latency 0.2 --workers 8
+    python benchmark_ingest.py --venues 10000 --stream --chunk-workers 4 --json bench.json
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import random
+import asyncio
+import logging
+import argparse
+import resource
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional
+
+try:
+    from .graph_builder import GraphBuilder
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from graph_builder import GraphBuilder
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GEOJSON = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))),
+    "complete_all_108_zones_enhanced.geojson"
+)
+
+
+class SimulatedBackendError(Exception):
+    """Error raised by the fake backend."""
+
+
+class FakeGraphitiClient:
+    """
+    Local stand-in for GraphitiClient used by the benchmark.
+
+    Every call sleeps for a normally distributed latency and fails with the
+    configured probabilities. Rate limit failures carry a 429 status code so
+    the ingest rate limiter reacts to them like real quota errors.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.02,
+        jitter: float = 0.005,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialize fake client.
+
+        Args:
+            latency: Mean simulated latency per call in seconds
+            jitter: Standard deviation of the latency in seconds
+            error_rate: Probability that a call fails with a generic error
+            rate_limit_rate: Probability that a call fails with a 429
+            seed: Random seed for reproducible runs
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self._random = random.Random(seed)
+        self.call_latencies: List[float] = []
+        self.calls = 0
+        self.failures = 0
+        self.episodes: Dict[str, str] = {}
+
+    async def initialize(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def _call(self, episodes: int = 1):
+        """Simulate one backend round trip."""
+        self.calls += 1
+        started = time.perf_counter()
+        await asyncio.sleep(max(0.0, self._random.gauss(self.latency * episodes, self.jitter)))
+
+        roll = self._random.random()
+        if roll < self.rate_limit_rate:
+            self.failures += 1
+            error = SimulatedBackendError("429 RESOURCE_EXHAUSTED (simulated)")
+            error.status_code = 429
+            raise error
+        if roll < self.rate_limit_rate + self.error_rate:
+            self.failures += 1
+            raise SimulatedBackendError("simulated backend error")
+
+        self.call_latencies.append(time.perf_counter() - started)
+
+    async def add_episode(self, episode_id: str, content: str, source: str, timestamp=None, metadata=None,
+                          namespace=None) -> str:
+        await self._call()
+        episode_uuid = f"fake-{len(self.episodes)}"
+        self.episodes[episode_id] = episode_uuid
+        return episode_uuid
+
+    async def add_episodes(self, episodes: List[Dict[str, Any]], batch_size: int = 10, namespace=None) -> Dict[str, Any]:
+        await self._call(len(episodes))
+        episode_uuids = {}
+        for episode in episodes:
+            episode_uuids[episode["episode_id"]] = self.episodes[episode["episode_id"]] = f"fake-{len(self.episodes)}"
+        return {
+            "episodes_created": len(episodes),
+            "total_chunks": len(episodes),
+            "errors": [],
+            "episode_uuids": episode_uuids
+        }
+
+    async def remove_episode(self, episode_uuid: str):
+        await self._call()
+
+    async def clear_graph(self):
+        self.episodes.clear()
+
+    async def drop_namespace(self, namespace: str):
+        await self._call()
+
+
+def write_synthetic_venue(source_path: str, zone_count: int, target_path: str, seed: int = 0):
+    """
+    Write a synthetic venue by cloning the zones of a real one onto a grid.
+
+    Args:
+        source_path: Real venue GeoJSON used as zone templates
+        zone_count: Number of zones to generate
+        target_path: Output GeoJSON path
+        seed: Random seed for template selection
+    """
+    with open(source_path, 'r', encoding='utf-8') as f:
+        source = json.load(f)
+
+    templates = source["features"]
+    rng = random.Random(seed)
+    columns = max(1, int(zone_count ** 0.5))
+    cell = 0.0005  # Degrees between neighbouring synthetic zones
+
+    features = []
+    for index in range(zone_count):
+        template = rng.choice(templates)
+        d_lon = (index % columns) * cell
+        d_lat = (index // columns) * cell
+        zone_id = f"zone_{index + 1:05d}"
+
+        properties = json.loads(json.dumps(template["properties"]))
+        properties["id"] = zone_id
+        properties["name"] = f"{properties.get('name', 'Zone')} #{index + 1}"
+        for point in properties.get("infrastructure_points", []) + properties.get("entry_exit_points", []):
+            point["id"] = f"{zone_id}_{point.get('id', 'point')}"
+
+        base_lon, base_lat = template["geometry"]["coordinates"][0][0][:2]
+        geometry = {
+            "type": "Polygon",
+            "coordinates": [[
+                [lon - base_lon + 77.59 + d_lon, lat - base_lat + 12.97 + d_lat]
+                for lon, lat, *_ in ring
+            ] for ring in template["geometry"]["coordinates"]]
+        }
+        features.append({"type": "Feature", "geometry": geometry, "properties": properties})
+
+    with open(target_path, 'w', encoding='utf-8') as f:
+        json.dump({"type": "FeatureCollection", "metadata": source.get("metadata", {}), "features": features}, f)
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile (None for no samples)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples: List[float], total_seconds: float, items: int) -> Dict[str, Any]:
+    """Per-stage statistics in milliseconds."""
+    return {
+        "total_s": round(total_seconds, 4),
+        "items": items,
+        "items_per_s": round(items / total_seconds, 2) if total_seconds > 0 else None,
+        "p50_ms": None if not samples else round(percentile(samples, 50) * 1000, 3),
+        "p99_ms": None if not samples else round(percentile(samples, 99) * 1000, 3)
+    }
+
+
+def peak_rss_mb() -> Dict[str, float]:
+    """Peak resident set size of this process and of its (pool) children."""
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024  # ru_maxrss is bytes on macOS, KiB on Linux
+    return {
+        "self_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale, 1),
+        "children_mb": round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale, 1)
+    }
+
+
+async def run_pipeline(geojson_path: str, args: argparse.Namespace) -> Dict[str, Any]:
+    """Run load -> chunk -> extract -> add once and time every stage."""
+    client = FakeGraphitiClient(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        seed=args.seed
+    )
+    builder = GraphBuilder(graph_client=client)
+    stages: Dict[str, Dict[str, Any]] = {}
+
+    # Load (streamed loading is lazy, so parsing time shows up under chunk)
+    started = time.perf_counter()
+    if args.stream:
+        data = builder.stream_geojson_from_file(geojson_path)
+    else:
+        data = builder.load_geojson_from_file(geojson_path)
+    elapsed = time.perf_counter() - started
+    stages["load"] = summarize([elapsed], elapsed, 1)
+
+    # Chunk
+    samples = []
+    chunks = []
+    started = last = time.perf_counter()
+    for chunk in builder.iter_geochunks_from_geojson(data, workers=args.chunk_workers):
+        now = time.perf_counter()
+        samples.append(now - last)
+        chunks.append(chunk)
+        last = now
+    stages["chunk"] = summarize(samples, time.perf_counter() - started, len(chunks))
+
+    # Extract
+    samples = []
+    started = time.perf_counter()
+    for chunk in chunks:
+        item_started = time.perf_counter()
+        await builder.extract_entities_from_geochunks([chunk])
+        samples.append(time.perf_counter() - item_started)
+    stages["extract"] = summarize(samples, time.perf_counter() - started, len(chunks))
+
+    # Add
+    started = time.perf_counter()
+    result = await builder.add_geojson_to_graph(
+        geo_chunks=chunks,
+        source_name="benchmark",
+        max_workers=args.workers,
+        rate_limit=args.rate_limit,
+        max_retries=args.max_retries,
+        batch_size=args.batch_size
+    )
+    stages["add"] = summarize(client.call_latencies, time.perf_counter() - started, result["episodes_created"])
+    stages["add"]["backend_calls"] = client.calls
+    stages["add"]["backend_failures"] = client.failures
+    stages["add"]["errors"] = len(result["errors"])
+
+    await builder.close()
+    return {"zones": len(chunks), "stages": stages}
+
+
+def run_venue(geojson_path: str, args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Run every repeat of one venue and measure its peak RSS.
+
+    Called in a fresh process per venue, since ru_maxrss never goes down:
+    measured in one process, each venue would report the peak of the largest
+    venue run before it.
+    """
+    logging.basicConfig(level=logging.WARNING)
+    runs = [asyncio.run(run_pipeline(geojson_path, args)) for _ in range(max(1, args.repeat))]
+    return {"runs": runs, "peak_rss": peak_rss_mb()}
+
+
+def print_report(name: str, runs: List[Dict[str, Any]], peak_rss: Dict[str, float]):
+    """Print a per-stage table for a venue (median of per-run values)."""
+    print(f"\n=== {name}: {runs[0]['zones']} zones, {len(runs)} run(s) ===")
+    print(f"{'stage':<8} {'total s':>9} {'items/s':>10} {'p50 ms':>9} {'p99 ms':>9}")
+    for stage in ("load", "chunk", "extract", "add"):
+        values = [run["stages"][stage] for run in runs]
+
+        def median(key):
+            samples = [v[key] for v in values if v[key] is not None]
+            return percentile(samples, 50) if samples else None
+
+        cells = [median("total_s"), median("items_per_s"), median("p50_ms"), median("p99_ms")]
+        print(f"{stage:<8} " + " ".join(
+            f"{'-' if cell is None else format(cell, '.3f'):>{width}}"
+            for cell, width in zip(cells, (9, 10, 9, 9))
+        ))
+    add = runs[-1]["stages"]["add"]
+    print(f"episodes/sec: {add['items_per_s']}  backend calls: {add['backend_calls']}  "
+          f"failures: {add['backend_failures']}  errors: {add['errors']}")
+    print(f"peak RSS: {peak_rss['self_mb']} MB (chunk workers: {peak_rss['children_mb']} MB)")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse benchmark options."""
+    parser = argparse.ArgumentParser(description="Benchmark geo graph ingestion against a simulated backend")
+    parser.add_argument("--venues", default="real,1000,10000",
+                        help="Comma separated venues: 'real' and/or synthetic zone counts")
+    parser.add_argument("--geojson", default=DEFAULT_GEOJSON, help="Real venue GeoJSON (also the synthetic template)")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per venue")
+    parser.add_argument("--latency", type=float, default=0.02, help="Mean simulated backend latency (s)")
+    parser.add_argument("--jitter", type=float, default=0.005, help="Latency standard deviation (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of a generic backend error")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Probability of a simulated 429")
+    parser.add_argument("--workers", type=int, default=16, help="Ingestion workers")
+    parser.add_argument("--rate-limit", type=float, default=1000.0, help="Submissions started per second")
+    parser.add_argument("--max-retries", type=int, default=3, help="Retries per submission")
+    parser.add_argument("--batch-size", type=int, default=1, help="Episodes per bulk submission")
+    parser.add_argument("--chunk-workers", type=int, default=1, help="Processes used to build chunks")
+    parser.add_argument("--stream", action="store_true", help="Use the streaming GeoJSON loader")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--json", default=None, help="Also write the raw results to this JSON file")
+    return parser.parse_args(argv)
+
+
+def main(args: argparse.Namespace):
+    """Run the benchmark for every requested venue, each in its own process."""
+    results = {"config": vars(args), "venues": {}, "peak_rss": {}}
+
+    with tempfile.TemporaryDirectory(prefix="drishti_bench_") as tmp_dir:
+        for venue in [v.strip() for v in args.venues.split(",") if v.strip()]:
+            if venue == "real":
+                path = args.geojson
+            else:
+                path = os.path.join(tmp_dir, f"synthetic_{venue}.geojson")
+                write_synthetic_venue(args.geojson, int(venue), path, seed=args.seed)
+
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+                venue_result = executor.submit(run_venue, path, args).result()
+            print_report(venue, venue_result["runs"], venue_result["peak_rss"])
+            results["venues"][venue] = venue_result["runs"]
+            results["peak_rss"][venue] = venue_result["peak_rss"]
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    main(parse_args())
@@ -0,0 +1,138 @@
+"""
+Local BM25 inverted index over knowledge graph episode content.
+
+Venue identifiers (zone_045, checkpoint_003, ...) are indexed as whole
+tokens and as their parts, so "zone_045", "zone 045" and "zone 45" all
+match the same documents.
+"""
+
+import re
+import math
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+_WORD = re.compile(r"[a-z0-9]+(?:_[a-z0-9]+)*")
+IDENTIFIER = re.compile(r"[a-z]+(?:_[a-z]+)*_\d+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens; identifiers are kept whole and also split into parts."""
+    tokens = []
+    for word in _WORD.findall(text.lower()):
+        tokens.append(word)
+        if "_" in word:
+            for part in word.split("_"):
+                tokens.append((part.lstrip("0") or "0") if part.isdigit() else part)
+        elif word.isdigit():
+            tokens[-1] = word.lstrip("0") or "0"
+    return tokens
+
+
+def find_identifiers(text: str) -> List[str]:
+    """Venue identifiers (e.g. zone_045) mentioned in text."""
+    return [word for word in _WORD.findall(text.lower()) if IDENTIFIER.fullmatch(word)]
+
+
+def is_identifier_query(query: str) -> bool:
+    """Whether the query is nothing but one or more identifiers."""
+    words = _WORD.findall(query.lower())
+    return bool(words) and all(IDENTIFIER.fullmatch(word) for word in words)
+
+
+class BM25Index:
+    """In-memory Okapi BM25 index of text documents keyed by ID."""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        Initialize index.
+
+        Args:
+            k1: Term frequency saturation
+            b: Document length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._terms: Dict[str, List[str]] = {}  # Distinct tokens of each document, for remove()
+        self._lengths: Dict[str, int] = {}
+        self._documents: Dict[str, Dict[str, Any]] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._lengths
+
+    def add(self, doc_id: str, text: str, document: Optional[Dict[str, Any]] = None):
+        """
+        Index a document, replacing any previous version with the same ID.
+
+        Args:
+            doc_id: Document ID
+            text: Text to index
+            document: Data returned with search hits (defaults to {"id": doc_id})
+        """
+        if doc_id in self._lengths:
+            self.remove(doc_id)
+
+        counts = Counter(tokenize(text))
+        for token, count in counts.items():
+            self._postings.setdefault(token, {})[doc_id] = count
+        self._terms[doc_id] = list(counts)
+        length = sum(counts.values())
+        self._lengths[doc_id] = length
+        self._total_length += length
+        self._documents[doc_id] = document if document is not None else {"id": doc_id}
+
+    def add_many(self, documents: Iterable[Tuple[str, str, Optional[Dict[str, Any]]]]):
+        """Index (doc_id, text, document) tuples."""
+        for doc_id, text, document in documents:
+            self.add(doc_id, text, document)
+
+    def remove(self, doc_id: str):
+        """Remove a document (no-op when it is not indexed)."""
+        if doc_id not in self._lengths:
+            return
+        for token in self._terms.pop(doc_id):
+            del self._postings[token][doc_id]
+            if not self._postings[token]:
+                del self._postings[token]
+        self._total_length -= self._lengths.pop(doc_id)
+        del self._documents[doc_id]
+
+    def document(self, doc_id: str) -> Optional[Dict[str, Any]]:
+        """Stored data of a document."""
+        return self._documents.get(doc_id)
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[str, float]]:
+        """
+        Rank documents against a query.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of hits
+
+        Returns:
+            (doc_id, score) pairs, best first
+        """
+        if not self._lengths:
+            return []
+
+        count = len(self._lengths)
+        average_length = self._total_length / count
+        scores: Dict[str, float] = {}
+        for token in set(tokenize(query)):
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, frequency in postings.items():
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[doc_id] / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+    def lookup(self, identifier: str) -> List[str]:
+        """IDs of documents containing an exact identifier token."""
+        return sorted(self._postings.get(identifier.lower(), {}))
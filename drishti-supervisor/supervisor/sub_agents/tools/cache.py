@@ -0,0 +1,159 @@
+"""
+In-process result caching for knowledge graph queries.
+"""
+
+import re
+import copy
+import time
+import asyncio
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for cache lookups (case and whitespace insensitive)."""
+    return _WHITESPACE.sub(" ", query).strip().casefold()
+
+
+class TTLCache:
+    """
+    Size-bounded LRU cache whose entries expire after a fixed time to live.
+
+    clear() also bumps `generation`; a caller that captured the generation
+    before a slow lookup can pass it to set() so results computed before an
+    invalidation are not cached afterwards.
+    """
+
+    def __init__(self, max_size: int = 512, ttl_seconds: float = 60.0):
+        """
+        Initialize cache.
+
+        Args:
+            max_size: Maximum number of entries (0 disables caching)
+            ttl_seconds: Seconds an entry stays valid
+        """
+        self.max_size = max(0, max_size)
+        self.ttl_seconds = ttl_seconds
+        self.generation = 0
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None):
+        """
+        Store a value, evicting the least recently used entries beyond max_size.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            generation: Generation the value was computed in (stale values are dropped)
+        """
+        if self.max_size == 0 or (generation is not None and generation != self.generation):
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Drop every entry (e.g. after the underlying data changed)."""
+        self._entries.clear()
+        self.generation += 1
+        self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations
+        }
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one execution.
+
+    The first caller for a key starts the work as a task; callers arriving
+    while it is in flight await the same task and receive a deep copy of its
+    result (or the same exception). Cancelling one caller does not cancel the
+    shared work.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run func() unless a call with the same key is already running.
+
+        Args:
+            key: Identity of the call (must be hashable)
+            func: Zero-argument coroutine function doing the work
+
+        Returns:
+            Result of the (possibly shared) call
+        """
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return copy.deepcopy(await asyncio.shield(task))
+
+        self.executions += 1
+        task = asyncio.ensure_future(func())
+        self._in_flight[key] = task
+        task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: "asyncio.Task[Any]"):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()  # Retrieved here so abandoned failures are not logged as unhandled
+
+    def stats(self) -> Dict[str, Any]:
+        """Execution/coalescing counters."""
+        calls = self.executions + self.coalesced
+        return {
+            "in_flight": len(self._in_flight),
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "coalesce_rate": round(self.coalesced / calls, 4) if calls else 0.0
+        }
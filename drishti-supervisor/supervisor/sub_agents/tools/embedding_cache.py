@@ -0,0 +1,272 @@
+"""
+Persistent embedding cache for graph search.
+
+Embeddings are stored per (model, dimension) as a flat float32 file that is
+memory-mapped for reads, plus an append-only JSONL index mapping the SHA-256
+of each text to its row. Both files only ever grow, so a crash can at worst
+leave vectors without an index entry, which are ignored on the next load.
+"""
+
+import os
+import re
+import json
+import hashlib
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+from graphiti_core.embedder.client import EmbedderClient
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; appends are then unlocked
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Cache location (relative to the working directory); empty disables the cache
+EMBEDDING_CACHE_DIR = os.getenv("EMBEDDING_CACHE_DIR", ".embedding_cache")
+
+# Texts sent per create_batch call while pre-warming
+PREWARM_BATCH_SIZE = 100
+
+
+def _text_key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingStore:
+    """Disk-backed text -> vector store for one embedding model and dimension."""
+
+    def __init__(self, directory: str, model: str, dimension: int):
+        """
+        Initialize store.
+
+        Args:
+            directory: Cache directory
+            model: Embedding model name
+            dimension: Embedding dimension
+        """
+        self.model = model
+        self.dimension = dimension
+        base_name = f"{re.sub(r'[^A-Za-z0-9_.-]', '_', model)}_{dimension}"
+        self.vectors_path = os.path.join(directory, f"{base_name}.f32")
+        self.index_path = os.path.join(directory, f"{base_name}.index.jsonl")
+
+        self._rows: Dict[str, int] = {}
+        self._row_count = 0
+        self._index_offset = 0  # Bytes of the index file already read
+        self._mapped: Optional[np.memmap] = None
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, text: str) -> bool:
+        return _text_key(text) in self._rows
+
+    def load(self):
+        """Load the index, dropping entries whose vectors never reached disk."""
+        self._rows = {}
+        self._index_offset = 0
+        self._mapped = None
+        row_size = self.dimension * 4
+        self._row_count = os.path.getsize(self.vectors_path) // row_size if os.path.exists(self.vectors_path) else 0
+        self._read_index(self._row_count)
+        logger.info(f"Loaded {len(self._rows)} cached embeddings for {self.model} ({self.dimension}d)")
+
+    def _read_index(self, row_count: int):
+        """Read index entries appended since the last read (by any process) that point below row_count."""
+        if not os.path.exists(self.index_path):
+            return
+
+        with open(self.index_path, 'rb') as f:
+            f.seek(self._index_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Torn final line; re-read once it is complete
+                self._index_offset += len(line)
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if entry.get("row", row_count) < row_count:
+                    self._rows[entry["key"]] = entry["row"]
+
+    def get(self, text: str) -> Optional[List[float]]:
+        """Return the cached embedding of text, or None."""
+        row = self._rows.get(_text_key(text))
+        if row is None:
+            return None
+
+        if self._mapped is None or row >= len(self._mapped):
+            self._mapped = np.memmap(self.vectors_path, dtype=np.float32, mode='r', shape=(self._row_count, self.dimension))
+        return self._mapped[row].tolist()
+
+    def put_many(self, texts: List[str], vectors: List[List[float]]):
+        """Append embeddings for texts that are not cached yet."""
+        new_keys: Dict[str, List[float]] = {}
+        for text, vector in zip(texts, vectors):
+            key = _text_key(text)
+            if key in self._rows or key in new_keys or len(vector) != self.dimension:
+                continue
+            new_keys[key] = vector
+
+        if not new_keys:
+            return
+
+        directory = os.path.dirname(self.vectors_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Other processes (e.g. --prewarm-embeddings next to a running agent) append to
+        # the same files; the lock makes row numbers come from the file, not from
+        # this process's view of it
+        row_size = self.dimension * 4
+        with open(self.vectors_path, 'ab') as vectors_file:
+            if fcntl is not None:
+                fcntl.flock(vectors_file.fileno(), fcntl.LOCK_EX)  # Released when the file is closed
+
+            first_row, torn_bytes = divmod(os.fstat(vectors_file.fileno()).st_size, row_size)
+            if torn_bytes:
+                # A crash mid-append left a partial row that no index entry points at
+                vectors_file.truncate(first_row * row_size)
+
+            self._read_index(first_row)
+            new_keys = {key: vector for key, vector in new_keys.items() if key not in self._rows}
+            if new_keys:
+                # Vectors first, then the index entries that point at them
+                vectors_file.write(np.asarray(list(new_keys.values()), dtype=np.float32).tobytes())
+                vectors_file.flush()
+                with open(self.index_path, 'a', encoding='utf-8') as f:
+                    if f.tell() > self._index_offset:
+                        f.write("\n")  # Terminate a torn final line instead of extending it
+                    for offset, key in enumerate(new_keys):
+                        f.write(json.dumps({"key": key, "row": first_row + offset}) + "\n")
+
+        for offset, key in enumerate(new_keys):
+            self._rows[key] = first_row + offset
+        self._row_count = first_row + len(new_keys)
+
+
+class CachedEmbedder(EmbedderClient):
+    """
+    Embedder wrapper that serves single-text embeddings from an EmbeddingStore.
+
+    Graphiti embeds search queries and node/edge names with
+    create(input_data=[text]); those calls are cached. Anything else (token
+    inputs, multi-text lists) goes straight to the wrapped embedder.
+    """
+
+    def __init__(self, embedder: EmbedderClient, store: EmbeddingStore):
+        """
+        Initialize cached embedder.
+
+        Args:
+            embedder: Embedder used on cache misses
+            store: Persistent embedding store
+        """
+        self.embedder = embedder
+        self.store = store
+        self.config = getattr(embedder, "config", None)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _single_text(input_data: Any) -> Optional[str]:
+        if isinstance(input_data, str):
+            return input_data
+        if isinstance(input_data, list) and len(input_data) == 1 and isinstance(input_data[0], str):
+            return input_data[0]
+        return None
+
+    async def create(self, input_data) -> List[float]:
+        text = self._single_text(input_data)
+        if text is None:
+            return await self.embedder.create(input_data)
+
+        cached = self.store.get(text)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        vector = await self.embedder.create(input_data)
+        self.store.put_many([text], [list(vector)])
+        return vector
+
+    async def create_batch(self, input_data_list: List[str]) -> List[List[float]]:
+        results: List[Optional[List[float]]] = [self.store.get(text) for text in input_data_list]
+        missing = [i for i, vector in enumerate(results) if vector is None]
+        self.hits += len(input_data_list) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            texts = [input_data_list[i] for i in missing]
+            vectors = await self.embedder.create_batch(texts)
+            self.store.put_many(texts, [list(vector) for vector in vectors])
+            for i, vector in zip(missing, vectors):
+                results[i] = vector
+
+        return results
+
+    async def prewarm(self, texts: Iterable[str]) -> int:
+        """
+        Embed and cache texts that are not cached yet.
+
+        Args:
+            texts: Texts to pre-warm (e.g. from venue_vocabulary)
+
+        Returns:
+            Number of newly cached embeddings
+        """
+        pending = [text for text in dict.fromkeys(texts) if text and text not in self.store]
+        for start in range(0, len(pending), PREWARM_BATCH_SIZE):
+            batch = pending[start:start + PREWARM_BATCH_SIZE]
+            try:
+                vectors = await self.embedder.create_batch(batch)
+            except NotImplementedError:
+                vectors = [await self.embedder.create([text]) for text in batch]
+            self.store.put_many(batch, [list(vector) for vector in vectors])
+
+        logger.info(f"Pre-warmed {len(pending)} embeddings ({len(self.store)} cached)")
+        return len(pending)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and cache size."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.store),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+
+def venue_vocabulary(zones: Iterable[Any]) -> List[str]:
+    """
+    Collect the texts agents search for: zone and point names/IDs and schema enum values.
+
+    Args:
+        zones: Normalized zone records (e.g. GeoChunk.zone)
+
+    Returns:
+        Unique texts in first-seen order
+    """
+    texts: List[str] = []
+    for zone in zones:
+        texts.extend([zone.name, zone.id])
+        for point in zone.infrastructure_points + zone.entry_exit_points:
+            texts.extend([point.name, point.id])
+
+    try:
+        from . import enhanced_location_schema as schema
+    except ImportError:
+        import enhanced_location_schema as schema
+
+    for enum_type in (schema.ZoneType, schema.InfrastructureType, schema.IncidentType,
+                      schema.SecurityLevel, schema.AccessLevel):
+        for member in enum_type:
+            texts.extend([member.value, member.value.replace("_", " ")])
+
+    return [text for text in dict.fromkeys(texts) if isinstance(text, str) and text]
@@ -0,0 +1,125 @@
+"""
+Incremental GeoJSON FeatureCollection reader.
+
+Parses the top-level object member by member and decodes the "features"
+array one feature at a time, so only a single feature (plus a read buffer)
+is held in memory regardless of file size.
+"""
+
+import json
+import logging
+from typing import Any, Dict, Iterator, TextIO
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_READ_SIZE = 64 * 1024
+
+
+class _StreamReader:
+    """Buffered character reader on top of a text file."""
+
+    def __init__(self, file_obj: TextIO, read_size: int = DEFAULT_READ_SIZE):
+        self.file_obj = file_obj
+        self.read_size = read_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Read more data into the buffer, dropping consumed characters."""
+        if self.eof:
+            return False
+        data = self.file_obj.read(self.read_size)
+        if not data:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ('' at EOF)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str):
+        """Consume the next non-whitespace character, which must be char."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Invalid GeoJSON: expected '{char}' but found '{found or 'EOF'}'")
+        self.pos += 1
+
+    def decode(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+
+            # A scalar ending exactly at the buffer edge may continue in the next read
+            if end == len(self.buffer) and not self.eof and self._fill():
+                continue
+
+            self.pos = end
+            return value
+
+
+def iter_feature_collection(
+    file_obj: TextIO,
+    top_level: Dict[str, Any],
+    read_size: int = DEFAULT_READ_SIZE
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield the raw features of a GeoJSON FeatureCollection.
+
+    Args:
+        file_obj: Open text file positioned at the start of the document
+        top_level: Dict that receives every other top-level member as it is read
+            (members that follow "features" are only present once iteration ends)
+        read_size: Characters read from the file per refill
+
+    Yields:
+        Feature dicts in file order
+    """
+    reader = _StreamReader(file_obj, read_size)
+    reader.expect("{")
+
+    if reader.peek() == "}":
+        return
+
+    while True:
+        key = reader.decode()
+        if not isinstance(key, str):
+            raise ValueError("Invalid GeoJSON: expected an object key")
+        reader.expect(":")
+
+        if key == "features":
+            reader.expect("[")
+            if reader.peek() == "]":
+                reader.pos += 1
+            else:
+                while True:
+                    yield reader.decode()
+                    if reader.peek() == ",":
+                        reader.pos += 1
+                        continue
+                    reader.expect("]")
+                    break
+        else:
+            top_level[key] = reader.decode()
+
+        if reader.peek() == ",":
+            reader.pos += 1
+            continue
+        reader.expect("}")
+        break
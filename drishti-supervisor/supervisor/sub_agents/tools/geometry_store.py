@@ -0,0 +1,230 @@
+"""
+Venue-wide packed geometry storage.
+
+All polygon ring coordinates of a venue live in one contiguous (N, 2) float64
+array. Offset arrays map every zone to its rings and every ring to its
+coordinates, and per-zone bounding boxes, centroids and areas are computed
+once when a zone is added, so spatial lookups never walk nested lists again.
+"""
+
+import math
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# Meters per degree of latitude (and of longitude at the equator)
+METERS_PER_DEGREE = 111_320.0
+
+
+class _GrowableArray:
+    """Append-only numpy buffer with amortized doubling."""
+
+    def __init__(self, width: Optional[int], dtype, capacity: int = 64):
+        shape = (capacity,) if width is None else (capacity, width)
+        self._data = np.empty(shape, dtype=dtype)
+        self.size = 0
+
+    def extend(self, values: np.ndarray):
+        needed = self.size + len(values)
+        if needed > len(self._data):
+            capacity = max(needed, 2 * len(self._data))
+            grown = np.empty((capacity,) + self._data.shape[1:], dtype=self._data.dtype)
+            grown[:self.size] = self._data[:self.size]
+            self._data = grown
+        self._data[self.size:needed] = values
+        self.size = needed
+
+    def view(self) -> np.ndarray:
+        return self._data[:self.size]
+
+
+def _ring_stats(ring: np.ndarray) -> "tuple[float, float, float]":
+    """Signed planar area and centroid of a closed or open ring (degrees)."""
+    x, y = ring[:, 0], ring[:, 1]
+    x_next, y_next = np.roll(x, -1), np.roll(y, -1)
+    cross = x * y_next - x_next * y
+    area = cross.sum() / 2.0
+    if area == 0:
+        return 0.0, float(x.mean()), float(y.mean())
+    cx = ((x + x_next) * cross).sum() / (6.0 * area)
+    cy = ((y + y_next) * cross).sum() / (6.0 * area)
+    return float(area), float(cx), float(cy)
+
+
+class GeometryStore:
+    """
+    Packed polygon store for one venue.
+
+    Zones are addressed by the integer index returned from add(). Point
+    geometries are stored as a single one-vertex ring; other geometry types
+    (and rings with altitude values) are kept as-is and have no summary.
+    """
+
+    def __init__(self):
+        self._coords = _GrowableArray(2, np.float64, capacity=1024)
+        self._ring_offsets = _GrowableArray(None, np.int64)
+        self._ring_offsets.extend(np.zeros(1, dtype=np.int64))
+        self._zone_ring_offsets = _GrowableArray(None, np.int64)
+        self._zone_ring_offsets.extend(np.zeros(1, dtype=np.int64))
+        self._bboxes = _GrowableArray(4, np.float64)      # min_lon, min_lat, max_lon, max_lat
+        self._centroids = _GrowableArray(2, np.float64)   # lon, lat
+        self._areas = _GrowableArray(None, np.float64)    # square meters
+        self._geometry_types: List[Optional[str]] = []
+        self._unpacked: Dict[int, Dict[str, Any]] = {}
+        self.zone_ids: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.zone_ids)
+
+    def __repr__(self) -> str:
+        return f"GeometryStore(zones={len(self)}, vertices={self._coords.size})"
+
+    def has_coordinates(self, index: int) -> bool:
+        """Whether a zone has any geometry coordinates."""
+        if index in self._unpacked:
+            return bool(self._unpacked[index].get("coordinates"))
+        return bool(self.zone_ring_offsets[index + 1] > self.zone_ring_offsets[index])
+
+    def geometry_type(self, index: int) -> Optional[str]:
+        """GeoJSON type of a zone's geometry."""
+        return self._geometry_types[index]
+
+    # Array views (contiguous, no copies)
+    @property
+    def coords(self) -> np.ndarray:
+        return self._coords.view()
+
+    @property
+    def ring_offsets(self) -> np.ndarray:
+        return self._ring_offsets.view()
+
+    @property
+    def zone_ring_offsets(self) -> np.ndarray:
+        return self._zone_ring_offsets.view()
+
+    @property
+    def bboxes(self) -> np.ndarray:
+        return self._bboxes.view()
+
+    @property
+    def centroids(self) -> np.ndarray:
+        return self._centroids.view()
+
+    @property
+    def areas(self) -> np.ndarray:
+        return self._areas.view()
+
+    def add(self, zone_id: str, geometry: Dict[str, Any]) -> int:
+        """
+        Pack a GeoJSON geometry and precompute its spatial summary.
+
+        Args:
+            zone_id: Zone identifier
+            geometry: GeoJSON Polygon (or Point) geometry dict
+
+        Returns:
+            Index of the zone in the store
+        """
+        geometry_type = geometry.get("type") if geometry else None
+        coordinates = geometry.get("coordinates") if geometry else None
+
+        rings = []
+        try:
+            if geometry_type == "Polygon" and coordinates:
+                rings = [np.asarray(ring, dtype=np.float64) for ring in coordinates if len(ring)]
+            elif geometry_type == "Point" and coordinates:
+                rings = [np.asarray([coordinates], dtype=np.float64)]
+        except ValueError:
+            rings = []  # Ragged coordinates
+
+        index = len(self.zone_ids)
+        self.zone_ids.append(zone_id)
+        self._geometry_types.append(geometry_type)
+
+        if any(ring.ndim != 2 or ring.shape[1] != 2 for ring in rings) or (coordinates and not rings):
+            self._unpacked[index] = geometry
+            rings = []
+
+        ring_end = int(self._ring_offsets.view()[-1])
+        for ring in rings:
+            self._coords.extend(ring)
+            ring_end += len(ring)
+            self._ring_offsets.extend(np.asarray([ring_end], dtype=np.int64))
+        self._zone_ring_offsets.extend(np.asarray([len(self._ring_offsets.view()) - 1], dtype=np.int64))
+
+        if not rings:
+            self._bboxes.extend(np.full((1, 4), np.nan))
+            self._centroids.extend(np.full((1, 2), np.nan))
+            self._areas.extend(np.zeros(1))
+            return index
+
+        outer = rings[0]
+        self._bboxes.extend(np.concatenate([outer.min(axis=0), outer.max(axis=0)])[None, :])
+
+        outer_area, cx, cy = _ring_stats(outer)
+        if not (outer[:, 0].min() <= cx <= outer[:, 0].max() and outer[:, 1].min() <= cy <= outer[:, 1].max()):
+            # Self-intersecting ring: the signed-area centroid is meaningless, use the vertex mean
+            cx, cy = (float(v) for v in outer.mean(axis=0))
+        area = abs(outer_area) - sum(abs(_ring_stats(hole)[0]) for hole in rings[1:])
+        self._centroids.extend(np.asarray([[cx, cy]]))
+
+        # Equirectangular projection around the centroid latitude
+        meters_per_lon = METERS_PER_DEGREE * math.cos(math.radians(cy))
+        self._areas.extend(np.asarray([max(area, 0.0) * METERS_PER_DEGREE * meters_per_lon]))
+        return index
+
+    def merge(self, other: "GeometryStore") -> int:
+        """
+        Append all zones of another store (e.g. one built in a worker process).
+
+        Returns:
+            Offset to add to the other store's zone indexes
+        """
+        offset = len(self.zone_ids)
+        coord_base = self._coords.size
+        ring_base = len(self._ring_offsets.view()) - 1
+
+        self._coords.extend(other.coords)
+        self._ring_offsets.extend(other.ring_offsets[1:] + coord_base)
+        self._zone_ring_offsets.extend(other.zone_ring_offsets[1:] + ring_base)
+        self._bboxes.extend(other.bboxes)
+        self._centroids.extend(other.centroids)
+        self._areas.extend(other.areas)
+        self._geometry_types.extend(other._geometry_types)
+        self._unpacked.update({offset + index: geometry for index, geometry in other._unpacked.items()})
+        self.zone_ids.extend(other.zone_ids)
+        return offset
+
+    def rings(self, index: int) -> List[np.ndarray]:
+        """Coordinate arrays (views) of every ring of a zone."""
+        ring_offsets = self.ring_offsets
+        first, last = self.zone_ring_offsets[index], self.zone_ring_offsets[index + 1]
+        return [self.coords[ring_offsets[r]:ring_offsets[r + 1]] for r in range(first, last)]
+
+    def bounding_box(self, index: int) -> Optional[Dict[str, float]]:
+        """Bounding box of a zone's outer ring, or None for empty geometries."""
+        min_lon, min_lat, max_lon, max_lat = self.bboxes[index].tolist()
+        if math.isnan(min_lon):
+            return None
+        return {"min_lon": min_lon, "max_lon": max_lon, "min_lat": min_lat, "max_lat": max_lat}
+
+    def centroid(self, index: int) -> Optional[List[float]]:
+        """Area-weighted centroid [lon, lat] of a zone's outer ring."""
+        centroid = self.centroids[index].tolist()
+        return None if math.isnan(centroid[0]) else centroid
+
+    def area(self, index: int) -> float:
+        """Approximate zone area in square meters (holes subtracted)."""
+        return float(self.areas[index])
+
+    def geometry(self, index: int) -> Dict[str, Any]:
+        """Rebuild the GeoJSON geometry dict of a zone."""
+        if index in self._unpacked:
+            return self._unpacked[index]
+        geometry_type = self._geometry_types[index]
+        rings = self.rings(index)
+        if geometry_type == "Point" and rings:
+            return {"type": "Point", "coordinates": rings[0][0].tolist()}
+        if geometry_type is None and not rings:
+            return {}
+        return {"type": geometry_type, "coordinates": [ring.tolist() for ring in rings]}
@@ -5,14 +5,19 @@ Knowledge graph builder for extracting entities and relationships from geospatia
 import os
 import logging
 import json
-from typing import List, Dict, Any, Optional, Union, Tuple
+import argparse
+from typing import List, Dict, Any, Optional, Union, Tuple, Iterable, Iterator, Callable, Awaitable
 from datetime import datetime, timezone
 import asyncio
 import re
+import hashlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 
 from dotenv import load_dotenv
 from graphiti_core.nodes import EpisodeType
+from graphiti_core.errors import NodeNotFoundError
 
 # Load environment variables
 load_dotenv()
@@ -22,18 +27,52 @@ logger = logging.getLogger(__name__)
 
 # Import graph utilities
 try:
-    from .graph_utils import GraphitiClient
+    from .graph_utils import GraphitiClient, get_graph_client
+    from .rate_limiter import AdaptiveRateLimiter, is_rate_limit_error, backoff_delay
+    from .resilience import CircuitOpenError
+    from .ingest_state import IngestManifest, IngestJournal
+    from .geojson_stream import iter_feature_collection
+    from .zone_model import ZoneRecord, InfrastructureRecord, EntryExitRecord, normalize_feature
+    from .geometry_store import GeometryStore
+    from .embedding_cache import venue_vocabulary
 except ImportError:
     # For direct execution or testing
     try:
         import graph_utils
-        GraphitiClient = graph_utils.GraphitiClient
+        import rate_limiter
+        import resilience
+        import ingest_state
+        import geojson_stream
+        import zone_model
+        import geometry_store
+        import embedding_cache
     except ImportError:
         import sys
         import os
         sys.path.append(os.path.dirname(os.path.abspath(__file__)))
         import graph_utils
-        GraphitiClient = graph_utils.GraphitiClient
+        import rate_limiter
+        import resilience
+        import ingest_state
+        import geojson_stream
+        import zone_model
+        import geometry_store
+        import embedding_cache
+    GraphitiClient = graph_utils.GraphitiClient
+    get_graph_client = graph_utils.get_graph_client
+    AdaptiveRateLimiter = rate_limiter.AdaptiveRateLimiter
+    is_rate_limit_error = rate_limiter.is_rate_limit_error
+    backoff_delay = rate_limiter.backoff_delay
+    CircuitOpenError = resilience.CircuitOpenError
+    IngestManifest = ingest_state.IngestManifest
+    IngestJournal = ingest_state.IngestJournal
+    iter_feature_collection = geojson_stream.iter_feature_collection
+    ZoneRecord = zone_model.ZoneRecord
+    InfrastructureRecord = zone_model.InfrastructureRecord
+    EntryExitRecord = zone_model.EntryExitRecord
+    normalize_feature = zone_model.normalize_feature
+    GeometryStore = geometry_store.GeometryStore
+    venue_vocabulary = embedding_cache.venue_vocabulary
 
 # Import enhanced location schema (from same directory)
 SCHEMA_AVAILABLE = False
@@ -78,6 +117,17 @@ except ImportError:
         AccessLevel = DummySchema
         IncidentType = DummySchema
 
+# Ingestion tuning (overridable via environment)
+INGEST_MAX_WORKERS = int(os.getenv("INGEST_MAX_WORKERS", "4"))
+INGEST_RATE_LIMIT = float(os.getenv("INGEST_RATE_LIMIT", "2.0"))  # Episodes started per second
+INGEST_MAX_RETRIES = int(os.getenv("INGEST_MAX_RETRIES", "3"))
+INGEST_BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", "1"))  # Episodes per bulk submission
+INGEST_BREAKER_MAX_WAIT = float(os.getenv("INGEST_BREAKER_MAX_WAIT", "300"))  # Seconds per submission
+
+# Chunk building (CPU bound; >1 worker shards features across a process pool)
+CHUNK_BUILD_WORKERS = int(os.getenv("CHUNK_BUILD_WORKERS", "1"))
+CHUNK_BUILD_SHARD_SIZE = int(os.getenv("CHUNK_BUILD_SHARD_SIZE", "256"))
+
 
 @dataclass
 class GeoChunk:
@@ -86,21 +136,161 @@ class GeoChunk:
     zone_name: str
     zone_type: str
     content: str  # JSON representation of the zone
-    geometry: Dict[str, Any]  # GeoJSON geometry
-    properties: Dict[str, Any]  # Zone properties
-    infrastructure_points: List[Dict[str, Any]]
-    entry_exit_points: List[Dict[str, Any]]
+    geometry_store: GeometryStore  # Venue-wide packed geometry
+    geometry_index: int  # Position of this zone in the geometry store
+    zone: ZoneRecord  # Normalized zone properties
     metadata: Dict[str, Any]
     index: int = 0
+    
+    @property
+    def geometry(self) -> Dict[str, Any]:
+        """GeoJSON geometry (rebuilt from the geometry store on demand)."""
+        return self.geometry_store.geometry(self.geometry_index)
+    
+    @property
+    def bounding_box(self) -> Optional[Dict[str, float]]:
+        return self.geometry_store.bounding_box(self.geometry_index)
+    
+    @property
+    def infrastructure_points(self) -> List[InfrastructureRecord]:
+        return self.zone.infrastructure_points
+    
+    @property
+    def entry_exit_points(self) -> List[EntryExitRecord]:
+        return self.zone.entry_exit_points
+    
+    @property
+    def properties(self) -> Dict[str, Any]:
+        """Zone properties as a plain dict (built on demand)."""
+        return self.zone.to_dict()
+
+
+def _or_default(value: Any, default: Any) -> Any:
+    """Substitute a default for missing (None) values."""
+    return default if value is None else value
+
+
+def _iter_batches(items: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    """Yield consecutive batches of at most batch_size items."""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def compute_chunk_hash(chunk: GeoChunk) -> str:
+    """
+    Hash the normalized content of a geo chunk.
+    
+    Only what ends up in the graph is hashed (zone identity, rendered content
+    and geometry); run-specific metadata such as creation dates is ignored.
+    """
+    normalized_content = "\n".join(line.rstrip() for line in chunk.content.strip().splitlines())
+    payload = json.dumps(
+        {
+            "zone_id": chunk.zone_id,
+            "zone_name": chunk.zone_name,
+            "zone_type": str(chunk.zone_type),
+            "content": normalized_content,
+            "geometry": chunk.geometry
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _build_geochunk_shard(shard: Tuple[int, List[Any], Dict[str, Any], str]) -> List[GeoChunk]:
+    """
+    Process pool task: build the geo chunks of a contiguous run of features.
+    
+    The chunks share a shard-local geometry store that the parent merges into
+    the venue store.
+    """
+    start_index, features, metadata, creation_date = shard
+    store = GeometryStore()
+    return [
+        GraphBuilder._build_geochunk(start_index + offset, feature, metadata, creation_date, store)
+        for offset, feature in enumerate(features)
+    ]
+
+
+class StreamedLocationData:
+    """
+    FeatureCollection read lazily from disk.
+    
+    `features` is a single-pass iterator of validated features (EnhancedGeometry
+    objects, or raw dicts when validation is off). Top-level members such as
+    `metadata` become available as they are read; members that follow the
+    features array in the file are only populated once iteration finishes.
+    """
+    
+    def __init__(self, file_path: str, validate: bool = True, quarantine_path: Optional[str] = None):
+        self.file_path = file_path
+        self.validate = validate
+        self.quarantine_path = quarantine_path
+        self.top_level: Dict[str, Any] = {}
+        self.quarantined: List[Dict[str, Any]] = []
+        self.features_loaded = 0
+        self.features = self._iter_features()
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return self.top_level.get("metadata", {})
+    
+    def _quarantine(self, index: int, feature: Any, error: Exception):
+        """Set a rejected feature aside without failing the rest of the file."""
+        properties = feature.get("properties", {}) if isinstance(feature, dict) else {}
+        zone_id = properties.get("id") if isinstance(properties, dict) else None
+        entry = {"index": index, "zone_id": zone_id, "error": str(error)}
+        self.quarantined.append(entry)
+        logger.warning(f"Quarantined feature {index} ({zone_id or 'no id'}) from {self.file_path}: {error}")
+        
+        if self.quarantine_path:
+            with open(self.quarantine_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({**entry, "feature": feature}, default=str) + "\n")
+    
+    def _iter_features(self) -> Iterator[Any]:
+        with open(self.file_path, 'r', encoding='utf-8') as f:
+            for index, feature in enumerate(iter_feature_collection(f, self.top_level)):
+                if not isinstance(feature, dict):
+                    self._quarantine(index, feature, ValueError("feature is not a JSON object"))
+                    continue
+                
+                if self.validate:
+                    try:
+                        feature = EnhancedGeometry(**feature)
+                    except Exception as e:
+                        self._quarantine(index, feature, e)
+                        continue
+                
+                self.features_loaded += 1
+                yield feature
+        
+        logger.info(
+            f"Streamed {self.features_loaded} zones from {self.file_path} "
+            f"({len(self.quarantined)} quarantined, validation {'on' if self.validate else 'off'})"
+        )
 
 
 class GraphBuilder:
     """Builds knowledge graph from geospatial document chunks."""
     
-    def __init__(self):
-        """Initialize graph builder."""
-        self.graph_client = GraphitiClient()
+    def __init__(self, graph_client: Optional[GraphitiClient] = None):
+        """
+        Initialize graph builder.
+        
+        Args:
+            graph_client: Graph client to ingest through (default: the shared client)
+        """
+        self.graph_client = graph_client or get_graph_client()
         self._initialized = False
+        self.geometry_store: Optional[GeometryStore] = None  # Geometry of the last chunked venue
     
     async def initialize(self):
         """Initialize graph client."""
@@ -139,13 +329,63 @@ class GraphBuilder:
             logger.error(f"Failed to load GeoJSON from {file_path}: {e}")
             raise
     
-    def create_geochunks_from_geojson(self, enhanced_data: Union[Dict[str, Any], Any]) -> List[GeoChunk]:
+    def stream_geojson_from_file(
+        self,
+        file_path: str,
+        validate: bool = True,
+        quarantine_path: Optional[str] = None
+    ) -> "StreamedLocationData":
+        """
+        Lazily load GeoJSON from file, validating each feature on its own.
+        
+        Features are parsed incrementally and yielded one at a time, so peak
+        memory does not grow with the size of the venue. Features that fail
+        validation are quarantined individually instead of failing the file.
+        
+        Args:
+            file_path: Path of the GeoJSON FeatureCollection
+            validate: Validate each feature against the enhanced schema (if available)
+            quarantine_path: Optional JSONL file receiving rejected features
+        
+        Returns:
+            Streamed location data accepted by create_geochunks_from_geojson
+        """
+        return StreamedLocationData(file_path, validate=validate and SCHEMA_AVAILABLE, quarantine_path=quarantine_path)
+    
+    def create_geochunks_from_geojson(
+        self,
+        enhanced_data: Union[Dict[str, Any], Any],
+        workers: Optional[int] = None
+    ) -> List[GeoChunk]:
         """
         Create hierarchical geo chunks from enhanced GeoJSON data.
         Each chunk represents a zone with its infrastructure context.
         """
-        geo_chunks = []
+        geo_chunks = list(self.iter_geochunks_from_geojson(enhanced_data, workers=workers))
+        logger.info(f"Created {len(geo_chunks)} geo chunks from GeoJSON data")
+        return geo_chunks
+    
+    def iter_geochunks_from_geojson(
+        self,
+        enhanced_data: Union[Dict[str, Any], Any],
+        workers: Optional[int] = None,
+        shard_size: Optional[int] = None
+    ) -> Iterator[GeoChunk]:
+        """
+        Lazily create geo chunks from enhanced GeoJSON data, one per feature.
+        
+        With more than one worker, features are sharded across a process pool
+        and the chunks are yielded in their original order. Every chunk of a
+        call shares one creation date, so both paths produce identical output.
+        
+        The geometry of every chunk of a call is packed into one venue-wide
+        GeometryStore, also kept as self.geometry_store.
         
+        Args:
+            enhanced_data: Validated, raw or streamed GeoJSON data
+            workers: Number of worker processes; 1 builds chunks in-process (default: CHUNK_BUILD_WORKERS)
+            shard_size: Features per task sent to a worker (default: CHUNK_BUILD_SHARD_SIZE)
+        """
         # Handle both validated and raw data formats
         if hasattr(enhanced_data, 'features'):
             features = enhanced_data.features
@@ -154,194 +394,218 @@ class GraphBuilder:
             features = enhanced_data.get('features', [])
             metadata = enhanced_data.get('metadata', {})
         
-        for index, feature in enumerate(features):
-            # Extract zone properties - handle both dict and object formats
-            if hasattr(feature, 'properties'):
-                properties = feature.properties
-                geometry = feature.geometry
-            else:
-                properties = feature.get('properties', {})
-                geometry = feature.get('geometry', {})
-            
-            # Create comprehensive content for the zone
-            zone_content = self._create_zone_content(feature, metadata)
-            
-            # Handle properties access for both dict and object formats
-            def safe_get(obj, attr, default=None):
-                if hasattr(obj, attr):
-                    return getattr(obj, attr)
-                elif isinstance(obj, dict):
-                    return obj.get(attr, default)
-                return default
-            
-            # Create GeoChunk
-            geo_chunk = GeoChunk(
-                zone_id=safe_get(properties, 'id', f'zone_{index}'),
-                zone_name=safe_get(properties, 'name', f'Zone {index}'),
-                zone_type=safe_get(properties, 'zone_type', 'unknown'),
-                content=zone_content,
-                geometry=geometry.dict() if hasattr(geometry, 'dict') else geometry,
-                properties=properties.dict() if hasattr(properties, 'dict') else properties,
-                infrastructure_points=safe_get(properties, 'infrastructure_points', []),
-                entry_exit_points=safe_get(properties, 'entry_exit_points', []),
-                metadata={
-                    "index": index,
-                    "security_level": safe_get(properties, 'security_level'),
-                    "access_level": safe_get(properties, 'access_level'),
-                    "assigned_agents": safe_get(properties, 'assigned_agents', []),
-                    "response_team_coverage": safe_get(properties, 'response_team_coverage', []),
-                    "creation_date": datetime.now().isoformat()
-                },
-                index=index
-            )
-            
-            geo_chunks.append(geo_chunk)
+        creation_date = datetime.now().isoformat()
+        workers = max(1, workers or CHUNK_BUILD_WORKERS)
+        store = self.geometry_store = GeometryStore()
+        
+        if workers == 1:
+            for index, feature in enumerate(features):
+                yield self._build_geochunk(index, feature, metadata, creation_date, store)
+            return
+        
+        def adopt(shard_chunks: List[GeoChunk]) -> List[GeoChunk]:
+            """Move the geometry of a finished shard into the venue store."""
+            if shard_chunks:
+                offset = store.merge(shard_chunks[0].geometry_store)
+                for chunk in shard_chunks:
+                    chunk.geometry_store = store
+                    chunk.geometry_index += offset
+            return shard_chunks
+        
+        shards = (
+            (batch[0][0], [feature for _, feature in batch], metadata, creation_date)
+            for batch in _iter_batches(enumerate(features), max(1, shard_size or CHUNK_BUILD_SHARD_SIZE))
+        )
         
-        logger.info(f"Created {len(geo_chunks)} geo chunks from GeoJSON data")
-        return geo_chunks
+        # Keep a bounded window of shards in flight so streamed input stays lazy
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for shard in shards:
+                pending.append(executor.submit(_build_geochunk_shard, shard))
+                if len(pending) >= workers * 2:
+                    yield from adopt(pending.popleft().result())
+            while pending:
+                yield from adopt(pending.popleft().result())
     
-    def _create_zone_content(self, feature: Any, global_metadata: Dict[str, Any]) -> str:
+    @staticmethod
+    def _build_geochunk(
+        index: int,
+        feature: Any,
+        metadata: Dict[str, Any],
+        creation_date: str,
+        store: GeometryStore
+    ) -> GeoChunk:
+        """Build the geo chunk of a single feature, packing its geometry into store."""
+        # Normalize once; everything below reads plain attributes
+        zone, geometry = normalize_feature(feature)
+        zone_id = _or_default(zone.id, f'zone_{index}')
+        geometry_index = store.add(zone_id, geometry)
+        
+        # Create comprehensive content for the zone
+        zone_content = GraphBuilder._create_zone_content(zone, store, geometry_index, metadata)
+        
+        # Create GeoChunk
+        return GeoChunk(
+            zone_id=zone_id,
+            zone_name=_or_default(zone.name, f'Zone {index}'),
+            zone_type=_or_default(zone.zone_type, 'unknown'),
+            content=zone_content,
+            geometry_store=store,
+            geometry_index=geometry_index,
+            zone=zone,
+            metadata={
+                "index": index,
+                "security_level": zone.security_level,
+                "access_level": zone.access_level,
+                "assigned_agents": zone.assigned_agents,
+                "response_team_coverage": zone.response_team_coverage,
+                "creation_date": creation_date
+            },
+            index=index
+        )
+    
+    @staticmethod
+    def _create_zone_content(
+        zone: ZoneRecord,
+        store: GeometryStore,
+        geometry_index: int,
+        global_metadata: Dict[str, Any]
+    ) -> str:
         """Create comprehensive textual content for a zone chunk."""
-        # Handle both dict and object formats
-        if hasattr(feature, 'properties'):
-            properties = feature.properties
-            geometry = feature.geometry
-        else:
-            properties = feature.get('properties', {})
-            geometry = feature.get('geometry', {})
-        
-        # Helper function for safe access
-        def safe_get(obj, attr, default=None):
-            if hasattr(obj, attr):
-                return getattr(obj, attr)
-            elif isinstance(obj, dict):
-                return obj.get(attr, default)
-            return default
-        
         content_parts = []
         
         # Zone header
-        content_parts.append(f"=== ZONE: {safe_get(properties, 'name', 'Unknown')} ({safe_get(properties, 'id', 'Unknown')}) ===")
-        content_parts.append(f"Type: {safe_get(properties, 'zone_type', 'unknown')}")
-        content_parts.append(f"Security Level: {safe_get(properties, 'security_level', 'unknown')}")
-        content_parts.append(f"Access Level: {safe_get(properties, 'access_level', 'unknown')}")
+        content_parts.append(f"=== ZONE: {_or_default(zone.name, 'Unknown')} ({_or_default(zone.id, 'Unknown')}) ===")
+        content_parts.append(f"Type: {_or_default(zone.zone_type, 'unknown')}")
+        content_parts.append(f"Security Level: {zone.security_level}")
+        content_parts.append(f"Access Level: {zone.access_level}")
         
         # Capacity and population
-        population_capacity = safe_get(properties, 'population_capacity')
-        if population_capacity:
-            content_parts.append(f"Capacity: {population_capacity} people")
+        if zone.population_capacity:
+            content_parts.append(f"Capacity: {zone.population_capacity} people")
         
-        current_population = safe_get(properties, 'current_population')
-        if current_population is not None:
-            content_parts.append(f"Current Population: {current_population} people")
+        if zone.current_population is not None:
+            content_parts.append(f"Current Population: {zone.current_population} people")
         
         # Emergency information
-        evacuation_time = safe_get(properties, 'evacuation_time_minutes')
-        if evacuation_time:
-            content_parts.append(f"Evacuation Time: {evacuation_time} minutes")
+        if zone.evacuation_time_minutes:
+            content_parts.append(f"Evacuation Time: {zone.evacuation_time_minutes} minutes")
         
-        emergency_protocols = safe_get(properties, 'emergency_protocols', [])
-        if emergency_protocols:
-            content_parts.append(f"Emergency Protocols: {', '.join(emergency_protocols)}")
+        if zone.emergency_protocols:
+            content_parts.append(f"Emergency Protocols: {', '.join(zone.emergency_protocols)}")
         
         # Agent assignments (HIGH PRIORITY)
-        assigned_agents = safe_get(properties, 'assigned_agents', [])
-        if assigned_agents:
+        if zone.assigned_agents:
             content_parts.append(f"\n--- ASSIGNED AGENTS ---")
-            for agent in assigned_agents:
+            for agent in zone.assigned_agents:
                 content_parts.append(f"• Agent: {agent}")
         
-        response_teams = safe_get(properties, 'response_team_coverage', [])
-        if response_teams:
-            content_parts.append(f"Response Teams: {', '.join(response_teams)}")
+        if zone.response_team_coverage:
+            content_parts.append(f"Response Teams: {', '.join(zone.response_team_coverage)}")
         
         # Infrastructure points
-        infrastructure_points = safe_get(properties, 'infrastructure_points', [])
-        if infrastructure_points:
-            content_parts.append(f"\n--- INFRASTRUCTURE ({len(infrastructure_points)} points) ---")
-            for infra in infrastructure_points:
-                content_parts.append(f"• {safe_get(infra, 'name', 'Unknown')} ({safe_get(infra, 'type', 'unknown')})")
-                content_parts.append(f"  - ID: {safe_get(infra, 'id', 'Unknown')}")
+        if zone.infrastructure_points:
+            content_parts.append(f"\n--- INFRASTRUCTURE ({len(zone.infrastructure_points)} points) ---")
+            for infra in zone.infrastructure_points:
+                content_parts.append(f"• {_or_default(infra.name, 'Unknown')} ({infra.type})")
+                content_parts.append(f"  - ID: {_or_default(infra.id, 'Unknown')}")
                 
-                # Handle coordinates - may be Point object or dict
-                coords = safe_get(infra, 'coordinates')
-                if coords:
-                    coord_values = safe_get(coords, 'coordinates', coords)
-                    content_parts.append(f"  - Coordinates: {coord_values}")
+                if infra.coordinates:
+                    content_parts.append(f"  - Coordinates: {infra.coordinates}")
                 
-                content_parts.append(f"  - Operational: {safe_get(infra, 'operational_status', 'Unknown')}")
-                content_parts.append(f"  - Access: {safe_get(infra, 'access_level', 'Unknown')}")
-                content_parts.append(f"  - Emergency Priority: {safe_get(infra, 'emergency_priority', 'Unknown')}")
+                content_parts.append(f"  - Operational: {infra.operational_status}")
+                content_parts.append(f"  - Access: {infra.access_level}")
+                content_parts.append(f"  - Emergency Priority: {infra.emergency_priority}")
                 
-                resources = safe_get(infra, 'resources_available', [])
-                if resources:
-                    content_parts.append(f"  - Resources: {', '.join(resources)}")
+                if infra.resources_available:
+                    content_parts.append(f"  - Resources: {', '.join(infra.resources_available)}")
                 
-                incidents = safe_get(infra, 'supported_incidents', [])
-                if incidents:
-                    # Handle both enum objects and strings
-                    incident_strs = [str(inc) for inc in incidents]
-                    content_parts.append(f"  - Handles Incidents: {', '.join(incident_strs)}")
+                if infra.supported_incidents:
+                    content_parts.append(f"  - Handles Incidents: {', '.join(map(str, infra.supported_incidents))}")
         
         # Entry/Exit points
-        entry_exit_points = safe_get(properties, 'entry_exit_points', [])
-        if entry_exit_points:
-            content_parts.append(f"\n--- ENTRY/EXIT POINTS ({len(entry_exit_points)} points) ---")
-            for point in entry_exit_points:
-                content_parts.append(f"• {safe_get(point, 'name', 'Unknown')} ({safe_get(point, 'id', 'Unknown')})")
-                content_parts.append(f"  - Entry: {safe_get(point, 'is_entry', False)}, Exit: {safe_get(point, 'is_exit', False)}")
-                content_parts.append(f"  - Status: {'Open' if safe_get(point, 'current_status', False) else 'Closed'}")
+        if zone.entry_exit_points:
+            content_parts.append(f"\n--- ENTRY/EXIT POINTS ({len(zone.entry_exit_points)} points) ---")
+            for point in zone.entry_exit_points:
+                content_parts.append(f"• {_or_default(point.name, 'Unknown')} ({_or_default(point.id, 'Unknown')})")
+                content_parts.append(f"  - Entry: {point.is_entry}, Exit: {point.is_exit}")
+                content_parts.append(f"  - Status: {'Open' if point.current_status else 'Closed'}")
         
         # Communication and resources
-        communication_channels = safe_get(properties, 'communication_channels', [])
-        if communication_channels:
-            content_parts.append(f"\nCommunication: {', '.join(communication_channels)}")
+        if zone.communication_channels:
+            content_parts.append(f"\nCommunication: {', '.join(zone.communication_channels)}")
         
-        resource_requirements = safe_get(properties, 'resource_requirements', {})
-        if resource_requirements:
+        if zone.resource_requirements:
             content_parts.append(f"\nResource Requirements:")
-            for resource, count in resource_requirements.items():
+            for resource, count in zone.resource_requirements.items():
                 content_parts.append(f"• {resource}: {count}")
         
         # Operational status
-        operational_status = safe_get(properties, 'operational_status', True)
-        content_parts.append(f"\nOperational Status: {'Active' if operational_status else 'Inactive'}")
-        
-        last_updated = safe_get(properties, 'last_updated', 'Unknown')
-        content_parts.append(f"Last Updated: {last_updated}")
+        content_parts.append(f"\nOperational Status: {'Active' if zone.operational_status else 'Inactive'}")
+        content_parts.append(f"Last Updated: {_or_default(zone.last_updated, 'Unknown')}")
         
         # Geometry information
-        geometry_coords = safe_get(geometry, 'coordinates') if geometry else None
-        geometry_type = safe_get(geometry, 'type') if geometry else None
+        geometry_type = store.geometry_type(geometry_index)
         
-        if geometry and geometry_coords:
+        if store.has_coordinates(geometry_index):
             content_parts.append(f"\nGeometry: {geometry_type}")
             # Add bounding box or center point for spatial context
-            if geometry_type == "Polygon" and geometry_coords:
-                coords = geometry_coords[0]  # Outer ring
-                lons = [coord[0] for coord in coords]
-                lats = [coord[1] for coord in coords]
-                bbox = {
-                    "min_lon": min(lons), "max_lon": max(lons),
-                    "min_lat": min(lats), "max_lat": max(lats)
-                }
+            bbox = store.bounding_box(geometry_index)
+            if geometry_type == "Polygon" and bbox:
                 content_parts.append(f"Bounding Box: {bbox}")
         
         return "\n".join(content_parts)
 
     async def add_geojson_to_graph(
         self,
-        geo_chunks: List[GeoChunk],
+        geo_chunks: Iterable[GeoChunk],
         source_name: str,
-        source_metadata: Optional[Dict[str, Any]] = None
+        source_metadata: Optional[Dict[str, Any]] = None,
+        max_workers: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        incremental: bool = False,
+        manifest: Optional[IngestManifest] = None,
+        journal: Optional[IngestJournal] = None,
+        resume: bool = False,
+        namespace: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Add GeoJSON chunks to the knowledge graph.
         
+        Chunks are ingested by a pool of concurrent workers. Each submission is
+        throttled by an adaptive token bucket that backs off on provider quota
+        errors, and retried with exponential backoff.
+        
+        In incremental mode, a local manifest of content hashes decides what to
+        submit: unchanged zones are skipped, changed zones replace their previous
+        episode, and zones no longer present in the source (all of them for an
+        empty source) are retired. Superseded episodes that could not be removed
+        stay in the manifest and are retired again on later runs.
+        
+        With a journal, the status of every chunk is appended to a local file as
+        it happens. resume=True continues the last run of the source (unless it
+        completed without errors) and skips the chunks it already completed.
+        
+        A namespace (e.g. one per event) puts the episodes in their own
+        Graphiti group, searchable on its own and dropped with drop_namespace().
+        Manifest and journal state is kept per namespace and source.
+        
         Args:
-            geo_chunks: List of geo chunks
+            geo_chunks: Geo chunks; an iterator (e.g. from iter_geochunks_from_geojson)
+                is consumed lazily, one batch at a time
             source_name: Name of the GeoJSON source
             source_metadata: Additional metadata
+            max_workers: Number of concurrent workers (default: INGEST_MAX_WORKERS)
+            rate_limit: Submissions started per second (default: INGEST_RATE_LIMIT)
+            max_retries: Retries per submission after the first attempt (default: INGEST_MAX_RETRIES)
+            batch_size: Episodes per bulk submission; 1 adds episodes one by one (default: INGEST_BATCH_SIZE)
+            incremental: Only submit added/changed zones and retire removed ones
+            manifest: Ingest manifest to use in incremental mode (default: IngestManifest())
+            journal: Ingest journal recording per-chunk status (required for resume)
+            resume: Skip chunks completed by the last journaled run of this source
+            namespace: Namespace to ingest into (default: the client's active namespace)
         
         Returns:
             Processing results
@@ -349,80 +613,330 @@ class GraphBuilder:
         if not self._initialized:
             await self.initialize()
         
-        if not geo_chunks:
-            return {"episodes_created": 0, "errors": []}
+        if resume and journal is None:
+            journal = IngestJournal()
         
-        logger.info(f"Adding {len(geo_chunks)} geo chunks to knowledge graph from: {source_name}")
+        # Manifest/journal key: the same source may be ingested into several namespaces
+        state_key = f"{namespace}/{source_name}" if namespace else source_name
+        
+        previous: Dict[str, Dict[str, Any]] = {}
+        if incremental:
+            manifest = manifest or IngestManifest()
+            previous = manifest.get_source(state_key)
+        
+        journaled = journal.start_run(state_key, resume=resume) if journal is not None else {}
+        
+        max_workers = max(1, max_workers or INGEST_MAX_WORKERS)
+        max_retries = INGEST_MAX_RETRIES if max_retries is None else max_retries
+        batch_size = max(1, batch_size or INGEST_BATCH_SIZE)
+        limiter = AdaptiveRateLimiter(rate=rate_limit or INGEST_RATE_LIMIT)
+        
+        logger.info(
+            f"Adding geo chunks to knowledge graph from: {source_name} "
+            f"({max_workers} workers, batch size {batch_size}, {limiter.rate:.1f} submissions/sec)"
+        )
+        
+        # Filled in as chunks stream through pending_chunks()
+        chunk_hashes: Dict[str, str] = {}
+        completed: Dict[str, Dict[str, Any]] = {}
+        total_chunks = 0
+        unchanged_chunks = 0
+        
+        def pending_chunks() -> Iterator[GeoChunk]:
+            """Hash chunks as they arrive and yield those that still need submitting."""
+            nonlocal total_chunks, unchanged_chunks
+            for chunk in geo_chunks:
+                total_chunks += 1
+                content_hash = chunk_hashes[chunk.zone_id] = compute_chunk_hash(chunk)
+                
+                record = journaled.get(chunk.zone_id)
+                if record is not None and record.get("content_hash") == content_hash:
+                    completed[chunk.zone_id] = record
+                    # A hard stop can lose the manifest update of a completed chunk; the journal has it
+                    if incremental and previous.get(chunk.zone_id, {}).get("content_hash") != content_hash:
+                        # The episode it superseded is retired with the other pending retirements
+                        superseded_uuid = previous.get(chunk.zone_id, {}).get("episode_uuid")
+                        if superseded_uuid and superseded_uuid != record.get("episode_uuid"):
+                            manifest.add_pending_retirement(state_key, chunk.zone_id, superseded_uuid)
+                        manifest.record(state_key, chunk.zone_id, content_hash,
+                                        record.get("episode_id"), record.get("episode_uuid"))
+                    continue
+                
+                if incremental and previous.get(chunk.zone_id, {}).get("content_hash") == content_hash:
+                    unchanged_chunks += 1
+                    continue
+                yield chunk
         
         episodes_created = 0
+        episodes_retired = 0
         errors = []
         
-        # Process chunks one by one
-        for i, chunk in enumerate(geo_chunks):
+        async def retire_episode(zone_id: str, episode_uuid: Optional[str]):
+            nonlocal episodes_retired
+            if not episode_uuid:
+                return
+            
+            async def remove():
+                try:
+                    await self.graph_client.remove_episode(episode_uuid)
+                except NodeNotFoundError:
+                    pass  # Already gone (e.g. removed by an attempt that timed out)
+            
+            await self._run_with_retry(remove, f"retirement of {zone_id}", limiter, max_retries)
+            episodes_retired += 1
+        
+        def journal_record(chunk: GeoChunk, status: str, episode: Dict[str, Any],
+                           episode_uuid: Optional[str] = None, error: Optional[str] = None):
+            if journal is not None:
+                journal.record(state_key, chunk.zone_id, status, chunk_hashes[chunk.zone_id],
+                               episode["episode_id"], episode_uuid, error)
+        
+        async def on_chunk_added(chunk: GeoChunk, episode: Dict[str, Any], episode_uuid: Optional[str]):
+            nonlocal episodes_created
+            episodes_created += 1
+            if incremental:
+                # The new episode is in place, so the superseded one can go
+                superseded_uuid = previous.get(chunk.zone_id, {}).get("episode_uuid")
+                try:
+                    await retire_episode(chunk.zone_id, superseded_uuid)
+                except Exception as e:
+                    # Keep the old uuid so a later run can still retire it
+                    manifest.add_pending_retirement(state_key, chunk.zone_id, superseded_uuid)
+                    error_msg = f"Failed to retire previous episode of {chunk.zone_id} (will retry): {str(e)}"
+                    logger.error(error_msg)
+                    errors.append(error_msg)
+                manifest.record(state_key, chunk.zone_id, chunk_hashes[chunk.zone_id], episode["episode_id"], episode_uuid)
+            journal_record(chunk, IngestJournal.DONE, episode, episode_uuid)
+        
+        async def add_single(chunk: GeoChunk, episode: Dict[str, Any]):
             try:
-                # Create episode ID
-                episode_id = f"{source_name}_{chunk.zone_id}_{datetime.now().timestamp()}"
-                
-                # Prepare episode content with size limits
-                episode_content = self._prepare_geo_episode_content(
-                    chunk,
-                    source_name,
-                    source_metadata
+                episode_uuid = await self._run_with_retry(
+                    lambda: self.graph_client.add_episode(**episode),
+                    episode["episode_id"],
+                    limiter,
+                    max_retries
                 )
+            except Exception as e:
+                error_msg = f"Failed to add geo chunk {chunk.zone_id} to graph: {str(e)}"
+                logger.error(error_msg)
+                errors.append(error_msg)
+                journal_record(chunk, IngestJournal.FAILED, episode, error=str(e))
+                return
+            await on_chunk_added(chunk, episode, episode_uuid)
+            logger.info(f"✓ Added episode {episode['episode_id']} to knowledge graph ({episodes_created} so far)")
+        
+        # Workers pull batches from a shared iterator until it is exhausted
+        batch_iter = _iter_batches(pending_chunks(), batch_size)
+        
+        async def worker():
+            for batch in batch_iter:
+                episodes = [
+                    self._build_geo_episode(chunk, source_name, source_metadata, chunk_hashes[chunk.zone_id], namespace)
+                    for chunk in batch
+                ]
+                for chunk, episode in zip(batch, episodes):
+                    journal_record(chunk, IngestJournal.STARTED, episode)
                 
-                # Create source description
-                source_description = f"Zone: {chunk.zone_name} ({chunk.zone_id}) from {source_name}"
+                if len(episodes) == 1:
+                    await add_single(batch[0], episodes[0])
+                    continue
                 
-                # Enhanced metadata for graph
-                graph_metadata = {
-                    "source_name": source_name,
-                    "zone_id": chunk.zone_id,
-                    "zone_name": chunk.zone_name,
-                    "zone_type": chunk.zone_type,
-                    "security_level": chunk.metadata.get("security_level"),
-                    "assigned_agents": chunk.metadata.get("assigned_agents", []),
-                    "infrastructure_count": len(chunk.infrastructure_points),
-                    "entry_exit_count": len(chunk.entry_exit_points),
-                    "original_length": len(chunk.content),
-                    "processed_length": len(episode_content)
-                }
-
-                # Print details being added to the graph
-                # print(f"Adding episode {episode_id} to knowledge graph from: {source_name}")
-                # print(f"Episode content: {episode_content}")
-                # print(f"Source description: {source_description}")
-                # print(f"Graph metadata: {graph_metadata}")
+                try:
+                    batch_result = await self._run_with_retry(
+                        lambda: self.graph_client.add_episodes(episodes, batch_size=len(episodes)),
+                        f"batch of {len(episodes)} starting at {batch[0].zone_id}",
+                        limiter,
+                        max_retries
+                    )
+                except Exception as e:
+                    for chunk, episode in zip(batch, episodes):
+                        error_msg = f"Failed to add geo chunk {chunk.zone_id} to graph: {str(e)}"
+                        logger.error(error_msg)
+                        errors.append(error_msg)
+                        journal_record(chunk, IngestJournal.FAILED, episode, error=str(e))
+                    continue
                 
-                # Add episode to graph using EpisodeType.text
-                await self.graph_client.add_episode(
-                    episode_id=episode_id,
-                    content=episode_content,
-                    source=source_description,
-                    timestamp=datetime.now(timezone.utc),
-                    metadata=graph_metadata,
-                )
+                # A quota error cut the bulk call short; slow everyone down before retrying
+                if batch_result.get("rate_limited"):
+                    limiter.on_rate_limited()
+                episode_uuids = batch_result.get("episode_uuids", {})
+                for chunk, episode in zip(batch, episodes):
+                    if episode["episode_id"] in episode_uuids:
+                        await on_chunk_added(chunk, episode, episode_uuids[episode["episode_id"]])
+                    else:
+                        # Episodes the bulk call could not add get their own backoff and rate limiting
+                        await add_single(chunk, episode)
                 
-                episodes_created += 1
-                logger.info(f"✓ Added episode {episode_id} to knowledge graph ({episodes_created}/{len(geo_chunks)})")
+                logger.info(f"✓ Added {len(episodes)} episode(s) to knowledge graph ({episodes_created} so far)")
+        
+        try:
+            await asyncio.gather(*(worker() for _ in range(max_workers)))
+            
+            removed_zone_ids = [zone_id for zone_id in previous if zone_id not in chunk_hashes]
+            if incremental:
+                logger.info(
+                    f"Incremental ingest of {source_name}: "
+                    f"{total_chunks - len(completed) - unchanged_chunks} added/changed, "
+                    f"{unchanged_chunks} unchanged, {len(removed_zone_ids)} removed"
+                )
+            
+            # Retire zones that disappeared from the source
+            for zone_id in removed_zone_ids:
+                try:
+                    await retire_episode(zone_id, previous[zone_id].get("episode_uuid"))
+                    manifest.remove(state_key, zone_id)
+                    logger.info(f"✓ Retired removed zone {zone_id}")
+                except Exception as e:
+                    error_msg = f"Failed to retire removed zone {zone_id}: {str(e)}"
+                    logger.error(error_msg)
+                    errors.append(error_msg)
+            
+            # Superseded episodes whose retirement failed in this or an earlier run
+            for pending in (manifest.pending_retirements(state_key) if incremental else []):
+                try:
+                    await retire_episode(pending["zone_id"], pending["episode_uuid"])
+                    manifest.retirement_done(state_key, pending["episode_uuid"])
+                    logger.info(f"✓ Retired superseded episode {pending['episode_uuid']} of {pending['zone_id']}")
+                except Exception as e:
+                    error_msg = f"Failed to retire superseded episode of {pending['zone_id']}: {str(e)}"
+                    logger.error(error_msg)
+                    errors.append(error_msg)
+            
+            result = {
+                "episodes_created": episodes_created,
+                "total_chunks": total_chunks,
+                "errors": errors
+            }
+            if incremental:
+                result["unchanged_chunks"] = unchanged_chunks
+                result["episodes_retired"] = episodes_retired
+            if journal is not None:
+                result["resumed_chunks"] = len(completed)
+                journal.complete_run(state_key, result)
+        finally:
+            if incremental:
+                manifest.save()
+            if journal is not None:
+                journal.close()
+        
+        logger.info(f"GeoJSON graph building complete: {episodes_created} episodes created, {len(errors)} errors")
+        return result
+    
+    async def _run_with_retry(
+        self,
+        operation: Callable[[], Awaitable[Any]],
+        label: str,
+        limiter: AdaptiveRateLimiter,
+        max_retries: int,
+        max_breaker_wait: Optional[float] = None
+    ) -> Any:
+        """
+        Run a graph submission, retrying transient failures with backoff.
+        
+        While a dependency's circuit breaker is open the submission waits for
+        the breaker's next probe and slows the limiter down, without spending
+        a retry: ingestion shares the breaker with search, and an outage that
+        outlasts the retry backoff would otherwise fail every chunk. Once the
+        waits add up to max_breaker_wait the CircuitOpenError is raised, so the
+        chunk is journaled as failed and left for --resume.
+        
+        Args:
+            operation: Factory returning a fresh awaitable for each attempt
+            label: Description of the submission used in log messages
+            limiter: Rate limiter gating each attempt
+            max_retries: Retries after the first attempt
+            max_breaker_wait: Seconds to wait on open breakers in total (default: INGEST_BREAKER_MAX_WAIT)
+        
+        Returns:
+            Result of the successful attempt
+        """
+        max_breaker_wait = INGEST_BREAKER_MAX_WAIT if max_breaker_wait is None else max_breaker_wait
+        breaker_wait = 0.0
+        attempt = 0
+        while True:
+            await limiter.acquire()
+            try:
+                result = await operation()
+                limiter.on_success()
+                return result
+            
+            except CircuitOpenError as e:
+                delay = e.retry_after + backoff_delay(0)
+                if breaker_wait + delay > max_breaker_wait:
+                    logger.warning(f"Giving up on {label} after waiting {breaker_wait:.1f}s for an open breaker")
+                    raise
+                breaker_wait += delay
                 
-                # Small delay between episodes
-                if i < len(geo_chunks) - 1:
-                    await asyncio.sleep(0.5)
-                    
+                # No retry_after means another caller holds the probe; pause for the limiter cooldown
+                limiter.on_rate_limited(retry_after=e.retry_after or None)
+                logger.warning(f"{e}, retrying {label} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+            
             except Exception as e:
-                error_msg = f"Failed to add geo chunk {chunk.zone_id} to graph: {str(e)}"
-                logger.error(error_msg)
-                errors.append(error_msg)
-                continue
+                if attempt >= max_retries:
+                    raise
+                
+                if is_rate_limit_error(e):
+                    limiter.on_rate_limited()
+                
+                delay = backoff_delay(attempt)
+                attempt += 1
+                logger.warning(f"Retrying {label} in {delay:.1f}s (attempt {attempt}/{max_retries}): {e}")
+                await asyncio.sleep(delay)
+    
+    def _build_geo_episode(
+        self,
+        chunk: GeoChunk,
+        source_name: str,
+        source_metadata: Optional[Dict[str, Any]] = None,
+        content_hash: Optional[str] = None,
+        namespace: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the add_episode arguments for a geo chunk.
+        
+        Returns:
+            Episode keyword arguments for GraphitiClient.add_episode / add_episodes
+        """
+        # Episode ID is derived from the zone content so re-runs produce the same ID
+        content_hash = content_hash or compute_chunk_hash(chunk)
+        episode_id = f"{source_name}_{chunk.zone_id}_{content_hash[:12]}"
+        
+        # Prepare episode content with size limits
+        episode_content = self._prepare_geo_episode_content(
+            chunk,
+            source_name,
+            source_metadata
+        )
         
-        result = {
-            "episodes_created": episodes_created,
-            "total_chunks": len(geo_chunks),
-            "errors": errors
+        # Create source description
+        source_description = f"Zone: {chunk.zone_name} ({chunk.zone_id}) from {source_name}"
+        
+        # Enhanced metadata for graph
+        graph_metadata = {
+            "source_name": source_name,
+            "zone_id": chunk.zone_id,
+            "zone_name": chunk.zone_name,
+            "zone_type": chunk.zone_type,
+            "security_level": chunk.metadata.get("security_level"),
+            "assigned_agents": chunk.metadata.get("assigned_agents", []),
+            "infrastructure_count": len(chunk.infrastructure_points),
+            "entry_exit_count": len(chunk.entry_exit_points),
+            "original_length": len(chunk.content),
+            "processed_length": len(episode_content),
+            "content_hash": content_hash
         }
         
-        logger.info(f"GeoJSON graph building complete: {episodes_created} episodes created, {len(errors)} errors")
-        return result
+        episode = {
+            "episode_id": episode_id,
+            "content": episode_content,
+            "source": source_description,
+            "timestamp": datetime.now(timezone.utc),
+            "metadata": graph_metadata
+        }
+        if namespace:
+            episode["namespace"] = namespace
+        return episode
     
     def _prepare_geo_episode_content(
         self,
@@ -474,8 +988,13 @@ class GraphBuilder:
         """
         logger.info(f"Extracting entities from {len(geo_chunks)} geo chunks")
         
-        enriched_chunks = []
+        enriched_chunks = list(self.iter_entities_from_geochunks(geo_chunks))
         
+        logger.info("Geospatial entity extraction complete")
+        return enriched_chunks
+    
+    def iter_entities_from_geochunks(self, geo_chunks: Iterable[GeoChunk]) -> Iterator[GeoChunk]:
+        """Lazily add extracted entities to the metadata of each geo chunk."""
         for chunk in geo_chunks:
             entities = self._extract_geospatial_entities(chunk)
             
@@ -483,26 +1002,15 @@ class GraphBuilder:
             chunk.metadata["entities"] = entities
             chunk.metadata["entity_extraction_date"] = datetime.now().isoformat()
             
-            enriched_chunks.append(chunk)
-        
-        logger.info("Geospatial entity extraction complete")
-        return enriched_chunks
+            yield chunk
     
-    def _safe_get_chunk_property(self, chunk: GeoChunk, attr: str, default=None):
-        """Safely get property from chunk.properties whether it's a Pydantic object or dict."""
-        properties = chunk.properties
-        if hasattr(properties, attr):
-            return getattr(properties, attr)
-        elif isinstance(properties, dict):
-            return properties.get(attr, default)
-        return default
-
     def _extract_geospatial_entities(self, chunk: GeoChunk) -> Dict[str, Any]:
         """Extract comprehensive entities from a geo chunk."""
+        zone = chunk.zone
         entities = {
             # Agent-focused entities (HIGH PRIORITY)
             "agents": self._extract_agent_entities(chunk),
-            "response_teams": self._safe_get_chunk_property(chunk, "response_team_coverage", []),
+            "response_teams": zone.response_team_coverage,
             
             # Infrastructure entities
             "infrastructure": self._extract_infrastructure_entities(chunk),
@@ -510,8 +1018,8 @@ class GraphBuilder:
             
             # Operational entities
             "security_info": self._extract_security_entities(chunk),
-            "emergency_protocols": self._safe_get_chunk_property(chunk, "emergency_protocols", []),
-            "communication_channels": self._safe_get_chunk_property(chunk, "communication_channels", []),
+            "emergency_protocols": zone.emergency_protocols,
+            "communication_channels": zone.communication_channels,
             "resources": self._extract_resource_entities(chunk),
             
             # Geospatial entities
@@ -526,16 +1034,17 @@ class GraphBuilder:
     def _extract_agent_entities(self, chunk: GeoChunk) -> List[Dict[str, Any]]:
         """Extract detailed agent information."""
         agents = []
+        zone = chunk.zone
         
-        for agent_id in self._safe_get_chunk_property(chunk, "assigned_agents", []):
+        for agent_id in zone.assigned_agents:
             # Infer agent type and capabilities from ID
             agent_info = {
                 "id": agent_id,
                 "type": self._infer_agent_type(agent_id),
                 "zone_assignment": chunk.zone_id,
                 "zone_name": chunk.zone_name,
-                "security_clearance": self._safe_get_chunk_property(chunk, "security_level"),
-                "access_level": self._safe_get_chunk_property(chunk, "access_level"),
+                "security_clearance": zone.security_level,
+                "access_level": zone.access_level,
                 "capabilities": self._infer_agent_capabilities(agent_id, chunk)
             }
             agents.append(agent_info)
@@ -562,8 +1071,8 @@ class GraphBuilder:
         capabilities = []
         
         agent_type = self._infer_agent_type(agent_id)
-        zone_type = self._safe_get_chunk_property(chunk, "zone_type")  # Use safe access for zone_type
-        security_level = self._safe_get_chunk_property(chunk, "security_level")
+        zone_type = chunk.zone.zone_type
+        security_level = chunk.zone.security_level
         
         # Base capabilities by agent type
         if agent_type == "security_agent":
@@ -592,142 +1101,89 @@ class GraphBuilder:
 
     def _extract_infrastructure_entities(self, chunk: GeoChunk) -> List[Dict[str, Any]]:
         """Extract infrastructure entities with operational context."""
-        # Helper function for safe access
-        def safe_get(obj, attr, default=None):
-            if hasattr(obj, attr):
-                return getattr(obj, attr)
-            elif isinstance(obj, dict):
-                return obj.get(attr, default)
-            return default
-        
-        infrastructure = []
-        
-        for infra in chunk.infrastructure_points:
-            # Handle coordinates - may be Point object or dict
-            coords = safe_get(infra, 'coordinates')
-            if coords:
-                coord_values = safe_get(coords, 'coordinates', coords)
-            else:
-                coord_values = []
-            
-            infra_entity = {
-                "id": safe_get(infra, "id", "unknown"),
-                "name": safe_get(infra, "name", "Unknown"),
-                "type": safe_get(infra, "type", "unknown"),
-                "coordinates": coord_values,
-                "operational": safe_get(infra, "operational_status", True),
-                "access_level": safe_get(infra, "access_level", "unknown"),
-                "emergency_priority": safe_get(infra, "emergency_priority", 4),
-                "resources": safe_get(infra, "resources_available", []),
-                "supported_incidents": [str(inc) for inc in safe_get(infra, "supported_incidents", [])],  # Convert enums to strings
+        return [
+            {
+                "id": _or_default(infra.id, "unknown"),
+                "name": _or_default(infra.name, "Unknown"),
+                "type": infra.type,
+                "coordinates": infra.coordinates or [],
+                "operational": infra.operational_status,
+                "access_level": infra.access_level,
+                "emergency_priority": infra.emergency_priority,
+                "resources": infra.resources_available,
+                "supported_incidents": list(map(str, infra.supported_incidents)),
                 "parent_zone": chunk.zone_id
             }
-            infrastructure.append(infra_entity)
-        
-        return infrastructure
+            for infra in chunk.infrastructure_points
+        ]
     
     def _extract_entry_exit_entities(self, chunk: GeoChunk) -> List[Dict[str, Any]]:
         """Extract entry/exit point entities."""
-        # Helper function for safe access
-        def safe_get(obj, attr, default=None):
-            if hasattr(obj, attr):
-                return getattr(obj, attr)
-            elif isinstance(obj, dict):
-                return obj.get(attr, default)
-            return default
-        
-        points = []
-        
-        for point in chunk.entry_exit_points:
-            # Handle coordinates - may be Point object or dict
-            coords = safe_get(point, 'coordinates')
-            if coords:
-                coord_values = safe_get(coords, 'coordinates', coords)
-            else:
-                coord_values = []
-            
-            point_entity = {
-                "id": safe_get(point, "id", "unknown"),
-                "name": safe_get(point, "name", "Unknown"),
-                "coordinates": coord_values,
-                "is_entry": safe_get(point, "is_entry", False),
-                "is_exit": safe_get(point, "is_exit", False),
-                "status": "open" if safe_get(point, "current_status", False) else "closed",
-                "access_level": safe_get(point, "access_level", "unknown"),
+        return [
+            {
+                "id": _or_default(point.id, "unknown"),
+                "name": _or_default(point.name, "Unknown"),
+                "coordinates": point.coordinates or [],
+                "is_entry": point.is_entry,
+                "is_exit": point.is_exit,
+                "status": "open" if point.current_status else "closed",
+                "access_level": point.access_level,
                 "parent_zone": chunk.zone_id
             }
-            points.append(point_entity)
-        
-        return points
+            for point in chunk.entry_exit_points
+        ]
     
     def _extract_security_entities(self, chunk: GeoChunk) -> Dict[str, Any]:
         """Extract security-related entities."""
+        zone = chunk.zone
         return {
-            "level": self._safe_get_chunk_property(chunk, "security_level"),
-            "access_level": self._safe_get_chunk_property(chunk, "access_level"),
-            "protocols": self._safe_get_chunk_property(chunk, "emergency_protocols", []),
-            "zone_type": self._safe_get_chunk_property(chunk, "zone_type")
+            "level": zone.security_level,
+            "access_level": zone.access_level,
+            "protocols": zone.emergency_protocols,
+            "zone_type": zone.zone_type
         }
     
     def _extract_resource_entities(self, chunk: GeoChunk) -> Dict[str, Any]:
         """Extract resource-related entities."""
-        # Helper function for safe access
-        def safe_get(obj, attr, default=None):
-            if hasattr(obj, attr):
-                return getattr(obj, attr)
-            elif isinstance(obj, dict):
-                return obj.get(attr, default)
-            return default
-        
         return {
-            "requirements": self._safe_get_chunk_property(chunk, "resource_requirements", {}),
+            "requirements": chunk.zone.resource_requirements,
             "available_at_infrastructure": [
-                {"point": safe_get(infra, "id", "unknown"), "resources": safe_get(infra, "resources_available", [])}
+                {"point": _or_default(infra.id, "unknown"), "resources": infra.resources_available}
                 for infra in chunk.infrastructure_points
-                if safe_get(infra, "resources_available", [])
+                if infra.resources_available
             ]
         }
     
     def _extract_location_entities(self, chunk: GeoChunk) -> Dict[str, Any]:
         """Extract location and spatial entities."""
-        # Helper function for safe access
-        def safe_get(obj, attr, default=None):
-            if hasattr(obj, attr):
-                return getattr(obj, attr)
-            elif isinstance(obj, dict):
-                return obj.get(attr, default)
-            return default
-        
         geometry = chunk.geometry
         location_info = {
             "zone_id": chunk.zone_id,
             "zone_name": chunk.zone_name,
-            "geometry_type": safe_get(geometry, "type"),
-            "coordinates": safe_get(geometry, "coordinates")
+            "geometry_type": geometry.get("type"),
+            "coordinates": geometry.get("coordinates")
         }
         
-        # Calculate bounding box for spatial queries
-        if safe_get(geometry, "type") == "Polygon" and safe_get(geometry, "coordinates"):
-            coords = safe_get(geometry, "coordinates")[0]  # Outer ring
-            lons = [coord[0] for coord in coords]
-            lats = [coord[1] for coord in coords]
+        # Bounding box for spatial queries (precomputed in the geometry store)
+        bbox = chunk.bounding_box
+        if geometry.get("type") == "Polygon" and bbox:
             location_info["bounding_box"] = {
-                "min_lon": min(lons), "max_lon": max(lons),
-                "min_lat": min(lats), "max_lat": max(lats),
-                "center_lon": (min(lons) + max(lons)) / 2,
-                "center_lat": (min(lats) + max(lats)) / 2
+                **bbox,
+                "center_lon": (bbox["min_lon"] + bbox["max_lon"]) / 2,
+                "center_lat": (bbox["min_lat"] + bbox["max_lat"]) / 2
             }
         
         return location_info
     
     def _extract_operational_entities(self, chunk: GeoChunk) -> Dict[str, Any]:
         """Extract operational status and capacity entities."""
+        zone = chunk.zone
         return {
-            "operational_status": self._safe_get_chunk_property(chunk, "operational_status"),
-            "population_capacity": self._safe_get_chunk_property(chunk, "population_capacity"),
-            "current_population": self._safe_get_chunk_property(chunk, "current_population"),
-            "evacuation_time_minutes": self._safe_get_chunk_property(chunk, "evacuation_time_minutes"),
-            "last_updated": self._safe_get_chunk_property(chunk, "last_updated")
+            "operational_status": zone.operational_status,
+            "population_capacity": zone.population_capacity,
+            "current_population": zone.current_population,
+            "evacuation_time_minutes": zone.evacuation_time_minutes,
+            "last_updated": zone.last_updated
         }
 
     async def clear_graph(self):
@@ -738,6 +1194,26 @@ class GraphBuilder:
         logger.warning("Clearing knowledge graph...")
         await self.graph_client.clear_graph()
         logger.info("Knowledge graph cleared")
+    
+    async def drop_namespace(self, namespace: str, manifest: Optional[IngestManifest] = None):
+        """
+        Drop a finished event's namespace from the graph and the ingest manifest.
+        
+        Args:
+            namespace: Namespace to drop
+            manifest: Ingest manifest to forget the namespace's sources in (default: IngestManifest())
+        """
+        if not self._initialized:
+            await self.initialize()
+        
+        await self.graph_client.drop_namespace(namespace)
+        
+        manifest = manifest or IngestManifest()
+        for state_key in manifest.sources():
+            if state_key.startswith(f"{namespace}/"):
+                manifest.remove_source(state_key)
+        manifest.save()
+        logger.info(f"✓ Dropped namespace {namespace}")
 
 
 # Factory function
@@ -746,44 +1222,106 @@ def create_graph_builder() -> GraphBuilder:
     return GraphBuilder()
 
 
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options for the graph builder."""
+    parser = argparse.ArgumentParser(description="Build the Drishti knowledge graph from venue GeoJSON")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only ingest added/changed zones and retire removed ones (uses the local manifest)")
+    parser.add_argument("--manifest", default=None,
+                        help="Path of the ingest manifest used by --incremental")
+    parser.add_argument("--journal", default=None,
+                        help="Path of the append-only ingest journal")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue the last journaled run unless it completed cleanly, skipping chunks it already completed")
+    parser.add_argument("--stream", action="store_true",
+                        help="Parse and validate features incrementally (for very large venue files)")
+    parser.add_argument("--quarantine", default=None,
+                        help="JSONL file receiving features rejected by --stream validation")
+    parser.add_argument("--chunk-workers", type=int, default=None,
+                        help="Worker processes used to build geo chunks (default: CHUNK_BUILD_WORKERS)")
+    parser.add_argument("--prewarm-embeddings", action="store_true",
+                        help="Cache embeddings of zone/point names and schema enum values for graph search")
+    parser.add_argument("--namespace", default=None,
+                        help="Ingest into this event namespace (default: GRAPH_NAMESPACE)")
+    parser.add_argument("--drop-namespace", default=None, metavar="NAMESPACE",
+                        help="Delete a finished event's namespace from the graph and exit")
+    return parser.parse_args(argv)
+
+
 # Example usage
-async def main():
+async def main(args: Optional[argparse.Namespace] = None):
     """Example usage of the geo-enabled graph builder."""
+    args = args or parse_args([])
     graph_builder = create_graph_builder()
     
     try:
+        if args.drop_namespace:
+            await graph_builder.drop_namespace(args.drop_namespace, IngestManifest(args.manifest))
+            print(f"Dropped namespace {args.drop_namespace}")
+            return
+        
         # Load GeoJSON data (update path as needed)
         geojson_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))), "complete_all_108_zones_enhanced.geojson")
         if not os.path.exists(geojson_path):
             geojson_path = "complete_all_108_zones_enhanced.geojson"  # Try relative path
             
-        enhanced_data = graph_builder.load_geojson_from_file(geojson_path)
-        
-        # Create geo chunks
-        geo_chunks = graph_builder.create_geochunks_from_geojson(enhanced_data)
-        
-        print(f"Created {len(geo_chunks)} geo chunks")
+        vocabulary: Dict[str, None] = {}
         
-        # Extract entities with focus on agents
-        enriched_chunks = await graph_builder.extract_entities_from_geochunks(geo_chunks)
-        
-        # Print sample entity extraction
-        for i, chunk in enumerate(enriched_chunks[:2]):  # First 2 chunks
-            print(f"\nChunk {i} ({chunk.zone_name}):")
-            entities = chunk.metadata.get("entities", {})
-            print(f"  Agents: {entities.get('agents', [])}")
-            print(f"  Infrastructure: {len(entities.get('infrastructure', []))}")
-            print(f"  Security Level: {entities.get('security_info', {}).get('level')}")
+        if args.stream:
+            enhanced_data = graph_builder.stream_geojson_from_file(geojson_path, quarantine_path=args.quarantine)
+            
+            # Features flow from the parser through chunking and entity extraction
+            # into ingestion one batch at a time; only search texts are kept
+            def remember_vocabulary(chunks: Iterable[GeoChunk]) -> Iterator[GeoChunk]:
+                for chunk in chunks:
+                    vocabulary.update(dict.fromkeys(venue_vocabulary([chunk.zone])))
+                    yield chunk
+            
+            enriched_chunks = graph_builder.iter_entities_from_geochunks(
+                graph_builder.iter_geochunks_from_geojson(enhanced_data, workers=args.chunk_workers)
+            )
+            if args.prewarm_embeddings:
+                enriched_chunks = remember_vocabulary(enriched_chunks)
+        else:
+            enhanced_data = graph_builder.load_geojson_from_file(geojson_path)
+            
+            # Create geo chunks
+            geo_chunks = graph_builder.create_geochunks_from_geojson(enhanced_data, workers=args.chunk_workers)
+            
+            print(f"Created {len(geo_chunks)} geo chunks")
+            
+            # Extract entities with focus on agents
+            enriched_chunks = await graph_builder.extract_entities_from_geochunks(geo_chunks)
+            
+            # Print sample entity extraction
+            for i, chunk in enumerate(enriched_chunks[:2]):  # First 2 chunks
+                print(f"\nChunk {i} ({chunk.zone_name}):")
+                entities = chunk.metadata.get("entities", {})
+                print(f"  Agents: {entities.get('agents', [])}")
+                print(f"  Infrastructure: {len(entities.get('infrastructure', []))}")
+                print(f"  Security Level: {entities.get('security_info', {}).get('level')}")
+            
+            if args.prewarm_embeddings:
+                vocabulary = dict.fromkeys(venue_vocabulary(chunk.zone for chunk in enriched_chunks))
         
         # Add to knowledge graph
         result = await graph_builder.add_geojson_to_graph(
             geo_chunks=enriched_chunks,
             source_name="enhanced_zones_108",
-            source_metadata={"version": "1.0", "type": "emergency_response_zones"}
+            source_metadata={"version": "1.0", "type": "emergency_response_zones"},
+            incremental=args.incremental,
+            manifest=IngestManifest(args.manifest) if args.incremental else None,
+            journal=IngestJournal(args.journal),
+            resume=args.resume,
+            namespace=args.namespace
         )
         
         print(f"\nGraph building result: {result}")
         
+        if args.prewarm_embeddings:
+            prewarmed = await graph_builder.graph_client.prewarm_embedding_cache(list(vocabulary))
+            print(f"Pre-warmed {prewarmed} query embeddings")
+        
     except Exception as e:
         print(f"Graph building failed: {e}")
         import traceback
@@ -801,7 +1339,7 @@ if __name__ == "__main__":
     # os.environ["GOOGLE_CLOUD_STAGING_BUCKET"] = "gs://namaste-agents"
     # Load env
     load_dotenv()
-    asyncio.run(main())
+    asyncio.run(main(parse_args()))
     # Print env details
     # print(f"GOOGLE_CLOUD_PROJECT: {os.environ['GOOGLE_CLOUD_PROJECT']}")
     # print(f"GOOGLE_CLOUD_LOCATION: {os.environ['GOOGLE_CLOUD_LOCATION']}")
@@ -0,0 +1,21 @@
+"""
+Traversal and timeline bounds shared by the graph client and the tool input models.
+
+Kept apart from graph_utils so that models.py can use them as defaults
+without importing graphiti_core and the Neo4j driver.
+"""
+
+import os
+
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Bounds for relationship traversal (get_related_entities)
+GRAPH_TRAVERSAL_MAX_DEPTH = int(os.getenv("GRAPH_TRAVERSAL_MAX_DEPTH", "4"))
+GRAPH_TRAVERSAL_FAN_OUT = int(os.getenv("GRAPH_TRAVERSAL_FAN_OUT", "25"))  # Edges followed per entity per hop
+GRAPH_TRAVERSAL_LIMIT = int(os.getenv("GRAPH_TRAVERSAL_LIMIT", "100"))  # Entities returned
+
+# Facts per timeline page
+GRAPH_TIMELINE_PAGE_SIZE = int(os.getenv("GRAPH_TIMELINE_PAGE_SIZE", "100"))
@@ -3,23 +3,182 @@ Graph utilities for Neo4j/Graphiti integration.
 """
 
 import os
+import json
+import asyncio
+import time
+import base64
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
+from importlib.metadata import version as package_version, PackageNotFoundError
 
+from neo4j import AsyncGraphDatabase
 from graphiti_core import Graphiti
 from graphiti_core.utils.maintenance.graph_data_operations import clear_data
 from graphiti_core.llm_client.config import LLMConfig
 from graphiti_core.llm_client.gemini_client import GeminiClient
+from graphiti_core.embedder.client import EmbedderClient
 from graphiti_core.embedder.gemini import GeminiEmbedder, GeminiEmbedderConfig
 from graphiti_core.cross_encoder.gemini_reranker_client import GeminiRerankerClient
+from graphiti_core.search.search import search as graphiti_search
+from graphiti_core.search.search_config import SearchConfig, EdgeSearchConfig, EdgeSearchMethod, EdgeReranker
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.helpers import validate_group_id
 from dotenv import load_dotenv
 
+try:
+    from .cache import TTLCache, SingleFlight, normalize_query
+    from .embedding_cache import EMBEDDING_CACHE_DIR, EmbeddingStore, CachedEmbedder
+    from .bm25_index import BM25Index, find_identifiers, is_identifier_query
+    from .rate_limiter import is_rate_limit_error
+    from .resilience import BREAKER_STATE_VALUES, CircuitOpenError, ResilientEmbedder, ResilientLLMClient, create_callers
+    from . import metrics
+    from .graph_settings import (
+        GRAPH_TRAVERSAL_MAX_DEPTH, GRAPH_TRAVERSAL_FAN_OUT, GRAPH_TRAVERSAL_LIMIT, GRAPH_TIMELINE_PAGE_SIZE
+    )
+except ImportError:
+    # For direct execution or testing
+    import cache
+    import embedding_cache
+    import bm25_index
+    import rate_limiter
+    import resilience
+    import metrics
+    import graph_settings
+    TTLCache = cache.TTLCache
+    SingleFlight = cache.SingleFlight
+    normalize_query = cache.normalize_query
+    EMBEDDING_CACHE_DIR = embedding_cache.EMBEDDING_CACHE_DIR
+    EmbeddingStore = embedding_cache.EmbeddingStore
+    CachedEmbedder = embedding_cache.CachedEmbedder
+    BM25Index = bm25_index.BM25Index
+    find_identifiers = bm25_index.find_identifiers
+    is_identifier_query = bm25_index.is_identifier_query
+    is_rate_limit_error = rate_limiter.is_rate_limit_error
+    BREAKER_STATE_VALUES = resilience.BREAKER_STATE_VALUES
+    CircuitOpenError = resilience.CircuitOpenError
+    ResilientEmbedder = resilience.ResilientEmbedder
+    ResilientLLMClient = resilience.ResilientLLMClient
+    create_callers = resilience.create_callers
+    GRAPH_TRAVERSAL_MAX_DEPTH = graph_settings.GRAPH_TRAVERSAL_MAX_DEPTH
+    GRAPH_TRAVERSAL_FAN_OUT = graph_settings.GRAPH_TRAVERSAL_FAN_OUT
+    GRAPH_TRAVERSAL_LIMIT = graph_settings.GRAPH_TRAVERSAL_LIMIT
+    GRAPH_TIMELINE_PAGE_SIZE = graph_settings.GRAPH_TIMELINE_PAGE_SIZE
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Graph storage backend: "neo4j" (Graphiti on Neo4j) or "memory" (in-process, for load tests and drills)
+GRAPH_BACKEND = os.getenv("GRAPH_BACKEND", "neo4j")
+
+# Active event/venue namespace (Graphiti group_id); empty means unscoped
+GRAPH_NAMESPACE = os.getenv("GRAPH_NAMESPACE", "")
+
+# Search result cache (size 0 disables it)
+GRAPH_SEARCH_CACHE_SIZE = int(os.getenv("GRAPH_SEARCH_CACHE_SIZE", "512"))
+GRAPH_SEARCH_CACHE_TTL = float(os.getenv("GRAPH_SEARCH_CACHE_TTL", "60"))  # Seconds
+
+# Seconds the local BM25 index of episode content is reused before reloading it
+# from Neo4j (writes through this client update it in place)
+GRAPH_LEXICAL_INDEX_TTL = float(os.getenv("GRAPH_LEXICAL_INDEX_TTL", "300"))
+
+# Characters of episode content returned with lexical hits
+LEXICAL_SNIPPET_CHARS = 600
+
+# Maximum queries per batch_search call
+GRAPH_BATCH_MAX_QUERIES = int(os.getenv("GRAPH_BATCH_MAX_QUERIES", "16"))
+
+# Seconds graph statistics (node/edge counts) are reused before re-querying Neo4j
+GRAPH_STATS_TTL = float(os.getenv("GRAPH_STATS_TTL", "10"))
+
+# Range index backing time-bounded timeline queries
+TIMELINE_INDEX_QUERY = "CREATE INDEX relation_valid_at IF NOT EXISTS FOR ()-[e:RELATES_TO]-() ON (e.valid_at)"
+
+# Bump whenever the indices built in _ensure_schema change; together with the
+# graphiti-core version it is stored on a marker node so restarts can skip
+# rebuilding indices that already exist
+GRAPH_SCHEMA_VERSION = 1
+SCHEMA_MARKER_NAME = "drishti_graph"
+SCHEMA_MARKER_READ_QUERY = "MATCH (m:SchemaVersion {name: $name}) RETURN m.version AS version"
+SCHEMA_MARKER_WRITE_QUERY = """
+MERGE (m:SchemaVersion {name: $name})
+SET m.version = $version, m.updated_at = datetime()
+"""
+
+# Start entities: exact uuid/name matches first, then partial name matches
+TRAVERSAL_SEED_QUERY = """
+MATCH (n:Entity)
+WHERE (n.uuid = $entity OR toLower(n.name) CONTAINS toLower($entity))
+  AND ($group_id IS NULL OR n.group_id = $group_id)
+WITH n, (n.uuid = $entity OR toLower(n.name) = toLower($entity)) AS exact
+RETURN n.uuid AS uuid, n.name AS name, n.summary AS summary, labels(n) AS labels, exact
+ORDER BY exact DESC, size(n.name)
+LIMIT $seed_limit
+"""
+
+# One BFS hop: the newest fan_out matching edges of every frontier entity
+TRAVERSAL_HOP_QUERY = """
+UNWIND $frontier AS node_uuid
+MATCH (n:Entity {uuid: node_uuid})-[r:RELATES_TO]-(m:Entity)
+WHERE ($relationship_types IS NULL OR r.name IN $relationship_types)
+  AND ($group_id IS NULL OR r.group_id = $group_id)
+WITH n, r, m
+ORDER BY r.created_at DESC
+WITH n, collect({edge: r, node: m})[..$fan_out] AS hops
+UNWIND hops AS hop
+WITH hop.edge AS r, hop.node AS m
+RETURN r.uuid AS uuid, r.name AS name, r.fact AS fact, r.valid_at AS valid_at, r.invalid_at AS invalid_at,
+       startNode(r).uuid AS source_uuid, endNode(r).uuid AS target_uuid,
+       m.uuid AS node_uuid, m.name AS node_name, m.summary AS node_summary, labels(m) AS node_labels
+"""
+
+
+def _schema_version() -> str:
+    """Version stored on the schema marker: GRAPH_SCHEMA_VERSION and the installed graphiti-core version."""
+    try:
+        graphiti_version = package_version("graphiti-core")
+    except PackageNotFoundError:
+        graphiti_version = "unknown"
+    return f"{GRAPH_SCHEMA_VERSION}:graphiti-core=={graphiti_version}"
+
+
+def _cypher_name(name: str) -> str:
+    """Quote a label or relationship type for use in a Cypher pattern."""
+    return "`" + name.replace("`", "``") + "`"
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    """Convert a Neo4j temporal value to a timezone-aware datetime."""
+    if value is None:
+        return None
+    if hasattr(value, "to_native"):
+        value = value.to_native()
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _sum_by(records: List[Any], field: str, default: str) -> Dict[str, int]:
+    """Sum the count column of records grouped by another column."""
+    totals: Dict[str, int] = {}
+    for record in records:
+        key = record[field] or default
+        totals[key] = totals.get(key, 0) + record["count"]
+    return totals
+
+
+def _encode_timeline_cursor(valid_at: datetime, uuid: str) -> str:
+    payload = json.dumps([valid_at.isoformat(), uuid]).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii")
+
+
+def _decode_timeline_cursor(cursor: str):
+    try:
+        valid_at, uuid = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return _to_datetime(datetime.fromisoformat(valid_at)), uuid
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid timeline cursor: {cursor!r}") from e
+
 # Help from this PR for setting up the custom clients: https://github.com/getzep/graphiti/pull/601/files
 class GraphitiClient:
     """Manages Graphiti knowledge graph operations."""
@@ -28,7 +187,8 @@ class GraphitiClient:
         self,
         neo4j_uri: Optional[str] = None,
         neo4j_user: Optional[str] = None,
-        neo4j_password: Optional[str] = None
+        neo4j_password: Optional[str] = None,
+        namespace: Optional[str] = None
     ):
         """
         Initialize Graphiti client.
@@ -37,6 +197,7 @@ class GraphitiClient:
             neo4j_uri: Neo4j connection URI
             neo4j_user: Neo4j username
             neo4j_password: Neo4j password
+            namespace: Active event/venue namespace (default: GRAPH_NAMESPACE; empty is unscoped)
         """
         # Neo4j configuration
         self.neo4j_uri = neo4j_uri or os.getenv("NEO4J_URI", "bolt://localhost:7687")
@@ -63,58 +224,197 @@ class GraphitiClient:
         self.embedding_model = os.getenv("EMBEDDING_MODEL", "text-embedding-004")
         self.embedding_dimensions = int(os.getenv("VECTOR_DIMENSION", "768"))
         
+        self._init_state(namespace)
+    
+    def _init_state(self, namespace: Optional[str]):
+        """Set up the namespace, caches and request coalescing shared by all backends."""
+        # Reads and writes are scoped to this Graphiti group_id unless a call names another
+        self.namespace = self._resolve_namespace(namespace if namespace is not None else GRAPH_NAMESPACE)
+        
         self.graphiti: Optional[Graphiti] = None
         self._initialized = False
+        self._init_lock = asyncio.Lock()
+        
+        # Seconds spent in each phase of the last initialize()
+        self.startup_timings: Dict[str, float] = {}
+        
+        # Search results, invalidated whenever this client writes to the graph
+        self.search_cache = TTLCache(GRAPH_SEARCH_CACHE_SIZE, GRAPH_SEARCH_CACHE_TTL)
+        
+        # Persistent embeddings of query/name texts (None when EMBEDDING_CACHE_DIR is empty)
+        self.embedding_cache: Optional[CachedEmbedder] = None
+        
+        # Graph counts for get_graph_statistics, and the plain Neo4j connection
+        # used for them before Graphiti (LLM, embedder) is initialized
+        self.stats_cache = TTLCache(1, GRAPH_STATS_TTL)
+        self._stats_driver = None
+        
+        # BM25 index of episode content per namespace for hybrid_search, with
+        # the search cache generation and time it was loaded at
+        self.lexical_indexes: Dict[Optional[str], BM25Index] = {}
+        self._lexical_index_state: Dict[Optional[str], tuple] = {}
+        self._lexical_index_locks: Dict[Optional[str], asyncio.Lock] = {}
+        
+        # Identical concurrent queries (e.g. from several sub-agents) share one execution
+        self.single_flight = SingleFlight()
+        
+        # Circuit breaker, timeout and hedging state of the llm and embedder
+        # clients; kept across re-initialization
+        self.dependencies = create_callers()
+    
+    def _resolve_namespace(self, namespace: Optional[str]) -> Optional[str]:
+        """
+        Resolve the namespace of a call.
+        
+        Args:
+            namespace: Namespace named by the caller (None: the client's active namespace)
+        
+        Returns:
+            Graphiti group_id, or None for unscoped access
+        """
+        if namespace is None:
+            return self.namespace
+        validate_group_id(namespace)
+        return namespace or None
+    
+    def _cached_embedder(self, embedder: EmbedderClient):
+        """Wrap an embedder with the persistent embedding cache, if enabled."""
+        if not EMBEDDING_CACHE_DIR:
+            return embedder
+        store = (
+            self.embedding_cache.store if self.embedding_cache
+            else EmbeddingStore(EMBEDDING_CACHE_DIR, self.embedding_model, self.embedding_dimensions)
+        )
+        self.embedding_cache = CachedEmbedder(embedder, store)
+        return self.embedding_cache
     
     async def initialize(self):
-        """Initialize Graphiti client."""
+        """
+        Initialize Graphiti client.
+        
+        Safe to call concurrently: the first caller builds the clients and
+        indices while the others wait on the lock and then return.
+        """
         if self._initialized:
             return
         
-        try:
-            # Create LLMConfig for Google Cloud Vertex AI (no API key needed)
-            llm_config = LLMConfig(
-                # api_key=self.llm_api_key,  # Not used for Vertex AI - uses ADC or service account
-                model=self.llm_choice,
+        async with self._init_lock:
+            if not self._initialized:
+                await self._initialize()
+    
+    def _build_graphiti(self) -> Graphiti:
+        """
+        Create the Gemini LLM, embedder and reranker clients and the Graphiti instance using them.
+        
+        The LLM and embedder clients are wrapped with the circuit breaker,
+        timeout and hedging policy of their dependency (see resilience.py). The
+        reranker is left unwrapped: searches rerank with RRF or node distance,
+        so Graphiti never calls it on the search path.
+        """
+        # Create LLMConfig for Google Cloud Vertex AI (no API key needed)
+        llm_config = LLMConfig(
+            # api_key=self.llm_api_key,  # Not used for Vertex AI - uses ADC or service account
+            model=self.llm_choice,
+            # base_url="https://generativelanguage.googleapis.com/v1beta",  # Remove for Vertex AI - uses default
+            # small_model=self.llm_choice if not self.small_llm_choice else self.small_llm_choice,  # Can be the same as main model
+        )
+        
+        # Create Gemini LLM client for Vertex AI
+        gemini_client = GeminiClient(config=llm_config)
+        llm_client = ResilientLLMClient(gemini_client, self.dependencies["llm"])
+        
+        # Create Gemini embedder for Google Cloud Vertex AI  
+        embedder = GeminiEmbedder(
+            config=GeminiEmbedderConfig(
+                # api_key=self.embedding_api_key,  # Not used for Vertex AI - uses ADC or service account
+                embedding_model=self.embedding_model,
+                embedding_dim=self.embedding_dimensions,
                 # base_url="https://generativelanguage.googleapis.com/v1beta",  # Remove for Vertex AI - uses default
-                # small_model=self.llm_choice if not self.small_llm_choice else self.small_llm_choice,  # Can be the same as main model
-            )
-            
-            # Create Gemini LLM client for Vertex AI
-            llm_client = GeminiClient(config=llm_config)
-            
-            # Create Gemini embedder for Google Cloud Vertex AI  
-            embedder = GeminiEmbedder(
-                config=GeminiEmbedderConfig(
-                    # api_key=self.embedding_api_key,  # Not used for Vertex AI - uses ADC or service account
-                    embedding_model=self.embedding_model,
-                    embedding_dim=self.embedding_dimensions,
-                    # base_url="https://generativelanguage.googleapis.com/v1beta",  # Remove for Vertex AI - uses default
-                )
-            )
-            
-            # Initialize Graphiti with custom clients
-            self.graphiti = Graphiti(
-                self.neo4j_uri,
-                self.neo4j_user,
-                self.neo4j_password,
-                llm_client=llm_client,
-                embedder=embedder,
-                cross_encoder=GeminiRerankerClient(client=llm_client, config=llm_config)
             )
+        )
+        # Cache hits are served even while the embedder's breaker is open
+        embedder = self._cached_embedder(ResilientEmbedder(embedder, self.dependencies["embedder"]))
+        
+        # Initialize Graphiti with custom clients
+        graphiti = Graphiti(
+            self.neo4j_uri,
+            self.neo4j_user,
+            self.neo4j_password,
+            llm_client=llm_client,
+            embedder=embedder,
+            cross_encoder=GeminiRerankerClient(client=gemini_client, config=llm_config)
+        )
+        
+        # The Neo4j driver schedules its own index build when created inside a
+        # running event loop; _ensure_schema decides whether one is needed
+        init_task = getattr(graphiti.driver, "_init_task", None)
+        if init_task is not None and not init_task.done():
+            init_task.cancel()
+        
+        return graphiti
+    
+    async def _ensure_schema(self, force: bool = False) -> bool:
+        """
+        Build indices and constraints unless the schema marker is current.
+        
+        Args:
+            force: Build even when the marker is current
+        
+        Returns:
+            True if indices were built
+        """
+        version = _schema_version()
+        driver = self.graphiti.driver
+        
+        started = time.perf_counter()
+        records, _, _ = await driver.execute_query(SCHEMA_MARKER_READ_QUERY, name=SCHEMA_MARKER_NAME)
+        self.startup_timings["schema_check"] = round(time.perf_counter() - started, 4)
+        
+        if not force and records and records[0]["version"] == version:
+            logger.info(f"✓ Graph schema {version} is current, skipping index build")
+            return False
+        
+        started = time.perf_counter()
+        await self.graphiti.build_indices_and_constraints()
+        await driver.execute_query(TIMELINE_INDEX_QUERY)
+        await driver.execute_query(SCHEMA_MARKER_WRITE_QUERY, name=SCHEMA_MARKER_NAME, version=version)
+        self.startup_timings["index_build"] = round(time.perf_counter() - started, 4)
+        logger.info(f"✓ Built graph indices for schema {version} in {self.startup_timings['index_build']:.2f}s")
+        return True
+    
+    async def _initialize(self):
+        self.startup_timings = {}
+        started = time.perf_counter()
+        try:
+            phase_started = time.perf_counter()
+            self.graphiti = self._build_graphiti()
+            self.startup_timings["clients"] = round(time.perf_counter() - phase_started, 4)
             
-            # Build indices and constraints
-            await self.graphiti.build_indices_and_constraints()
+            # Build indices and constraints (only when the schema marker is missing or stale)
+            await self._ensure_schema()
             
             self._initialized = True
+            self.startup_timings["total"] = round(time.perf_counter() - started, 4)
             logger.info(f"Graphiti client initialized successfully with LLM: {self.llm_choice} and embedder: {self.embedding_model}")
+            logger.info(f"Graph startup timings (s): {self.startup_timings}")
+            
+            # Queries now share Graphiti's connection pool
+            if self._stats_driver:
+                await self._stats_driver.close()
+                self._stats_driver = None
             
         except Exception as e:
             logger.error(f"Failed to initialize Graphiti: {e}")
+            if self.graphiti:
+                await self.graphiti.close()
+                self.graphiti = None
             raise
     
     async def close(self):
         """Close Graphiti connection."""
+        if self._stats_driver:
+            await self._stats_driver.close()
+            self._stats_driver = None
         if self.graphiti:
             await self.graphiti.close()
             self.graphiti = None
@@ -127,8 +427,9 @@ class GraphitiClient:
         content: str,
         source: str,
         timestamp: Optional[datetime] = None,
-        metadata: Optional[Dict[str, Any]] = None
-    ):
+        metadata: Optional[Dict[str, Any]] = None,
+        namespace: Optional[str] = None
+    ) -> str:
         """
         Add an episode to the knowledge graph.
         
@@ -138,6 +439,10 @@ class GraphitiClient:
             source: Source of the content
             timestamp: Episode timestamp
             metadata: Additional metadata
+            namespace: Namespace to add it to (default: the active namespace)
+        
+        Returns:
+            UUID of the created episode node
         """
         if not self._initialized:
             await self.initialize()
@@ -147,161 +452,967 @@ class GraphitiClient:
         # Import EpisodeType for proper source handling
         from graphiti_core.nodes import EpisodeType
         
-        await self.graphiti.add_episode(
+        group_id = self._resolve_namespace(namespace)
+        result = await self.graphiti.add_episode(
             name=episode_id,
             episode_body=content,
             source=EpisodeType.text,  # Always use text type for our content
             source_description=source,
-            reference_time=episode_timestamp
+            reference_time=episode_timestamp,
+            group_id=group_id
         )
         
+        self._episodes_written(group_id, added=[
+            {"uuid": str(result.episode.uuid), "name": episode_id, "content": content, "source": source}
+        ])
         logger.info(f"Added episode {episode_id} to knowledge graph")
+        return str(result.episode.uuid)
+    
+    async def add_episodes(
+        self,
+        episodes: List[Dict[str, Any]],
+        batch_size: int = 10,
+        namespace: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Add many episodes to the knowledge graph using bulk submissions.
+        
+        Each batch is submitted through Graphiti's bulk ingestion, so entity
+        extraction, embedding and Neo4j writes are shared across the batch.
+        If a bulk submission fails, its episodes are retried one at a time so
+        failures are reported per episode. A provider rate limit or an open
+        circuit breaker stops the submission: the remaining episodes are
+        returned under failed_episodes with rate_limited set, for the caller
+        to retry after backing off.
+        
+        Args:
+            episodes: Episodes as dicts with the keyword arguments of add_episode
+                (episode_id, content, source, timestamp, metadata, namespace)
+            batch_size: Maximum number of episodes per bulk submission
+            namespace: Namespace for episodes that do not name one (default: the active namespace)
+        
+        Returns:
+            Processing results (episodes_created, total_chunks, errors,
+            episode_uuids, failed_episodes, rate_limited)
+        """
+        if not self._initialized:
+            await self.initialize()
+        
+        from graphiti_core.nodes import EpisodeType
+        from graphiti_core.utils.bulk_utils import RawEpisode
+        
+        episodes_created = 0
+        errors = []
+        episode_uuids: Dict[str, str] = {}
+        rate_limited = False
+        
+        def fail(episode: Dict[str, Any], error: Exception):
+            error_msg = f"Failed to add episode {episode['episode_id']}: {str(error)}"
+            logger.error(error_msg)
+            errors.append(error_msg)
+        
+        for start in range(0, len(episodes), max(1, batch_size)):
+            if rate_limited:
+                break
+            batch = [
+                {**episode, "namespace": episode.get("namespace", namespace)}
+                for episode in episodes[start:start + max(1, batch_size)]
+            ]
+            
+            raw_episodes = [
+                RawEpisode(
+                    name=episode["episode_id"],
+                    content=episode["content"],
+                    source_description=episode["source"],
+                    source=EpisodeType.text,
+                    reference_time=episode.get("timestamp") or datetime.now(timezone.utc)
+                )
+                for episode in batch
+            ]
+            
+            try:
+                group_ids = {self._resolve_namespace(episode["namespace"]) for episode in batch}
+                if len(group_ids) > 1:
+                    raise ValueError("Bulk submission mixes namespaces")
+                group_id = group_ids.pop()
+                result = await self.graphiti.add_episode_bulk(raw_episodes, group_id=group_id)
+                self._episodes_written(group_id, added=[
+                    {"uuid": str(node.uuid), "name": node.name, "content": node.content, "source": node.source_description}
+                    for node in result.episodes
+                ])
+                for node in result.episodes:
+                    episode_uuids[node.name] = str(node.uuid)
+                episodes_created += len(batch)
+                logger.info(f"Added {len(batch)} episodes to knowledge graph in bulk")
+                continue
+            
+            except Exception as e:
+                # Retrying each episode right away would only add load to an exhausted
+                # quota, or fail fast against an open breaker
+                rate_limited = is_rate_limit_error(e) or isinstance(e, CircuitOpenError)
+                if len(batch) == 1 or rate_limited:
+                    for episode in batch:
+                        fail(episode, e)
+                    continue
+                logger.warning(f"Bulk submission of {len(batch)} episodes failed, retrying individually: {e}")
+            
+            # Isolate the failing episode(s) of the batch
+            for episode in batch:
+                try:
+                    episode_uuids[episode["episode_id"]] = await self.add_episode(**episode)
+                    episodes_created += 1
+                except Exception as e:
+                    fail(episode, e)
+                    if is_rate_limit_error(e) or isinstance(e, CircuitOpenError):
+                        rate_limited = True
+                        break
+        
+        failed_episodes = [episode["episode_id"] for episode in episodes if episode["episode_id"] not in episode_uuids]
+        if rate_limited:
+            logger.warning(f"Rate limited during bulk submission, {len(failed_episodes)} episodes left for retry")
+        
+        return {
+            "episodes_created": episodes_created,
+            "total_chunks": len(episodes),
+            "errors": errors,
+            "episode_uuids": episode_uuids,
+            "failed_episodes": failed_episodes,
+            "rate_limited": rate_limited
+        }
+    
+    async def remove_episode(self, episode_uuid: str):
+        """
+        Remove an episode and the nodes/edges only it contributed.
+        
+        Args:
+            episode_uuid: UUID of the episode node
+        """
+        if not self._initialized:
+            await self.initialize()
+        
+        await self.graphiti.remove_episode(episode_uuid)
+        self._episodes_written(removed=[episode_uuid])
+        logger.info(f"Removed episode {episode_uuid} from knowledge graph")
     
     async def search(
         self,
         query: str,
         center_node_distance: int = 2,
-        use_hybrid_search: bool = True
+        use_hybrid_search: bool = True,
+        limit: int = 10,
+        center_node_uuid: Optional[str] = None,
+        query_vector: Optional[List[float]] = None,
+        namespace: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Search the knowledge graph.
         
+        Results are served from the search cache when the same normalized
+        query was answered within GRAPH_SEARCH_CACHE_TTL seconds and nothing
+        has been written through this client since.
+        
         Args:
             query: Search query
-            center_node_distance: Distance from center nodes
-            use_hybrid_search: Whether to use hybrid search
+            center_node_distance: Hops to expand from center_node_uuid (ignored without it)
+            use_hybrid_search: Combine full-text (BM25) and vector search; vector only when False
+            limit: Maximum number of results
+            center_node_uuid: Optional entity to search around; results are reranked by distance to it
+            query_vector: Precomputed query embedding (skips embedding the query)
+            namespace: Namespace to search (default: the active namespace)
         
         Returns:
-            Search results
+            Search results with their reranker scores
         """
+        group_id = self._resolve_namespace(namespace)
+        cache_key = (normalize_query(query), center_node_distance, use_hybrid_search, limit, center_node_uuid, group_id)
+        cached = self.search_cache.get(cache_key)
+        if cached is not None:
+            return [dict(result) for result in cached]
+        
+        return await self.single_flight.do(
+            ("search", self.search_cache.generation, cache_key),
+            lambda: self._search(query, center_node_distance, use_hybrid_search, limit, center_node_uuid,
+                                 query_vector, group_id, cache_key)
+        )
+    
+    async def _search(
+        self,
+        query: str,
+        center_node_distance: int,
+        use_hybrid_search: bool,
+        limit: int,
+        center_node_uuid: Optional[str],
+        query_vector: Optional[List[float]],
+        group_id: Optional[str],
+        cache_key: Any
+    ) -> List[Dict[str, Any]]:
+        """Run a search that missed the cache and cache its results."""
+        generation = self.search_cache.generation
+        fallbacks = self.dependencies["embedder"].fallbacks
+        
         if not self._initialized:
             await self.initialize()
         
         try:
-            # Use Graphiti's search method (simplified parameters)
-            results = await self.graphiti.search(query)
-            
-            # Convert results to dictionaries
-            return [
-                {
-                    "fact": result.fact,
-                    "uuid": str(result.uuid),
-                    "valid_at": str(result.valid_at) if hasattr(result, 'valid_at') and result.valid_at else None,
-                    "invalid_at": str(result.invalid_at) if hasattr(result, 'invalid_at') and result.invalid_at else None,
-                    "source_node_uuid": str(result.source_node_uuid) if hasattr(result, 'source_node_uuid') and result.source_node_uuid else None
-                }
-                for result in results
-            ]
+            results = await self._search_edges(
+                query, center_node_distance, use_hybrid_search, limit, center_node_uuid, query_vector, group_id
+            )
+            # Full-text-only results from a degraded search are not cached
+            if self.dependencies["embedder"].fallbacks == fallbacks:
+                self.search_cache.set(cache_key, results, generation=generation)
+            return [dict(result) for result in results]
             
         except Exception as e:
             logger.error(f"Graph search failed: {e}")
+            metrics.record_error(e)
             return []
     
+    async def _search_edges(
+        self,
+        query: str,
+        center_node_distance: int,
+        use_hybrid_search: bool,
+        limit: int,
+        center_node_uuid: Optional[str],
+        query_vector: Optional[List[float]],
+        group_id: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Search facts with Graphiti's edge search and convert them to result dicts.
+        
+        When the query cannot be embedded (embedder breaker open, timeout or
+        error) the search degrades to full-text (BM25) matching of facts.
+        """
+        if query_vector is None and query.strip():
+            embedder = self.dependencies["embedder"]
+            try:
+                with metrics.phase("embed"):
+                    query_vector = await self.graphiti.embedder.create(input_data=[query.replace("\n", " ")])
+            except Exception as e:
+                embedder.fallbacks += 1
+                if not isinstance(e, CircuitOpenError):
+                    logger.warning(f"Query embedding failed, falling back to full-text search: {e!r}")
+        
+        search_methods = [EdgeSearchMethod.cosine_similarity] if query_vector is not None else []
+        if use_hybrid_search or query_vector is None:
+            search_methods.insert(0, EdgeSearchMethod.bm25)
+        if center_node_uuid:
+            search_methods.append(EdgeSearchMethod.bfs)
+        config = SearchConfig(
+            edge_config=EdgeSearchConfig(
+                search_methods=search_methods,
+                reranker=EdgeReranker.node_distance if center_node_uuid else EdgeReranker.rrf,
+                bfs_max_depth=center_node_distance
+            ),
+            limit=limit
+        )
+        
+        # Graphiti reranks (RRF / node distance) inside the search call
+        with metrics.phase("search"):
+            search_results = await graphiti_search(
+                self.graphiti.clients,
+                query,
+                [group_id] if group_id else None,
+                config,
+                SearchFilters(),
+                center_node_uuid=center_node_uuid,
+                bfs_origin_node_uuids=[center_node_uuid] if center_node_uuid else None,
+                query_vector=query_vector
+            )
+        scores = search_results.edge_reranker_scores or [None] * len(search_results.edges)
+        
+        # Convert results to dictionaries
+        return [
+            {
+                "fact": result.fact,
+                "uuid": str(result.uuid),
+                "valid_at": str(result.valid_at) if hasattr(result, 'valid_at') and result.valid_at else None,
+                "invalid_at": str(result.invalid_at) if hasattr(result, 'invalid_at') and result.invalid_at else None,
+                "source_node_uuid": str(result.source_node_uuid) if hasattr(result, 'source_node_uuid') and result.source_node_uuid else None,
+                "score": score
+            }
+            for result, score in zip(search_results.edges, scores)
+        ]
+    
+    def _lexical_index_is_current(self, group_id: Optional[str]) -> bool:
+        """Whether a namespace's BM25 index reflects every write and is younger than GRAPH_LEXICAL_INDEX_TTL."""
+        generation, loaded_at = self._lexical_index_state.get(group_id, (-1, 0.0))
+        return (
+            group_id in self.lexical_indexes
+            and generation == self.search_cache.generation
+            and time.monotonic() - loaded_at < GRAPH_LEXICAL_INDEX_TTL
+        )
+    
+    @staticmethod
+    def _lexical_document(record: Any) -> tuple:
+        """(doc_id, text, document) of an episode record for BM25Index.add."""
+        return (
+            record["uuid"],
+            f"{record['name'] or ''}\n{record['content'] or ''}",
+            {"uuid": record["uuid"], "name": record["name"], "source": record["source"],
+             "content": (record["content"] or "")[:LEXICAL_SNIPPET_CHARS]}
+        )
+    
+    async def _get_lexical_index(self, group_id: Optional[str]) -> BM25Index:
+        """BM25 index of a namespace's episodes, reloaded when stale or GRAPH_LEXICAL_INDEX_TTL seconds old."""
+        if self._lexical_index_is_current(group_id):
+            return self.lexical_indexes[group_id]
+        
+        # One reload per namespace at a time; callers queued behind it reuse its index
+        async with self._lexical_index_locks.setdefault(group_id, asyncio.Lock()):
+            if self._lexical_index_is_current(group_id):
+                return self.lexical_indexes[group_id]
+            
+            generation = self.search_cache.generation
+            records = await self._load_episode_records(group_id)
+            index = BM25Index()
+            index.add_many(self._lexical_document(record) for record in records)
+            
+            self.lexical_indexes[group_id] = index
+            self._lexical_index_state[group_id] = (generation, time.monotonic())
+            logger.info(f"Loaded lexical index over {len(index)} episodes (namespace: {group_id or 'all'})")
+            return index
+    
+    def _episodes_written(self, group_id: Optional[str] = None, added: List[Any] = (), removed: List[str] = ()):
+        """
+        Invalidate cached results after this client added or removed episodes.
+        
+        Lexical indexes that were current are updated in place and stay
+        current, instead of being reloaded in full on the next hybrid_search.
+        
+        Args:
+            group_id: Namespace of the added episodes
+            added: Records (uuid, name, content, source) of the added episodes
+            removed: UUIDs of the removed episodes
+        """
+        generation = self.search_cache.generation
+        self.search_cache.clear()
+        for key, index in self.lexical_indexes.items():
+            indexed_generation, loaded_at = self._lexical_index_state[key]
+            if indexed_generation != generation:
+                continue
+            for episode_uuid in removed:
+                index.remove(episode_uuid)
+            if key is None or key == group_id:
+                index.add_many(self._lexical_document(record) for record in added)
+            self._lexical_index_state[key] = (self.search_cache.generation, loaded_at)
+    
+    async def _load_episode_records(self, group_id: Optional[str]) -> List[Any]:
+        """uuid, name, content and source of a namespace's episodes."""
+        return await self._run_read_query(
+            "MATCH (e:Episodic) WHERE $group_id IS NULL OR e.group_id = $group_id "
+            "RETURN e.uuid AS uuid, e.name AS name, e.content AS content, e.source_description AS source",
+            group_id=group_id
+        )
+    
+    async def hybrid_search(
+        self,
+        query: str,
+        limit: int = 10,
+        text_weight: float = 0.3,
+        query_vector: Optional[List[float]] = None,
+        namespace: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Search episode content lexically (BM25) and graph facts by vector, and fuse the rankings.
+        
+        Each list's scores are scaled to [0, 1] by its best score and combined
+        as text_weight * lexical + (1 - text_weight) * vector. Queries that
+        consist only of identifiers (e.g. "zone_045") are answered from the
+        lexical index alone when it knows them, without embedding the query.
+        
+        Args:
+            query: Search query
+            limit: Maximum number of results
+            text_weight: Weight of the lexical ranking (0-1)
+            query_vector: Precomputed query embedding for the vector search
+            namespace: Namespace to search (default: the active namespace)
+        
+        Returns:
+            Fused results (episodes and facts, each tagged with its kind) and
+            the search method used
+        """
+        group_id = self._resolve_namespace(namespace)
+        return await self.single_flight.do(
+            ("hybrid_search", self.search_cache.generation, normalize_query(query), limit, text_weight, group_id),
+            lambda: self._hybrid_search(query, limit, text_weight, query_vector, group_id)
+        )
+    
+    async def _hybrid_search(
+        self,
+        query: str,
+        limit: int,
+        text_weight: float,
+        query_vector: Optional[List[float]],
+        group_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """hybrid_search without request coalescing."""
+        text_weight = min(max(text_weight, 0.0), 1.0)
+        
+        lexical_hits = []
+        if text_weight > 0:
+            try:
+                with metrics.phase("search"):
+                    index = await self._get_lexical_index(group_id)
+                    lexical_hits = [
+                        {**index.document(doc_id), "kind": "episode", "score": score}
+                        for doc_id, score in index.search(query, limit)
+                    ]
+            except Exception as e:
+                logger.error(f"Lexical search failed: {e}")
+                metrics.record_error(e)
+        
+        identifiers = find_identifiers(query)
+        if lexical_hits and is_identifier_query(query):
+            exact = set.intersection(*(set(index.lookup(identifier)) for identifier in identifiers))
+            exact_hits = [hit for hit in lexical_hits if hit["uuid"] in exact]
+            if exact_hits:
+                for hit in exact_hits:
+                    hit["score"] = round(hit["score"], 4)
+                return {"query": query, "results": exact_hits, "search_method": "lexical_exact"}
+        
+        vector_hits = []
+        if text_weight < 1:
+            vector_hits = [
+                {**result, "kind": "fact"}
+                for result in await self.search(query, limit=limit, query_vector=query_vector, namespace=group_id or "")
+            ]
+        
+        with metrics.phase("rerank"):
+            fused: Dict[str, Dict[str, Any]] = {}
+            for hits, weight in ((lexical_hits, text_weight), (vector_hits, 1 - text_weight)):
+                if not hits:
+                    continue
+                scores = [hit["score"] if hit.get("score") is not None else 1.0 / (rank + 1) for rank, hit in enumerate(hits)]
+                best = max(scores) or 1.0
+                for hit, score in zip(hits, scores):
+                    entry = fused.setdefault(hit["uuid"], {**hit, "score": 0.0})
+                    entry["score"] += weight * score / best
+            
+            results = sorted(fused.values(), key=lambda hit: -hit["score"])[:limit]
+        for result in results:
+            result["score"] = round(result["score"], 4)
+        return {"query": query, "results": results, "search_method": "hybrid_bm25_vector"}
+    
+    async def _match_entities(self, entity_name: str, group_id: Optional[str]) -> List[Any]:
+        """Entity records matching a UUID or name (exact matches win over partial ones)."""
+        seeds, _, _ = await self.graphiti.driver.execute_query(
+            TRAVERSAL_SEED_QUERY, entity=entity_name, group_id=group_id, seed_limit=5
+        )
+        if any(record["exact"] for record in seeds):
+            seeds = [record for record in seeds if record["exact"]]
+        return seeds
+    
+    async def _expand_hop(
+        self,
+        frontier: List[str],
+        relationship_types: Optional[List[str]],
+        group_id: Optional[str],
+        fan_out: int
+    ) -> List[Any]:
+        """Edge and neighbour records of one traversal hop (newest fan_out edges per frontier entity)."""
+        records, _, _ = await self.graphiti.driver.execute_query(
+            TRAVERSAL_HOP_QUERY,
+            frontier=frontier,
+            relationship_types=relationship_types,
+            group_id=group_id,
+            fan_out=fan_out
+        )
+        return records
+    
     async def get_related_entities(
         self,
         entity_name: str,
         relationship_types: Optional[List[str]] = None,
-        depth: int = 1
+        depth: int = 1,
+        limit: int = GRAPH_TRAVERSAL_LIMIT,
+        fan_out: int = GRAPH_TRAVERSAL_FAN_OUT,
+        namespace: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        Get entities related to a given entity using Graphiti search.
+        Get entities related to a given entity by breadth-first traversal.
+        
+        Runs one Cypher query per hop directly on the Neo4j driver (no
+        embedding or reranking calls), following RELATES_TO edges in both
+        directions.
         
         Args:
-            entity_name: Name of the entity
-            relationship_types: Types of relationships to follow (not used with Graphiti)
-            depth: Maximum depth to traverse (not used with Graphiti)
+            entity_name: Entity name or UUID (partial names match when there is no exact match)
+            relationship_types: Relationship names to follow (e.g. LOCATED_IN); all when None
+            depth: Maximum number of hops (capped at GRAPH_TRAVERSAL_MAX_DEPTH)
+            limit: Maximum number of entities returned, start entities included
+            fan_out: Maximum edges followed per entity per hop (newest first)
+            namespace: Namespace to traverse (default: the active namespace)
         
         Returns:
-            Related entities and relationships
+            Start entities, related entities (with their hop distance) and the
+            relationships between them
         """
+        group_id = self._resolve_namespace(namespace)
+        return await self.single_flight.do(
+            ("related", self.search_cache.generation, entity_name, tuple(relationship_types or ()), depth, limit,
+             fan_out, group_id),
+            lambda: self._get_related_entities(entity_name, relationship_types, depth, limit, fan_out, group_id)
+        )
+    
+    async def _get_related_entities(
+        self,
+        entity_name: str,
+        relationship_types: Optional[List[str]],
+        depth: int,
+        limit: int,
+        fan_out: int,
+        group_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """get_related_entities without request coalescing."""
         if not self._initialized:
             await self.initialize()
         
-        # Use Graphiti search to find related information about the entity
-        results = await self.graphiti.search(f"relationships involving {entity_name}")
+        depth = max(1, min(depth, GRAPH_TRAVERSAL_MAX_DEPTH))
+        types = [t.strip().upper().replace(" ", "_") for t in relationship_types] if relationship_types else None
         
-        # Extract entity information from the search results
-        related_entities = set()
-        facts = []
+        with metrics.phase("search"):
+            seeds = await self._match_entities(entity_name, group_id)
         
-        for result in results:
-            facts.append({
-                "fact": result.fact,
-                "uuid": str(result.uuid),
-                "valid_at": str(result.valid_at) if hasattr(result, 'valid_at') and result.valid_at else None
-            })
+        entities: Dict[str, Dict[str, Any]] = {}
+        for record in seeds[:limit]:
+            entities[record["uuid"]] = {
+                "uuid": record["uuid"],
+                "name": record["name"],
+                "summary": record["summary"],
+                "labels": [label for label in record["labels"] if label != "Entity"],
+                "depth": 0
+            }
+        
+        relationships: Dict[str, Dict[str, Any]] = {}
+        frontier = list(entities)
+        truncated = False
+        
+        for hop in range(1, depth + 1):
+            if not frontier:
+                break
+            with metrics.phase("search"):
+                records = await self._expand_hop(frontier, types, group_id, fan_out)
             
-            # Simple entity extraction from fact text (could be enhanced)
-            if entity_name.lower() in result.fact.lower():
-                related_entities.add(entity_name)
+            next_frontier = []
+            for record in records:
+                node_uuid = record["node_uuid"]
+                if node_uuid not in entities:
+                    if len(entities) >= limit:
+                        truncated = True
+                        continue
+                    entities[node_uuid] = {
+                        "uuid": node_uuid,
+                        "name": record["node_name"],
+                        "summary": record["node_summary"],
+                        "labels": [label for label in record["node_labels"] if label != "Entity"],
+                        "depth": hop
+                    }
+                    next_frontier.append(node_uuid)
+                
+                if record["uuid"] not in relationships:
+                    relationships[record["uuid"]] = {
+                        "uuid": record["uuid"],
+                        "name": record["name"],
+                        "fact": record["fact"],
+                        "source_node_uuid": record["source_uuid"],
+                        "target_node_uuid": record["target_uuid"],
+                        "valid_at": str(record["valid_at"]) if record["valid_at"] else None,
+                        "invalid_at": str(record["invalid_at"]) if record["invalid_at"] else None
+                    }
+            frontier = next_frontier
         
         return {
             "central_entity": entity_name,
-            "related_facts": facts,
-            "search_method": "graphiti_semantic_search"
+            "matched_entities": [uuid for uuid, entity in entities.items() if entity["depth"] == 0],
+            "related_entities": [entity for entity in entities.values() if entity["depth"] > 0],
+            "relationships": list(relationships.values()),
+            "depth": depth,
+            "truncated": truncated,
+            "search_method": "cypher_traversal"
         }
     
     async def get_entity_timeline(
         self,
         entity_name: str,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
-    ) -> List[Dict[str, Any]]:
+        end_date: Optional[datetime] = None,
+        limit: int = GRAPH_TIMELINE_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        namespace: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
-        Get timeline of facts for an entity using Graphiti.
+        Get one page of an entity's facts in chronological order.
+        
+        Facts are the entity's RELATES_TO edges ordered by (valid_at, uuid).
+        A fact is in the window when it became valid before end_date and was
+        not invalidated before start_date; facts without a valid_at cannot be
+        placed on a timeline and are left out.
         
         Args:
-            entity_name: Name of the entity
-            start_date: Start of time range (not currently used)
-            end_date: End of time range (not currently used)
+            entity_name: Entity name or UUID
+            start_date: Start of time range (naive datetimes are taken as UTC)
+            end_date: End of time range (naive datetimes are taken as UTC)
+            limit: Maximum facts per page
+            cursor: next_cursor of the previous page
+            namespace: Namespace to read (default: the active namespace)
         
         Returns:
-            Timeline of facts
+            Facts of this page and the cursor of the next one (None on the last page)
         """
+        group_id = self._resolve_namespace(namespace)
+        return await self.single_flight.do(
+            ("timeline", self.search_cache.generation, entity_name, start_date, end_date, limit, cursor, group_id),
+            lambda: self._get_entity_timeline(entity_name, start_date, end_date, limit, cursor, group_id)
+        )
+    
+    async def _get_entity_timeline(
+        self,
+        entity_name: str,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        limit: int,
+        cursor: Optional[str],
+        group_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """get_entity_timeline without request coalescing."""
         if not self._initialized:
             await self.initialize()
         
-        # Search for temporal information about the entity
-        results = await self.graphiti.search(f"timeline history of {entity_name}")
+        after = _decode_timeline_cursor(cursor) if cursor else None
+        with metrics.phase("search"):
+            seeds = await self._match_entities(entity_name, group_id)
+            uuids = [record["uuid"] for record in seeds]
+            records = await self._fetch_timeline(
+                uuids, _to_datetime(start_date), _to_datetime(end_date), group_id, after, limit + 1
+            )
         
-        timeline = []
-        for result in results:
-            timeline.append({
-                "fact": result.fact,
-                "uuid": str(result.uuid),
-                "valid_at": str(result.valid_at) if hasattr(result, 'valid_at') and result.valid_at else None,
-                "invalid_at": str(result.invalid_at) if hasattr(result, 'invalid_at') and result.invalid_at else None
-            })
+        page = records[:limit]
+        with metrics.phase("serialize"):
+            facts = [
+                {
+                    "fact": record["fact"],
+                    "uuid": record["uuid"],
+                    "name": record["name"],
+                    "source_node_uuid": record["source_uuid"],
+                    "target_node_uuid": record["target_uuid"],
+                    "valid_at": _to_datetime(record["valid_at"]).isoformat(),
+                    "invalid_at": _to_datetime(record["invalid_at"]).isoformat() if record["invalid_at"] else None
+                }
+                for record in page
+            ]
         
-        # Sort by valid_at if available
-        timeline.sort(key=lambda x: x.get('valid_at') or '', reverse=True)
+        next_cursor = None
+        if len(records) > limit:
+            next_cursor = _encode_timeline_cursor(_to_datetime(page[-1]["valid_at"]), page[-1]["uuid"])
         
-        return timeline
+        return {
+            "entity": entity_name,
+            "matched_entities": uuids,
+            "facts": facts,
+            "next_cursor": next_cursor
+        }
     
-    async def get_graph_statistics(self) -> Dict[str, Any]:
+    async def _fetch_timeline(
+        self,
+        uuids: List[str],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        group_id: Optional[str],
+        after: Optional[tuple],
+        limit: int
+    ) -> List[Any]:
+        """Edge records of the entities' timeline window, ordered by (valid_at, uuid) and starting after a cursor."""
+        conditions = ["r.valid_at IS NOT NULL"]
+        params: Dict[str, Any] = {"uuids": uuids, "limit": limit}
+        if end_date:
+            conditions.append("r.valid_at <= $end_date")
+            params["end_date"] = end_date
+        if start_date:
+            conditions.append("(r.invalid_at IS NULL OR r.invalid_at >= $start_date)")
+            params["start_date"] = start_date
+        if group_id:
+            conditions.append("r.group_id = $group_id")
+            params["group_id"] = group_id
+        if after:
+            params["cursor_valid_at"], params["cursor_uuid"] = after
+            conditions.append(
+                "(r.valid_at > $cursor_valid_at OR (r.valid_at = $cursor_valid_at AND r.uuid > $cursor_uuid))"
+            )
+        
+        query = f"""
+        MATCH (n:Entity)-[r:RELATES_TO]-(:Entity)
+        WHERE n.uuid IN $uuids AND {" AND ".join(conditions)}
+        WITH DISTINCT r
+        RETURN r.uuid AS uuid, r.name AS name, r.fact AS fact, r.valid_at AS valid_at, r.invalid_at AS invalid_at,
+               startNode(r).uuid AS source_uuid, endNode(r).uuid AS target_uuid
+        ORDER BY r.valid_at, r.uuid
+        LIMIT $limit
+        """
+        records, _, _ = await self.graphiti.driver.execute_query(query, **params)
+        return records
+    
+    async def batch_search(
+        self,
+        queries: List[Dict[str, Any]],
+        namespace: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
-        Get basic statistics about the knowledge graph.
+        Run several lookups concurrently and return their results by key.
+        
+        Query texts that need a vector search are embedded together in one
+        create_batch call up front; each search then reuses its vector.
+        
+        Args:
+            queries: Dicts with query_type (search, hybrid, relationships or
+                timeline), query (search text or entity name) and optional key,
+                limit, text_weight, depth, relationship_types, start_date and
+                end_date (ISO strings or datetimes)
+            namespace: Namespace all queries read (default: the active namespace)
         
         Returns:
-            Graph statistics
+            Result (or error) of every query under its key, in request order
+        """
+        if len(queries) > GRAPH_BATCH_MAX_QUERIES:
+            raise ValueError(f"At most {GRAPH_BATCH_MAX_QUERIES} queries per batch (got {len(queries)})")
+        
+        keyed = {}
+        for position, query in enumerate(queries):
+            key = query.get("key") or f"q{position}"
+            keyed[key if key not in keyed else f"{key}_{position}"] = query
+        
+        # One embedding call for every text that will hit the vector index
+        embed_texts = list(dict.fromkeys(
+            query["query"].replace("\n", " ") for query in keyed.values()
+            if query.get("query_type", "search") == "search"
+            or (query.get("query_type") == "hybrid"
+                and (query.get("text_weight") is None or query["text_weight"] < 1)
+                and not is_identifier_query(query["query"]))
+        ))
+        vectors: Dict[str, List[float]] = {}
+        if embed_texts:
+            if not self._initialized:
+                await self.initialize()
+            try:
+                with metrics.phase("embed"):
+                    embeddings = await self._embed_batch(embed_texts)
+                vectors = dict(zip(embed_texts, embeddings))
+            except Exception as e:
+                logger.warning(f"Batch embedding failed, embedding queries individually: {e}")
+        
+        def as_datetime(value: Any) -> Optional[datetime]:
+            return datetime.fromisoformat(value) if isinstance(value, str) else value
+        
+        def run(query: Dict[str, Any]):
+            query_type = query.get("query_type", "search")
+            text = query["query"]
+            vector = vectors.get(text.replace("\n", " "))
+            if query_type == "search":
+                return self.search(text, limit=query.get("limit") or 10, query_vector=vector, namespace=namespace)
+            if query_type == "hybrid":
+                text_weight = query["text_weight"] if query.get("text_weight") is not None else 0.3
+                return self.hybrid_search(text, limit=query.get("limit") or 10, text_weight=text_weight,
+                                          query_vector=vector, namespace=namespace)
+            if query_type == "relationships":
+                return self.get_related_entities(
+                    text,
+                    relationship_types=query.get("relationship_types"),
+                    depth=query.get("depth") or 1,
+                    limit=query.get("limit") or GRAPH_TRAVERSAL_LIMIT,
+                    namespace=namespace
+                )
+            if query_type == "timeline":
+                return self.get_entity_timeline(
+                    text,
+                    start_date=as_datetime(query.get("start_date")),
+                    end_date=as_datetime(query.get("end_date")),
+                    limit=query.get("limit") or GRAPH_TIMELINE_PAGE_SIZE,
+                    namespace=namespace
+                )
+            raise ValueError(f"Unknown query_type: {query_type}")
+        
+        async def run_safely(query: Dict[str, Any]):
+            try:
+                return await run(query)
+            except Exception as e:
+                logger.error(f"Batch query {query.get('query_type', 'search')}:{query.get('query')} failed: {e}")
+                metrics.record_error(e)
+                return {"error": str(e)}
+        
+        results = await asyncio.gather(*(run_safely(query) for query in keyed.values()))
+        return {
+            "results": {
+                key: {"query_type": query.get("query_type", "search"), "query": query["query"], "result": result}
+                for (key, query), result in zip(keyed.items(), results)
+            },
+            "embedded_queries": len(vectors)
+        }
+    
+    async def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts with one embedder call."""
+        return await self.graphiti.embedder.create_batch(texts)
+    
+    async def prewarm_embedding_cache(self, texts: List[str]) -> int:
+        """
+        Embed and persist texts agents are likely to search for.
+        
+        Args:
+            texts: Texts to pre-warm (see embedding_cache.venue_vocabulary)
+        
+        Returns:
+            Number of newly cached embeddings (0 when the cache is disabled)
         """
         if not self._initialized:
             await self.initialize()
         
-        # For now, return a simple search to verify the graph is working
-        # More detailed statistics would require direct Neo4j access
+        if self.embedding_cache is None:
+            return 0
+        return await self.embedding_cache.prewarm(text.replace("\n", " ") for text in texts)
+    
+    def get_search_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get search cache counters.
+        
+        Returns:
+            Cache size, hits, misses, hit rate, evictions, expirations and invalidations
+        """
+        return self.search_cache.stats()
+    
+    def collect_metrics(self) -> List[tuple]:
+        """Search cache, embedding cache, single-flight, dependency and startup counters as metrics samples."""
+        samples = [("graph_client_initialized", "gauge", "Whether the graph client is initialized", {},
+                    int(self._initialized))]
+        caches = [("graph_search_cache", self.search_cache.stats())]
+        if self.embedding_cache:
+            caches.append(("graph_embedding_cache", self.embedding_cache.stats()))
+        for prefix, stats in caches:
+            samples += [
+                (f"{prefix}_entries", "gauge", "Cached entries", {}, stats["size"]),
+                (f"{prefix}_hits_total", "counter", "Cache hits", {}, stats["hits"]),
+                (f"{prefix}_misses_total", "counter", "Cache misses", {}, stats["misses"])
+            ]
+        single_flight = self.single_flight.stats()
+        samples += [
+            ("graph_single_flight_in_flight", "gauge", "Distinct graph queries executing", {}, single_flight["in_flight"]),
+            ("graph_single_flight_executions_total", "counter", "Graph queries executed", {},
+             single_flight["executions"]),
+            ("graph_single_flight_coalesced_total", "counter", "Graph queries answered by an identical in-flight query",
+             {}, single_flight["coalesced"])
+        ]
+        for name, caller in self.dependencies.items():
+            stats = caller.stats()
+            labels = {"dependency": name}
+            samples += [
+                ("graph_dependency_breaker_state", "gauge", "Circuit breaker state (0 closed, 1 half open, 2 open)",
+                 labels, BREAKER_STATE_VALUES[stats["state"]]),
+                ("graph_dependency_calls_total", "counter", "Calls sent to the dependency", labels, stats["calls"]),
+                ("graph_dependency_failures_total", "counter", "Failed or timed out dependency calls", labels,
+                 stats["failures"]),
+                ("graph_dependency_rejected_total", "counter", "Calls rejected by the open circuit breaker", labels,
+                 stats["rejected"]),
+                ("graph_dependency_hedged_total", "counter", "Calls that started a hedged second request", labels,
+                 stats["hedged"]),
+                ("graph_dependency_hedge_wins_total", "counter", "Calls answered by the hedged request", labels,
+                 stats["hedge_wins"]),
+                ("graph_dependency_fallbacks_total", "counter", "Searches served in degraded mode", labels,
+                 stats["fallbacks"])
+            ]
+        samples += [
+            ("graph_startup_phase_seconds", "gauge", "Seconds spent per phase of the last initialize()", {"phase": name},
+             seconds)
+            for name, seconds in self.startup_timings.items()
+        ]
+        return samples
+    
+    async def _run_read_query(self, query: str, **params: Any) -> List[Any]:
+        """Run a read-only Cypher query without initializing Graphiti."""
+        if self.graphiti:
+            records, _, _ = await self.graphiti.driver.execute_query(query, **params)
+            return records
+        
+        if self._stats_driver is None:
+            self._stats_driver = AsyncGraphDatabase.driver(self.neo4j_uri, auth=(self.neo4j_user, self.neo4j_password))
+        records, _, _ = await self._stats_driver.execute_query(query, parameters_=params, database_="neo4j")
+        return records
+    
+    async def _count_graph(self) -> Dict[str, Any]:
+        """Count nodes per label, edges per type and episodes per source."""
+        started = time.perf_counter()
+        
+        labels = [r["label"] for r in await self._run_read_query("CALL db.labels() YIELD label RETURN label")]
+        types = [
+            r["relationshipType"]
+            for r in await self._run_read_query("CALL db.relationshipTypes() YIELD relationshipType RETURN relationshipType")
+        ]
+        
+        # Single-label / single-type counts are answered from Neo4j's count store
+        count_queries = ["MATCH (n) RETURN 'node' AS kind, '' AS name, count(n) AS count",
+                         "MATCH ()-[r]->() RETURN 'edge' AS kind, '' AS name, count(r) AS count"]
+        count_queries += [
+            f"MATCH (n:{_cypher_name(label)}) RETURN 'node' AS kind, {json.dumps(label)} AS name, count(n) AS count"
+            for label in labels
+        ]
+        count_queries += [
+            f"MATCH ()-[r:{_cypher_name(rel_type)}]->() RETURN 'edge' AS kind, {json.dumps(rel_type)} AS name, count(r) AS count"
+            for rel_type in types
+        ]
+        counts = await self._run_read_query(" UNION ALL ".join(count_queries))
+        
+        episodes = await self._run_read_query(
+            "MATCH (e:Episodic) "
+            "RETURN e.source_description AS source, e.group_id AS namespace, count(e) AS count, "
+            "max(e.created_at) AS last_created_at"
+        )
+        last_ingest = max((_to_datetime(r["last_created_at"]) for r in episodes if r["last_created_at"]), default=None)
+        
+        return {
+            "total_nodes": next(r["count"] for r in counts if r["kind"] == "node" and not r["name"]),
+            "total_edges": next(r["count"] for r in counts if r["kind"] == "edge" and not r["name"]),
+            "nodes_by_label": {r["name"]: r["count"] for r in counts if r["kind"] == "node" and r["name"]},
+            "edges_by_type": {r["name"]: r["count"] for r in counts if r["kind"] == "edge" and r["name"]},
+            "episodes_by_source": _sum_by(episodes, "source", "unknown"),
+            "episodes_by_namespace": _sum_by(episodes, "namespace", ""),
+            "last_ingest_at": last_ingest.isoformat() if last_ingest else None,
+            "counted_at": datetime.now(timezone.utc).isoformat(),
+            "query_ms": round((time.perf_counter() - started) * 1000, 1)
+        }
+    
+    async def get_graph_statistics(self) -> Dict[str, Any]:
+        """
+        Get statistics about the knowledge graph.
+        
+        Counts come from cheap Cypher count queries and are reused for
+        GRAPH_STATS_TTL seconds. This does not initialize Graphiti (no LLM or
+        embedder), so it is safe to poll from health/metrics endpoints.
+        
+        Returns:
+            Node counts by label, edge counts by type, episode counts by
+            source and namespace, last ingest time, cache statistics and the
+            circuit breaker/hedging state of each Gemini dependency
+        """
         try:
-            test_results = await self.graphiti.search("test")
-            return {
-                "graphiti_initialized": True,
-                "sample_search_results": len(test_results),
-                "note": "Detailed statistics require direct Neo4j access"
-            }
+            counts = self.stats_cache.get("graph")
+            if counts is None:
+                generation = self.stats_cache.generation
+                counts = await self._count_graph()
+                self.stats_cache.set("graph", counts, generation=generation)
         except Exception as e:
+            logger.error(f"Failed to collect graph statistics: {e}")
             return {
-                "graphiti_initialized": False,
+                "graphiti_initialized": self._initialized,
                 "error": str(e)
             }
+        
+        return {
+            **counts,
+            "graphiti_initialized": self._initialized,
+            "namespace": self.namespace or "",
+            "search_cache": self.search_cache.stats(),
+            "embedding_cache": self.embedding_cache.stats() if self.embedding_cache else None,
+            "single_flight": self.single_flight.stats(),
+            "dependencies": {name: caller.stats() for name, caller in self.dependencies.items()},
+            "startup_timings": dict(self.startup_timings)
+        }
     
     async def clear_graph(self):
         """Clear all data from the graph (USE WITH CAUTION)."""
@@ -311,6 +1422,12 @@ class GraphitiClient:
         try:
             # Use Graphiti's proper clear_data function with the driver
             await clear_data(self.graphiti.driver)
+            # Indices survive clear_data but the marker node does not
+            await self.graphiti.driver.execute_query(
+                SCHEMA_MARKER_WRITE_QUERY, name=SCHEMA_MARKER_NAME, version=_schema_version()
+            )
+            self.search_cache.clear()
+            self.stats_cache.clear()
             logger.warning("Cleared all data from knowledge graph")
         except Exception as e:
             logger.error(f"Failed to clear graph using clear_data: {e}")
@@ -318,50 +1435,93 @@ class GraphitiClient:
             if self.graphiti:
                 await self.graphiti.close()
             
-            # Create OpenAI-compatible clients for reinitialization
-            llm_config = LLMConfig(
-                # api_key=self.llm_api_key,  # Not used for Vertex AI - uses ADC or service account
-                model=self.llm_choice,
-                # base_url="https://generativelanguage.googleapis.com/v1beta",  # Remove for Vertex AI - uses default
-                # small_model=self.llm_choice,
-            )
-            
-            llm_client = GeminiClient(config=llm_config)
-            
-            embedder = GeminiEmbedder(
-                config=GeminiEmbedderConfig(
-                    # api_key=self.embedding_api_key,  # Not used for Vertex AI - uses ADC or service account
-                    embedding_model=self.embedding_model,
-                    embedding_dim=self.embedding_dimensions,
-                    # base_url="https://generativelanguage.googleapis.com/v1beta",  # Remove for Vertex AI - uses default
-                )
-            )
-            
-            self.graphiti = Graphiti(
-                self.neo4j_uri,
-                self.neo4j_user,
-                self.neo4j_password,
-                llm_client=llm_client,
-                embedder=embedder,
-                cross_encoder=GeminiRerankerClient(client=llm_client, config=llm_config)
-            )
-            await self.graphiti.build_indices_and_constraints()
+            self.graphiti = self._build_graphiti()
+            await self._ensure_schema(force=True)
+            self.search_cache.clear()
+            self.stats_cache.clear()
             
             logger.warning("Reinitialized Graphiti client (fresh indices created)")
+    
+    async def drop_namespace(self, namespace: str):
+        """
+        Delete one namespace's episodes, entities and facts, leaving the rest of the graph.
+        
+        Args:
+            namespace: Namespace (Graphiti group_id) of a finished event
+        """
+        group_id = self._resolve_namespace(namespace)
+        if not group_id:
+            raise ValueError("drop_namespace needs a non-empty namespace")
+        
+        if not self._initialized:
+            await self.initialize()
+        
+        await self._delete_namespace(group_id)
+        self.search_cache.clear()
+        self.stats_cache.clear()
+        self.lexical_indexes.pop(group_id, None)
+        self._lexical_index_state.pop(group_id, None)
+        logger.warning(f"Dropped namespace {group_id} from knowledge graph")
+    
+    async def _delete_namespace(self, group_id: str):
+        """Delete the nodes and edges of a namespace."""
+        await clear_data(self.graphiti.driver, group_ids=[group_id])
+
+
+# Process-wide client shared by all tools and sub-agents (one Neo4j connection pool)
+_graph_client: Optional[GraphitiClient] = None
+
+
+def create_graph_client(backend: Optional[str] = None, **kwargs: Any) -> GraphitiClient:
+    """
+    Create a graph client for a storage backend.
+    
+    Args:
+        backend: "neo4j" or "memory" (default: GRAPH_BACKEND)
+        **kwargs: Client constructor arguments (e.g. namespace)
+    
+    Returns:
+        GraphitiClient, or InMemoryGraphitiClient for the memory backend
+    """
+    backend = (backend or GRAPH_BACKEND).lower()
+    if backend == "memory":
+        try:
+            from .memory_backend import InMemoryGraphitiClient
+        except ImportError:
+            from memory_backend import InMemoryGraphitiClient
+        return InMemoryGraphitiClient(**kwargs)
+    if backend == "neo4j":
+        return GraphitiClient(**kwargs)
+    raise ValueError(f"Unknown GRAPH_BACKEND: {backend} (expected neo4j or memory)")
 
 
-# Global Graphiti client instance
-graph_client = GraphitiClient()
+def get_graph_client() -> GraphitiClient:
+    """
+    Get the shared graph client, creating it on first use.
+    
+    Creating the client only reads configuration; connections, LLM/embedder
+    clients and indices are set up by its first query. GRAPH_BACKEND=memory
+    selects the in-process backend instead of Neo4j.
+    
+    Returns:
+        Shared GraphitiClient
+    """
+    global _graph_client
+    if _graph_client is None:
+        _graph_client = create_graph_client()
+        metrics.register_collector(_graph_client.collect_metrics)
+    return _graph_client
 
 
 async def initialize_graph():
     """Initialize graph client."""
-    await graph_client.initialize()
+    await get_graph_client().initialize()
 
 
 async def close_graph():
     """Close graph client."""
-    await graph_client.close()
+    if _graph_client is not None:
+        await _graph_client.close()
 
 
 # Convenience functions for common operations
@@ -369,7 +1529,8 @@ async def add_to_knowledge_graph(
     content: str,
     source: str,
     episode_id: Optional[str] = None,
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[Dict[str, Any]] = None,
+    namespace: Optional[str] = None
 ) -> str:
     """
     Add content to the knowledge graph.
@@ -379,6 +1540,7 @@ async def add_to_knowledge_graph(
         source: Source of the content
         episode_id: Optional episode ID
         metadata: Optional metadata
+        namespace: Optional namespace (default: the active namespace)
     
     Returns:
         Episode ID
@@ -386,34 +1548,41 @@ async def add_to_knowledge_graph(
     if not episode_id:
         episode_id = f"episode_{datetime.now(timezone.utc).isoformat()}"
     
-    await graph_client.add_episode(
+    await get_graph_client().add_episode(
         episode_id=episode_id,
         content=content,
         source=source,
-        metadata=metadata
+        metadata=metadata,
+        namespace=namespace
     )
     
     return episode_id
 
 
 async def search_knowledge_graph(
-    query: str
+    query: str,
+    namespace: Optional[str] = None
 ) -> List[Dict[str, Any]]:
     """
     Search the knowledge graph.
     
     Args:
         query: Search query
+        namespace: Optional namespace (default: the active namespace)
     
     Returns:
         Search results
     """
-    return await graph_client.search(query)
+    return await get_graph_client().search(query, namespace=namespace)
 
 
 async def get_entity_relationships(
     entity: str,
-    depth: int = 2
+    depth: int = 2,
+    relationship_types: Optional[List[str]] = None,
+    limit: int = GRAPH_TRAVERSAL_LIMIT,
+    fan_out: int = GRAPH_TRAVERSAL_FAN_OUT,
+    namespace: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Get relationships for an entity.
@@ -421,11 +1590,22 @@ async def get_entity_relationships(
     Args:
         entity: Entity name
         depth: Maximum traversal depth
+        relationship_types: Relationship names to follow (all when None)
+        limit: Maximum number of entities returned
+        fan_out: Maximum edges followed per entity per hop
+        namespace: Optional namespace (default: the active namespace)
     
     Returns:
         Entity relationships
     """
-    return await graph_client.get_related_entities(entity, depth=depth)
+    return await get_graph_client().get_related_entities(
+        entity,
+        relationship_types=relationship_types,
+        depth=depth,
+        limit=limit,
+        fan_out=fan_out,
+        namespace=namespace
+    )
 
 
 async def test_graph_connection() -> bool:
@@ -436,8 +1616,9 @@ async def test_graph_connection() -> bool:
         True if connection successful
     """
     try:
-        await graph_client.initialize()
-        stats = await graph_client.get_graph_statistics()
+        client = get_graph_client()
+        await client.initialize()
+        stats = await client.get_graph_statistics()
         logger.info(f"Graph connection successful. Stats: {stats}")
         return True
     except Exception as e:
@@ -0,0 +1,309 @@
+"""
+Local ingestion state for incremental knowledge graph builds.
+"""
+
+import os
+import json
+import uuid
+import logging
+from typing import List, Dict, Any, Optional
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+# Default location of the local ingestion state (relative to the working directory)
+INGEST_STATE_DIR = os.getenv("INGEST_STATE_DIR", ".graph_ingest")
+
+
+class IngestManifest:
+    """
+    Records which zone episodes are already in the graph and the content hash they were built from.
+
+    Layout on disk:
+        {"version": 1, "sources": {source_name: {zone_id: {content_hash, episode_id, episode_uuid, ingested_at}}},
+         "pending_retirements": {source_name: [{zone_id, episode_uuid, since}]}}
+
+    Superseded episodes whose removal from the graph failed are kept under
+    pending_retirements until a later run retires them.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize manifest.
+
+        Args:
+            path: Manifest file path (default: <INGEST_STATE_DIR>/manifest.json)
+        """
+        self.path = path or os.path.join(INGEST_STATE_DIR, "manifest.json")
+        self._sources: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._pending: Dict[str, List[Dict[str, Any]]] = {}
+        self._dirty = False
+        self.load()
+
+    def load(self):
+        """Load the manifest from disk (an absent file is an empty manifest)."""
+        self._sources = {}
+        self._pending = {}
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        if data.get("version") != self.VERSION:
+            logger.warning(f"Ignoring ingest manifest {self.path} with unsupported version {data.get('version')}")
+            return
+
+        self._sources = data.get("sources", {})
+        self._pending = data.get("pending_retirements", {})
+        logger.info(f"Loaded ingest manifest {self.path} ({sum(len(z) for z in self._sources.values())} zones)")
+
+    def save(self):
+        """Atomically write the manifest to disk if it changed."""
+        if not self._dirty:
+            return
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(
+                {"version": self.VERSION, "sources": self._sources, "pending_retirements": self._pending},
+                f, indent=2, sort_keys=True
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def get_source(self, source_name: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the ingested zones of a source.
+
+        Args:
+            source_name: Name of the GeoJSON source
+
+        Returns:
+            Mapping of zone ID to manifest entry (a copy)
+        """
+        return dict(self._sources.get(source_name, {}))
+
+    def record(
+        self,
+        source_name: str,
+        zone_id: str,
+        content_hash: str,
+        episode_id: str,
+        episode_uuid: Optional[str]
+    ):
+        """Record that a zone has been ingested from the given content."""
+        self._sources.setdefault(source_name, {})[zone_id] = {
+            "content_hash": content_hash,
+            "episode_id": episode_id,
+            "episode_uuid": episode_uuid,
+            "ingested_at": datetime.now(timezone.utc).isoformat()
+        }
+        self._dirty = True
+
+    def remove(self, source_name: str, zone_id: str):
+        """Forget a zone that has been retired from the graph."""
+        if self._sources.get(source_name, {}).pop(zone_id, None) is not None:
+            self._dirty = True
+
+    def add_pending_retirement(self, source_name: str, zone_id: str, episode_uuid: str):
+        """Remember a superseded episode that could not be removed from the graph yet."""
+        pending = self._pending.setdefault(source_name, [])
+        if all(entry["episode_uuid"] != episode_uuid for entry in pending):
+            pending.append({
+                "zone_id": zone_id,
+                "episode_uuid": episode_uuid,
+                "since": datetime.now(timezone.utc).isoformat()
+            })
+            self._dirty = True
+
+    def pending_retirements(self, source_name: str) -> List[Dict[str, Any]]:
+        """Superseded episodes of a source still waiting to be removed (a copy)."""
+        return list(self._pending.get(source_name, []))
+
+    def retirement_done(self, source_name: str, episode_uuid: str):
+        """Forget a pending retirement once the episode has been removed."""
+        pending = self._pending.get(source_name, [])
+        remaining = [entry for entry in pending if entry["episode_uuid"] != episode_uuid]
+        if len(remaining) != len(pending):
+            if remaining:
+                self._pending[source_name] = remaining
+            else:
+                del self._pending[source_name]
+            self._dirty = True
+
+    def sources(self) -> List[str]:
+        """Names of the sources with ingested zones or pending retirements."""
+        return sorted(set(self._sources) | set(self._pending))
+
+    def remove_source(self, source_name: str):
+        """Forget every zone of a source whose data has been dropped from the graph."""
+        if self._sources.pop(source_name, None) is not None:
+            self._dirty = True
+        if self._pending.pop(source_name, None) is not None:
+            self._dirty = True
+
+
+class IngestJournal:
+    """
+    Durable, append-only log of per-chunk ingestion status (one JSON record per line).
+
+    Every run starts with a "run_started" record, followed by "started", "done"
+    or "failed" records per zone, and ends with "run_completed". A resumed run
+    reuses the run ID of the last run for the source (unless that run completed
+    without errors) and skips zones already recorded as done there.
+    """
+
+    STARTED = "started"
+    DONE = "done"
+    FAILED = "failed"
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize journal.
+
+        Args:
+            path: Journal file path (default: <INGEST_STATE_DIR>/journal.jsonl)
+        """
+        self.path = path or os.path.join(INGEST_STATE_DIR, "journal.jsonl")
+        self.run_id: Optional[str] = None
+        self._file = None
+
+    def _read_records(self) -> List[Dict[str, Any]]:
+        """Read all intact records (a torn final line from a crash is ignored)."""
+        if not os.path.exists(self.path):
+            return []
+
+        records = []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt journal record at {self.path}:{line_number}")
+        return records
+
+    def _append(self, record: Dict[str, Any]):
+        """Append a record and force it to disk."""
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+
+        record["ts"] = datetime.now(timezone.utc).isoformat()
+        self._file.write(json.dumps(record, sort_keys=True, default=str) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def start_run(self, source_name: str, resume: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Start (or resume) a run for a source.
+
+        Args:
+            source_name: Name of the GeoJSON source
+            resume: Continue the last run for this source unless it completed
+                without errors, instead of starting a new one
+
+        Returns:
+            Zone ID -> last "done" record of the resumed run (empty for a new run)
+        """
+        completed: Dict[str, Dict[str, Any]] = {}
+        self.run_id = None
+
+        if resume:
+            source_records = [r for r in self._read_records() if r.get("source_name") == source_name]
+            last_start = next(
+                (i for i in range(len(source_records) - 1, -1, -1) if source_records[i].get("status") == "run_started"),
+                None
+            )
+
+            if last_start is None:
+                logger.info(f"No previous run of {source_name} in {self.path}, starting a new one")
+            else:
+                run_id = source_records[last_start]["run_id"]
+                failed = set()
+                for record in source_records:
+                    if record.get("run_id") != run_id:
+                        continue
+                    if record.get("status") == self.DONE:
+                        completed[record["zone_id"]] = record
+                        failed.discard(record["zone_id"])
+                    elif record.get("status") in (self.STARTED, self.FAILED):
+                        completed.pop(record.get("zone_id"), None)
+                        if record.get("status") == self.FAILED:
+                            failed.add(record.get("zone_id"))
+                completion = next(
+                    (r for r in source_records[last_start + 1:]
+                     if r.get("run_id") == run_id and r.get("status") == "run_completed"),
+                    None
+                )
+
+                # Only a clean completion starts over; a run that gave up on chunks is continued
+                if completion is not None and not completion.get("errors") and not failed:
+                    completed = {}
+                    logger.info(f"Last run {run_id} of {source_name} completed cleanly, starting a new one")
+                else:
+                    self.run_id = run_id
+                    logger.info(
+                        f"Resuming run {self.run_id} of {source_name}: {len(completed)} zones already done"
+                        + (f", {len(failed)} failed" if failed else "")
+                    )
+
+        if self.run_id is None:
+            self.run_id = uuid.uuid4().hex
+
+        self._append({"run_id": self.run_id, "source_name": source_name, "status": "run_started", "resumed": bool(completed)})
+        return completed
+
+    def record(
+        self,
+        source_name: str,
+        zone_id: str,
+        status: str,
+        content_hash: Optional[str] = None,
+        episode_id: Optional[str] = None,
+        episode_uuid: Optional[str] = None,
+        error: Optional[str] = None
+    ):
+        """Append the status of one zone in the current run."""
+        record = {
+            "run_id": self.run_id,
+            "source_name": source_name,
+            "zone_id": zone_id,
+            "status": status,
+            "content_hash": content_hash,
+            "episode_id": episode_id
+        }
+        if episode_uuid:
+            record["episode_uuid"] = episode_uuid
+        if error:
+            record["error"] = error
+        self._append(record)
+
+    def complete_run(self, source_name: str, summary: Dict[str, Any]):
+        """Mark the current run as finished."""
+        self._append({
+            "run_id": self.run_id,
+            "source_name": source_name,
+            "status": "run_completed",
+            "episodes_created": summary.get("episodes_created"),
+            "errors": len(summary.get("errors", []))
+        })
+
+    def close(self):
+        """Close the journal file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,687 @@
+"""
+In-process knowledge graph backend for load tests, CI and drills without Neo4j or Vertex AI.
+
+InMemoryGraphitiClient implements the GraphitiClient interface (same methods,
+arguments and return shapes) on Python data structures. It shares the
+client's search cache, request coalescing, namespaces and result shaping,
+and replaces only the storage, extraction and embedding steps:
+
+- Text is embedded by a deterministic hashing embedder, so the same inputs
+  always give the same vectors and rankings.
+- Facts are ranked by brute-force cosine similarity, fused with BM25 over
+  the fact text for hybrid searches.
+- Entities and facts are extracted without an LLM: every venue identifier
+  (zone_045, gate_004, ...) is an entity, and each content block mentioning
+  one becomes a fact linking the episode's subject (its zone_id, or first
+  identifier) to it, named after the section it appears in.
+
+Select it for the shared client with GRAPH_BACKEND=memory.
+"""
+
+import os
+import re
+import time
+import uuid
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from graphiti_core.embedder.client import EmbedderClient
+
+try:
+    from .graph_utils import GraphitiClient, _sum_by, _to_datetime
+    from .bm25_index import BM25Index, tokenize, find_identifiers
+    from . import metrics
+except ImportError:
+    # For direct execution or testing
+    import graph_utils
+    import bm25_index
+    import metrics
+    GraphitiClient = graph_utils.GraphitiClient
+    _sum_by = graph_utils._sum_by
+    _to_datetime = graph_utils._to_datetime
+    BM25Index = bm25_index.BM25Index
+    tokenize = bm25_index.tokenize
+    find_identifiers = bm25_index.find_identifiers
+
+logger = logging.getLogger(__name__)
+
+# Dimension of the hashing embedder's vectors
+MEMORY_EMBEDDING_DIM = int(os.getenv("MEMORY_EMBEDDING_DIM", "256"))
+
+# Longest fact text kept per extracted fact
+MEMORY_FACT_MAX_CHARS = 400
+
+# Longest entity summary built from episode content
+MEMORY_SUMMARY_MAX_CHARS = 500
+
+_SECTION = re.compile(r"-{3}\s*(.+?)\s*-{3}")
+_UUID_NAMESPACE = uuid.UUID("5f0c2a3e-8d1b-4c6e-9a7f-3b2d1e0c4a5b")
+
+
+class HashingEmbedder(EmbedderClient):
+    """Deterministic embedder: signed feature hashing of word and word-bigram tokens."""
+
+    def __init__(self, dimension: int = MEMORY_EMBEDDING_DIM):
+        """
+        Initialize embedder.
+
+        Args:
+            dimension: Vector dimension
+        """
+        self.dimension = dimension
+
+    def embed(self, text: str) -> np.ndarray:
+        """Unit-length embedding of a text (all zeros when it has no tokens)."""
+        vector = np.zeros(self.dimension, dtype=np.float32)
+        tokens = tokenize(text)
+        for feature in tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]:
+            value = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+            vector[value % self.dimension] += 1.0 if value >> 63 else -1.0
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    async def create(self, input_data) -> List[float]:
+        text = input_data if isinstance(input_data, str) else " ".join(str(item) for item in input_data)
+        return self.embed(text).tolist()
+
+    async def create_batch(self, input_data_list: List[str]) -> List[List[float]]:
+        return [self.embed(text).tolist() for text in input_data_list]
+
+
+class VectorIndex:
+    """Brute-force cosine similarity index over unit vectors keyed by ID."""
+
+    def __init__(self, dimension: int):
+        """
+        Initialize index.
+
+        Args:
+            dimension: Vector dimension
+        """
+        self.dimension = dimension
+        self._vectors: Dict[str, np.ndarray] = {}
+        self._ids: List[str] = []
+        self._matrix: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def add(self, item_id: str, vector: np.ndarray):
+        """Index a vector, replacing any previous one with the same ID."""
+        self._vectors[item_id] = np.asarray(vector, dtype=np.float32)
+        self._matrix = None
+
+    def remove(self, item_id: str):
+        """Remove a vector (no-op when it is not indexed)."""
+        if self._vectors.pop(item_id, None) is not None:
+            self._matrix = None
+
+    def search(
+        self,
+        vector: np.ndarray,
+        limit: int,
+        accept: Optional[Callable[[str], bool]] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank vectors by cosine similarity to a query vector.
+
+        Args:
+            vector: Query vector (unit length)
+            limit: Maximum number of hits
+            accept: Optional filter on item IDs
+
+        Returns:
+            (item_id, similarity) pairs, most similar first
+        """
+        if not self._vectors:
+            return []
+        if self._matrix is None:
+            self._ids = list(self._vectors)
+            self._matrix = np.stack([self._vectors[item_id] for item_id in self._ids])
+
+        scores = self._matrix @ np.asarray(vector, dtype=np.float32)
+        hits = []
+        for position in np.argsort(-scores, kind="stable"):
+            item_id = self._ids[position]
+            if accept is None or accept(item_id):
+                hits.append((item_id, float(scores[position])))
+                if len(hits) >= limit:
+                    break
+        return hits
+
+
+@dataclass
+class _Episode:
+    uuid: str
+    name: str
+    content: str
+    source: str
+    group_id: str
+    reference_time: datetime
+    created_at: datetime
+    entity_uuids: Set[str] = field(default_factory=set)
+    fact_uuids: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class _Entity:
+    uuid: str
+    name: str
+    group_id: str
+    summary: str = ""
+    aliases: List[str] = field(default_factory=list)
+    episode_uuids: Set[str] = field(default_factory=set)
+    fact_uuids: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class _Fact:
+    uuid: str
+    name: str
+    fact: str
+    source_uuid: str
+    target_uuid: str
+    group_id: str
+    valid_at: datetime
+    created_at: datetime
+    invalid_at: Optional[datetime] = None
+    episode_uuids: Set[str] = field(default_factory=set)
+
+
+def _deterministic_uuid(*parts: str) -> str:
+    return str(uuid.uuid5(_UUID_NAMESPACE, "\x00".join(parts)))
+
+
+def extract_blocks(content: str) -> Tuple[List[str], List[Tuple[Optional[str], str]]]:
+    """
+    Split episode content into header lines and (section, block text) pairs.
+
+    A block is a top-level line together with its indented continuation
+    lines; "--- SECTION ---" lines name the section of the blocks below them.
+
+    Returns:
+        Lines before the first section, and the blocks of the content
+    """
+    header: List[str] = []
+    blocks: List[Tuple[Optional[str], List[str]]] = []
+    section: Optional[str] = None
+    current: Optional[List[str]] = None
+
+    for line in content.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("[Source:"):
+            current = None
+            continue
+
+        heading = _SECTION.fullmatch(stripped)
+        if heading:
+            section = re.sub(r"\s*\(.*?\)", "", heading.group(1))
+            current = None
+            continue
+
+        if current is not None and line[:1].isspace() and not stripped.startswith("•"):
+            current.append(stripped)
+            continue
+
+        current = [stripped]
+        blocks.append((section, current))
+        if section is None:
+            header.append(stripped)
+
+    return header, [(section, " ".join(lines)) for section, lines in blocks]
+
+
+def relationship_name(section: Optional[str]) -> str:
+    """Relationship name of facts found in a content section (e.g. INFRASTRUCTURE -> HAS_INFRASTRUCTURE)."""
+    if not section:
+        return "RELATED_TO"
+    return "HAS_" + (re.sub(r"[^A-Z0-9]+", "_", section.upper()).strip("_") or "ITEM")
+
+
+class InMemoryGraphitiClient(GraphitiClient):
+    """GraphitiClient storing the graph in process memory (no Neo4j, LLM or embedding API)."""
+
+    def __init__(self, namespace: Optional[str] = None, embedding_dimensions: Optional[int] = None):
+        """
+        Initialize in-memory client.
+
+        Args:
+            namespace: Active event/venue namespace (default: GRAPH_NAMESPACE; empty is unscoped)
+            embedding_dimensions: Hashing embedder dimension (default: MEMORY_EMBEDDING_DIM)
+        """
+        self.embedding_model = "hashing"
+        self.embedding_dimensions = embedding_dimensions or MEMORY_EMBEDDING_DIM
+        self.embedder = HashingEmbedder(self.embedding_dimensions)
+
+        self._init_state(namespace)
+        self._reset_graph()
+
+    def _reset_graph(self):
+        self._episodes: Dict[str, _Episode] = {}
+        self._entities: Dict[str, _Entity] = {}
+        self._facts: Dict[str, _Fact] = {}
+        self._entity_keys: Dict[Tuple[str, str], str] = {}
+        self._current_facts: Dict[Tuple[str, str, str, str], str] = {}
+        self._fact_vectors = VectorIndex(self.embedding_dimensions)
+        self._fact_text = BM25Index()
+
+    async def _initialize(self):
+        started = time.perf_counter()
+        self._initialized = True
+        self.startup_timings = {"total": round(time.perf_counter() - started, 4)}
+        logger.info(f"✓ In-memory graph backend ready (hashing embedder, {self.embedding_dimensions} dimensions)")
+
+    @staticmethod
+    def _in_group(item: Any, group_id: Optional[str]) -> bool:
+        return group_id is None or item.group_id == group_id
+
+    async def add_episode(
+        self,
+        episode_id: str,
+        content: str,
+        source: str,
+        timestamp: Optional[datetime] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        namespace: Optional[str] = None
+    ) -> str:
+        """
+        Add an episode and the entities and facts extracted from it.
+
+        Args:
+            episode_id: Unique episode identifier
+            content: Episode content
+            source: Source of the content
+            timestamp: Episode timestamp
+            metadata: Additional metadata (zone_id and zone_name name the episode's subject)
+            namespace: Namespace to add it to (default: the active namespace)
+
+        Returns:
+            Episode UUID
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        group_id = self._resolve_namespace(namespace) or ""
+        now = datetime.now(timezone.utc)
+        metadata = metadata or {}
+        episode = _Episode(
+            uuid=str(uuid.uuid4()),
+            name=episode_id,
+            content=content,
+            source=source,
+            group_id=group_id,
+            reference_time=_to_datetime(timestamp) or now,
+            created_at=now
+        )
+        self._episodes[episode.uuid] = episode
+
+        header, blocks = extract_blocks(content)
+        identifiers = [identifier for _, text in blocks for identifier in find_identifiers(text)]
+        subject_name = (metadata.get("zone_id") or (identifiers[0] if identifiers else episode_id)).lower()
+        subject = self._mention(episode, subject_name, " ".join(header))
+        if metadata.get("zone_name") and metadata["zone_name"] not in subject.aliases:
+            subject.aliases.append(metadata["zone_name"])
+
+        for section, text in blocks:
+            for target_name in dict.fromkeys(find_identifiers(text)):
+                if target_name == subject_name:
+                    continue
+                target = self._mention(episode, target_name, text)
+                fact = text if subject_name in text.lower() else f"{subject_name}: {text}"
+                self._add_fact(episode, subject, target, relationship_name(section), fact)
+
+        self._episodes_written(group_id, added=[
+            {"uuid": episode.uuid, "name": episode.name, "content": episode.content, "source": episode.source}
+        ])
+        logger.info(f"Added episode {episode_id} to in-memory graph")
+        return episode.uuid
+
+    def _mention(self, episode: _Episode, name: str, summary: str) -> _Entity:
+        """Get or create an entity of the episode's namespace and record that the episode mentions it."""
+        key = (episode.group_id, name)
+        entity = self._entities.get(self._entity_keys.get(key, ""))
+        if entity is None:
+            entity = _Entity(uuid=_deterministic_uuid(episode.group_id, name), name=name, group_id=episode.group_id)
+            self._entities[entity.uuid] = entity
+            self._entity_keys[key] = entity.uuid
+        if summary and not entity.summary:
+            entity.summary = summary[:MEMORY_SUMMARY_MAX_CHARS]
+        entity.episode_uuids.add(episode.uuid)
+        episode.entity_uuids.add(entity.uuid)
+        return entity
+
+    def _add_fact(self, episode: _Episode, source: _Entity, target: _Entity, name: str, text: str):
+        """Add a fact, invalidating the current fact of the same relationship when it changed."""
+        text = text[:MEMORY_FACT_MAX_CHARS]
+        key = (episode.group_id, source.uuid, target.uuid, name)
+        current = self._facts.get(self._current_facts.get(key, ""))
+        if current is not None and current.fact == text:
+            current.episode_uuids.add(episode.uuid)
+            episode.fact_uuids.add(current.uuid)
+            return
+        if current is not None:
+            current.invalid_at = episode.reference_time
+
+        fact = _Fact(
+            uuid=_deterministic_uuid(*key, text, episode.reference_time.isoformat()),
+            name=name,
+            fact=text,
+            source_uuid=source.uuid,
+            target_uuid=target.uuid,
+            group_id=episode.group_id,
+            valid_at=episode.reference_time,
+            created_at=episode.created_at,
+            episode_uuids={episode.uuid}
+        )
+        self._facts[fact.uuid] = fact
+        self._current_facts[key] = fact.uuid
+        source.fact_uuids.add(fact.uuid)
+        target.fact_uuids.add(fact.uuid)
+        episode.fact_uuids.add(fact.uuid)
+        self._fact_vectors.add(fact.uuid, self.embedder.embed(fact.fact))
+        self._fact_text.add(fact.uuid, fact.fact)
+
+    async def add_episodes(
+        self,
+        episodes: List[Dict[str, Any]],
+        batch_size: int = 10,
+        namespace: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Add multiple episodes (see GraphitiClient.add_episodes).
+
+        Args:
+            episodes: List of episode dicts with add_episode keyword arguments
+            batch_size: Ignored (episodes are added in process)
+            namespace: Namespace for episodes that do not name one (default: the active namespace)
+
+        Returns:
+            Results with created count, errors and episode UUIDs
+        """
+        episode_uuids: Dict[str, str] = {}
+        errors = []
+        for episode in episodes:
+            try:
+                episode_uuids[episode["episode_id"]] = await self.add_episode(
+                    **{**episode, "namespace": episode.get("namespace", namespace)}
+                )
+            except Exception as e:
+                error_msg = f"Failed to add episode {episode['episode_id']}: {str(e)}"
+                logger.error(error_msg)
+                errors.append(error_msg)
+
+        return {
+            "episodes_created": len(episode_uuids),
+            "total_chunks": len(episodes),
+            "errors": errors,
+            "episode_uuids": episode_uuids,
+            "failed_episodes": [episode["episode_id"] for episode in episodes if episode["episode_id"] not in episode_uuids],
+            "rate_limited": False
+        }
+
+    async def remove_episode(self, episode_uuid: str):
+        """
+        Remove an episode and the entities/facts only it contributed.
+
+        Args:
+            episode_uuid: UUID of the episode
+        """
+        episode = self._episodes.pop(episode_uuid, None)
+        if episode is None:
+            return
+
+        for fact_uuid in episode.fact_uuids:
+            fact = self._facts.get(fact_uuid)
+            if fact is not None:
+                fact.episode_uuids.discard(episode_uuid)
+                if not fact.episode_uuids:
+                    self._delete_fact(fact)
+        for entity_uuid in episode.entity_uuids:
+            entity = self._entities.get(entity_uuid)
+            if entity is not None:
+                entity.episode_uuids.discard(episode_uuid)
+                if not entity.episode_uuids:
+                    self._delete_entity(entity)
+
+        self._episodes_written(removed=[episode_uuid])
+        logger.info(f"Removed episode {episode_uuid} from in-memory graph")
+
+    def _delete_fact(self, fact: _Fact):
+        self._facts.pop(fact.uuid, None)
+        key = (fact.group_id, fact.source_uuid, fact.target_uuid, fact.name)
+        if self._current_facts.get(key) == fact.uuid:
+            del self._current_facts[key]
+        for entity_uuid in (fact.source_uuid, fact.target_uuid):
+            if entity_uuid in self._entities:
+                self._entities[entity_uuid].fact_uuids.discard(fact.uuid)
+        self._fact_vectors.remove(fact.uuid)
+        self._fact_text.remove(fact.uuid)
+
+    def _delete_entity(self, entity: _Entity):
+        for fact_uuid in list(entity.fact_uuids):
+            if fact_uuid in self._facts:
+                self._delete_fact(self._facts[fact_uuid])
+        self._entities.pop(entity.uuid, None)
+        self._entity_keys.pop((entity.group_id, entity.name), None)
+
+    async def _search_edges(
+        self,
+        query: str,
+        center_node_distance: int,
+        use_hybrid_search: bool,
+        limit: int,
+        center_node_uuid: Optional[str],
+        query_vector: Optional[List[float]],
+        group_id: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Rank facts by cosine similarity (fused with BM25 by reciprocal rank when hybrid)."""
+        distances: Optional[Dict[str, int]] = None
+        if center_node_uuid:
+            distances = self._node_distances(center_node_uuid, center_node_distance, group_id)
+
+        def accept(fact_uuid: str) -> bool:
+            fact = self._facts[fact_uuid]
+            if not self._in_group(fact, group_id):
+                return False
+            return distances is None or fact.source_uuid in distances or fact.target_uuid in distances
+
+        with metrics.phase("embed"):
+            vector = (
+                np.asarray(query_vector, dtype=np.float32) if query_vector is not None else self.embedder.embed(query)
+            )
+
+        candidates = limit if distances is None else len(self._facts)
+        with metrics.phase("search"):
+            ranked = self._fact_vectors.search(vector, candidates, accept)
+            lexical = [
+                (fact_uuid, score) for fact_uuid, score in self._fact_text.search(query, len(self._fact_text))
+                if accept(fact_uuid)
+            ][:candidates] if use_hybrid_search else []
+
+        with metrics.phase("rerank"):
+            if use_hybrid_search:
+                fused: Dict[str, float] = {}
+                for hits in (ranked, lexical):
+                    for rank, (fact_uuid, _) in enumerate(hits):
+                        fused[fact_uuid] = fused.get(fact_uuid, 0.0) + 1.0 / (rank + 1)
+                ranked = sorted(fused.items(), key=lambda item: (-item[1], item[0]))
+
+            if distances is not None:
+                def distance(fact_uuid: str) -> int:
+                    fact = self._facts[fact_uuid]
+                    return min(distances.get(fact.source_uuid, center_node_distance + 1),
+                               distances.get(fact.target_uuid, center_node_distance + 1))
+                ranked = sorted(ranked, key=lambda item: (distance(item[0]), -item[1]))
+
+        with metrics.phase("serialize"):
+            results = []
+            for fact_uuid, score in ranked[:limit]:
+                fact = self._facts[fact_uuid]
+                results.append({
+                    "fact": fact.fact,
+                    "uuid": fact.uuid,
+                    "valid_at": str(fact.valid_at) if fact.valid_at else None,
+                    "invalid_at": str(fact.invalid_at) if fact.invalid_at else None,
+                    "source_node_uuid": fact.source_uuid,
+                    "score": round(score, 4)
+                })
+        return results
+
+    def _node_distances(self, center_uuid: str, max_distance: int, group_id: Optional[str]) -> Dict[str, int]:
+        """Hop distance of the entities within max_distance of an entity."""
+        distances = {center_uuid: 0}
+        frontier = [center_uuid] if center_uuid in self._entities else []
+        for hop in range(1, max_distance + 1):
+            next_frontier = []
+            for entity_uuid in frontier:
+                for fact_uuid in self._entities[entity_uuid].fact_uuids:
+                    fact = self._facts[fact_uuid]
+                    other = fact.target_uuid if fact.source_uuid == entity_uuid else fact.source_uuid
+                    if self._in_group(fact, group_id) and other not in distances:
+                        distances[other] = hop
+                        next_frontier.append(other)
+            frontier = next_frontier
+        return distances
+
+    async def _load_episode_records(self, group_id: Optional[str]) -> List[Any]:
+        return [
+            {"uuid": episode.uuid, "name": episode.name, "content": episode.content, "source": episode.source}
+            for episode in self._episodes.values() if self._in_group(episode, group_id)
+        ]
+
+    async def _match_entities(self, entity_name: str, group_id: Optional[str]) -> List[Any]:
+        """Entity records matching a UUID, name or alias (exact matches win over partial ones)."""
+        needle = entity_name.lower()
+        matches = []
+        for entity in self._entities.values():
+            if not self._in_group(entity, group_id):
+                continue
+            names = [entity.name.lower()] + [alias.lower() for alias in entity.aliases]
+            exact = entity.uuid == entity_name or needle in names
+            if exact or any(needle in name for name in names):
+                matches.append({
+                    "uuid": entity.uuid,
+                    "name": entity.name,
+                    "summary": entity.summary,
+                    "labels": ["Entity"],
+                    "exact": exact
+                })
+        matches.sort(key=lambda record: (not record["exact"], len(record["name"]), record["name"]))
+        if any(record["exact"] for record in matches):
+            matches = [record for record in matches if record["exact"]]
+        return matches[:5]
+
+    async def _expand_hop(
+        self,
+        frontier: List[str],
+        relationship_types: Optional[List[str]],
+        group_id: Optional[str],
+        fan_out: int
+    ) -> List[Any]:
+        records = []
+        for entity_uuid in frontier:
+            entity = self._entities.get(entity_uuid)
+            if entity is None:
+                continue
+            facts = [
+                self._facts[fact_uuid] for fact_uuid in entity.fact_uuids
+                if self._in_group(self._facts[fact_uuid], group_id)
+                and (relationship_types is None or self._facts[fact_uuid].name in relationship_types)
+            ]
+            facts.sort(key=lambda fact: (fact.created_at, fact.uuid), reverse=True)
+            for fact in facts[:fan_out]:
+                other = self._entities[fact.target_uuid if fact.source_uuid == entity_uuid else fact.source_uuid]
+                records.append({
+                    "uuid": fact.uuid,
+                    "name": fact.name,
+                    "fact": fact.fact,
+                    "valid_at": fact.valid_at,
+                    "invalid_at": fact.invalid_at,
+                    "source_uuid": fact.source_uuid,
+                    "target_uuid": fact.target_uuid,
+                    "node_uuid": other.uuid,
+                    "node_name": other.name,
+                    "node_summary": other.summary,
+                    "node_labels": ["Entity"]
+                })
+        return records
+
+    async def _fetch_timeline(
+        self,
+        uuids: List[str],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        group_id: Optional[str],
+        after: Optional[tuple],
+        limit: int
+    ) -> List[Any]:
+        fact_uuids = {fact_uuid for entity_uuid in uuids if entity_uuid in self._entities
+                      for fact_uuid in self._entities[entity_uuid].fact_uuids}
+        facts = sorted(
+            (
+                fact for fact in map(self._facts.get, fact_uuids)
+                if fact.valid_at is not None
+                and self._in_group(fact, group_id)
+                and (end_date is None or fact.valid_at <= end_date)
+                and (start_date is None or fact.invalid_at is None or fact.invalid_at >= start_date)
+                and (after is None or (fact.valid_at, fact.uuid) > after)
+            ),
+            key=lambda fact: (fact.valid_at, fact.uuid)
+        )
+        return [
+            {
+                "uuid": fact.uuid,
+                "name": fact.name,
+                "fact": fact.fact,
+                "valid_at": fact.valid_at,
+                "invalid_at": fact.invalid_at,
+                "source_uuid": fact.source_uuid,
+                "target_uuid": fact.target_uuid
+            }
+            for fact in facts[:limit]
+        ]
+
+    async def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        return await self.embedder.create_batch(texts)
+
+    async def _count_graph(self) -> Dict[str, Any]:
+        """Count nodes, edges and episodes in the same shape as the Neo4j backend."""
+        started = time.perf_counter()
+        mentions = sum(len(episode.entity_uuids) for episode in self._episodes.values())
+        episodes: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for episode in self._episodes.values():
+            row = episodes.setdefault((episode.source, episode.group_id),
+                                      {"source": episode.source, "namespace": episode.group_id, "count": 0})
+            row["count"] += 1
+        last_ingest = max((episode.created_at for episode in self._episodes.values()), default=None)
+
+        return {
+            "total_nodes": len(self._entities) + len(self._episodes),
+            "total_edges": len(self._facts) + mentions,
+            "nodes_by_label": {"Entity": len(self._entities), "Episodic": len(self._episodes)},
+            "edges_by_type": {"RELATES_TO": len(self._facts), "MENTIONS": mentions},
+            "episodes_by_source": _sum_by(list(episodes.values()), "source", "unknown"),
+            "episodes_by_namespace": _sum_by(list(episodes.values()), "namespace", ""),
+            "last_ingest_at": last_ingest.isoformat() if last_ingest else None,
+            "counted_at": datetime.now(timezone.utc).isoformat(),
+            "query_ms": round((time.perf_counter() - started) * 1000, 1)
+        }
+
+    async def _delete_namespace(self, group_id: str):
+        for episode in [episode for episode in self._episodes.values() if episode.group_id == group_id]:
+            del self._episodes[episode.uuid]
+        for entity in [entity for entity in self._entities.values() if entity.group_id == group_id]:
+            self._delete_entity(entity)
+
+    async def clear_graph(self):
+        """Clear all data from the in-memory graph."""
+        self._reset_graph()
+        self.search_cache.clear()
+        self.stats_cache.clear()
+        self.lexical_indexes.clear()
+        self._lexical_index_state.clear()
+        logger.warning("Cleared all data from in-memory graph")
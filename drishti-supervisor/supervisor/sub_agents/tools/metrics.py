@@ -0,0 +1,374 @@
+"""
+Latency, throughput and error metrics for the graph tools, in Prometheus text format.
+
+Every ADK graph tool call runs inside tool_call(), which tracks in-flight
+calls, total latency, result counts and errors. Code further down (graph
+client, search backends) times its embed/search/rerank/serialize phases with
+phase(), which attributes them to the tool call running in the same task.
+
+Metrics are off unless GRAPH_METRICS_ENABLED is set; tool_call() and phase()
+then return shared no-op objects. When enabled, start_metrics_server() serves
+GET /metrics on GRAPH_METRICS_HOST:GRAPH_METRICS_PORT.
+"""
+
+import os
+import time
+import logging
+import threading
+from bisect import bisect_left
+from contextlib import nullcontext
+from contextvars import ContextVar
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Metrics collection and the /metrics endpoint are off unless enabled
+METRICS_ENABLED = os.getenv("GRAPH_METRICS_ENABLED", "false").lower() in ("1", "true", "yes")
+GRAPH_METRICS_HOST = os.getenv("GRAPH_METRICS_HOST", "127.0.0.1")
+GRAPH_METRICS_PORT = int(os.getenv("GRAPH_METRICS_PORT", "9464"))
+
+# Histogram buckets: seconds for latencies, items for result counts
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+RESULT_COUNT_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 1000)
+
+# (name, type, help, labels, value) sample produced by a collector at scrape time
+Sample = Tuple[str, str, str, Dict[str, str], float]
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    return "+Inf" if value == float("inf") else repr(value)
+
+
+class _Metric:
+    """Base of labelled metrics: one child value per label combination."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+        self._children: Dict[Tuple[str, ...], Any] = {}
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def _labels(self, key: Tuple[str, ...]) -> Dict[str, str]:
+        return dict(zip(self.label_names, key))
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            children = sorted(self._children.items())
+        for key, value in children:
+            lines.extend(self._render_child(self._labels(key), value))
+        return lines
+
+    def _render_child(self, labels: Dict[str, str], value: Any) -> List[str]:
+        return [f"{self.name}{_format_labels(labels)} {_format_value(value)}"]
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: str):
+        key = self._key(labels)
+        with self._lock:
+            self._children[key] = self._children.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    """Value that goes up and down."""
+
+    kind = "gauge"
+
+    def inc(self, amount: float = 1.0, **labels: str):
+        key = self._key(labels)
+        with self._lock:
+            self._children[key] = self._children.get(key, 0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str):
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str):
+        with self._lock:
+            self._children[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    """Distribution of observations over fixed buckets (cumulative on export)."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: str):
+        key = self._key(labels)
+        position = bisect_left(self.buckets, value)
+        with self._lock:
+            child = self._children.get(key)
+            if child is None:
+                child = self._children[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            child[0][position] += 1
+            child[1] += value
+
+    def _render_child(self, labels: Dict[str, str], value: Any) -> List[str]:
+        counts, total = value
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += count
+            bucket_labels = {**labels, "le": _format_value(float(bound))}
+            lines.append(f"{self.name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+        lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+        lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Metrics plus collectors that report other components' counters at scrape time."""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], Iterable[Sample]]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector: Callable[[], Iterable[Sample]]):
+        """Add a callable returning (name, type, help, labels, value) samples on every scrape."""
+        if collector not in self._collectors:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        """All metrics in Prometheus text exposition format."""
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+
+        collected: Dict[str, Tuple[str, str, List[str]]] = {}
+        for collector in self._collectors:
+            try:
+                samples = list(collector())
+            except Exception as e:
+                logger.warning(f"Metrics collector {collector} failed: {e}")
+                continue
+            for name, kind, help_text, labels, value in samples:
+                entry = collected.setdefault(name, (kind, help_text, []))
+                entry[2].append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        for name, (kind, help_text, samples) in collected.items():
+            lines.extend([f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", *samples])
+
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+TOOL_DURATION = REGISTRY.register(Histogram(
+    "graph_tool_duration_seconds", "Graph tool call latency", ("tool", "status")))
+TOOL_PHASE_DURATION = REGISTRY.register(Histogram(
+    "graph_tool_phase_seconds", "Time spent per phase (embed, search, rerank, serialize) of graph tool calls",
+    ("tool", "phase")))
+TOOL_RESULTS = REGISTRY.register(Histogram(
+    "graph_tool_results", "Number of results returned per graph tool call", ("tool",), RESULT_COUNT_BUCKETS))
+TOOL_IN_FLIGHT = REGISTRY.register(Gauge(
+    "graph_tool_in_flight", "Graph tool calls currently running", ("tool",)))
+TOOL_ERRORS = REGISTRY.register(Counter(
+    "graph_tool_errors_total", "Graph tool errors by exception type", ("tool", "error")))
+
+_current_call: ContextVar[Optional["ToolCall"]] = ContextVar("graph_tool_call", default=None)
+
+
+class ToolCall:
+    """Measures one tool call; used as a context manager around the tool body."""
+
+    __slots__ = ("tool", "status", "_started", "_token")
+
+    def __init__(self, tool: str):
+        self.tool = tool
+        self.status = "ok"
+
+    def __enter__(self) -> "ToolCall":
+        TOOL_IN_FLIGHT.inc(tool=self.tool)
+        self._token = _current_call.set(self)
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc is not None:
+            self.error(exc)
+        TOOL_DURATION.observe(time.perf_counter() - self._started, tool=self.tool, status=self.status)
+        TOOL_IN_FLIGHT.dec(tool=self.tool)
+        _current_call.reset(self._token)
+        return False
+
+    def results(self, count: int):
+        """Record the number of results returned."""
+        TOOL_RESULTS.observe(count, tool=self.tool)
+
+    def error(self, exc: BaseException):
+        """Record an error (the call is reported with status "error")."""
+        self.status = "error"
+        TOOL_ERRORS.inc(tool=self.tool, error=type(exc).__name__)
+
+
+class _NoopToolCall:
+    """Stand-in for ToolCall while metrics are disabled."""
+
+    def __enter__(self) -> "_NoopToolCall":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+    def results(self, count: int):
+        pass
+
+    def error(self, exc: BaseException):
+        pass
+
+
+class _Phase:
+    __slots__ = ("tool", "name", "_started")
+
+    def __init__(self, tool: str, name: str):
+        self.tool = tool
+        self.name = name
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        TOOL_PHASE_DURATION.observe(time.perf_counter() - self._started, tool=self.tool, phase=self.name)
+        return False
+
+
+_NOOP_CALL = _NoopToolCall()
+_NOOP_PHASE = nullcontext()
+
+
+def tool_call(tool: str):
+    """
+    Context manager measuring a graph tool call.
+
+    Args:
+        tool: Tool name used as the "tool" label
+
+    Returns:
+        ToolCall (a shared no-op object when metrics are disabled)
+    """
+    return ToolCall(tool) if METRICS_ENABLED else _NOOP_CALL
+
+
+def phase(name: str):
+    """
+    Context manager timing a phase of the tool call running in this task.
+
+    Args:
+        name: Phase name (embed, search, rerank or serialize)
+
+    Returns:
+        Timer context manager (a shared no-op outside tool calls or when disabled)
+    """
+    if not METRICS_ENABLED:
+        return _NOOP_PHASE
+    call = _current_call.get()
+    return _Phase(call.tool, name) if call is not None else _NOOP_PHASE
+
+
+def record_error(exc: BaseException):
+    """Record an error handled below the tool (e.g. a search that fell back to no results)."""
+    if METRICS_ENABLED:
+        call = _current_call.get()
+        if call is not None:
+            call.error(exc)
+
+
+def enable_metrics(enabled: bool = True):
+    """Turn metrics collection on or off at runtime (e.g. in tests)."""
+    global METRICS_ENABLED
+    METRICS_ENABLED = enabled
+
+
+def register_collector(collector: Callable[[], Iterable[Sample]]):
+    """Report another component's counters on every scrape (see MetricsRegistry.register_collector)."""
+    REGISTRY.register_collector(collector)
+
+
+def render_metrics() -> str:
+    """Current metrics in Prometheus text format."""
+    return REGISTRY.render()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = render_metrics().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_server: Optional[ThreadingHTTPServer] = None
+
+
+def start_metrics_server(host: Optional[str] = None, port: Optional[int] = None) -> Optional[ThreadingHTTPServer]:
+    """
+    Serve /metrics from a background thread (once per process).
+
+    Args:
+        host: Bind address (default: GRAPH_METRICS_HOST)
+        port: Port (default: GRAPH_METRICS_PORT; 0 picks a free port)
+
+    Returns:
+        The running server, or None when metrics are disabled or the port is unavailable
+    """
+    global _server
+    if not METRICS_ENABLED:
+        return None
+    if _server is not None:
+        return _server
+
+    host = host or GRAPH_METRICS_HOST
+    port = GRAPH_METRICS_PORT if port is None else port
+    try:
+        _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    except OSError as e:
+        logger.warning(f"Metrics endpoint not started on {host}:{port}: {e}")
+        return None
+
+    _server.daemon_threads = True
+    threading.Thread(target=_server.serve_forever, name="graph-metrics", daemon=True).start()
+    logger.info(f"✓ Serving graph tool metrics on http://{host}:{_server.server_address[1]}/metrics")
+    return _server
@@ -1,9 +1,19 @@
-from typing import Optional, TypedDict
+from typing import List, Optional, TypedDict
 from pydantic import BaseModel, Field
 
+try:
+    from .graph_settings import GRAPH_TRAVERSAL_LIMIT, GRAPH_TRAVERSAL_FAN_OUT, GRAPH_TIMELINE_PAGE_SIZE
+except ImportError:
+    # For direct execution or testing
+    import graph_settings
+    GRAPH_TRAVERSAL_LIMIT = graph_settings.GRAPH_TRAVERSAL_LIMIT
+    GRAPH_TRAVERSAL_FAN_OUT = graph_settings.GRAPH_TRAVERSAL_FAN_OUT
+    GRAPH_TIMELINE_PAGE_SIZE = graph_settings.GRAPH_TIMELINE_PAGE_SIZE
+
 class GraphSearchInput(BaseModel):
     """Input for graph search tool."""
     query: str = Field(..., description="Search query")
+    namespace: Optional[str] = Field(None, description="Event namespace to read (default: the active event)")
 
 
 class HybridSearchInput(BaseModel):
@@ -11,6 +21,7 @@ class HybridSearchInput(BaseModel):
     query: str = Field(..., description="Search query")
     limit: int = Field(default=10, description="Maximum number of results")
     text_weight: float = Field(default=0.3, description="Weight for text similarity (0-1)")
+    namespace: Optional[str] = Field(None, description="Event namespace to read (default: the active event)")
 
 class GraphSearchResult(BaseModel):
     """Knowledge graph search result model."""
@@ -24,10 +35,57 @@ class EntityRelationshipInput(BaseModel):
     """Input for entity relationship query."""
     entity_name: str = Field(..., description="Name of the entity")
     depth: int = Field(default=2, description="Maximum traversal depth")
+    relationship_types: Optional[List[str]] = Field(None, description="Relationship names to follow, e.g. LOCATED_IN, CONNECTED_TO (all when omitted)")
+    limit: int = Field(default=GRAPH_TRAVERSAL_LIMIT, description="Maximum number of entities returned, the matched start entities included")
+    fan_out: int = Field(default=GRAPH_TRAVERSAL_FAN_OUT, description="Maximum relationships followed per entity per hop")
+    namespace: Optional[str] = Field(None, description="Event namespace to read (default: the active event)")
 
 
 class EntityTimelineInput(BaseModel):
     """Input for entity timeline query."""
     entity_name: str = Field(..., description="Name of the entity")
     start_date: Optional[str] = Field(None, description="Start date (ISO format)")
-    end_date: Optional[str] = Field(None, description="End date (ISO format)")
\ No newline at end of file
+    end_date: Optional[str] = Field(None, description="End date (ISO format)")
+    limit: int = Field(default=GRAPH_TIMELINE_PAGE_SIZE, description="Maximum facts per page")
+    cursor: Optional[str] = Field(None, description="next_cursor from the previous page, to continue the timeline")
+    namespace: Optional[str] = Field(None, description="Event namespace to read (default: the active event)")
+
+class SpatialQueryInput(BaseModel):
+    """Input for venue spatial (proximity) queries."""
+    query_type: str = Field(default="nearest", description="One of: nearest, within_radius, bbox")
+    longitude: Optional[float] = Field(None, description="Longitude of the query point")
+    latitude: Optional[float] = Field(None, description="Latitude of the query point")
+    zone_id: Optional[str] = Field(None, description="Use this zone's centroid as the query point (e.g. zone_045)")
+    k: int = Field(default=5, description="Number of results for nearest queries")
+    radius_meters: float = Field(default=100.0, description="Search radius for within_radius queries")
+    min_lon: Optional[float] = Field(None, description="Bounding box west edge (bbox queries)")
+    min_lat: Optional[float] = Field(None, description="Bounding box south edge (bbox queries)")
+    max_lon: Optional[float] = Field(None, description="Bounding box east edge (bbox queries)")
+    max_lat: Optional[float] = Field(None, description="Bounding box north edge (bbox queries)")
+    kinds: Optional[List[str]] = Field(None, description="Restrict to: zone, infrastructure, entry_exit")
+    item_type: Optional[str] = Field(None, description="Zone or infrastructure type, e.g. medical_station, gate, emergency_exit")
+    operational_only: bool = Field(default=False, description="Only return operational/open items")
+
+
+class ZoneLocateInput(BaseModel):
+    """Input for mapping coordinates to venue zones."""
+    points: List[List[float]] = Field(..., description="Points as [longitude, latitude] pairs")
+
+
+class BatchQuery(BaseModel):
+    """One lookup in a batch search."""
+    key: Optional[str] = Field(None, description="Name for this lookup's result (defaults to q0, q1, ...)")
+    query_type: str = Field(default="search", description="One of: search, hybrid, relationships, timeline")
+    query: str = Field(..., description="Search text, or the entity name for relationships/timeline")
+    limit: Optional[int] = Field(None, description="Maximum number of results")
+    text_weight: Optional[float] = Field(None, description="Keyword weight for hybrid queries (0-1)")
+    depth: Optional[int] = Field(None, description="Traversal depth for relationships queries")
+    relationship_types: Optional[List[str]] = Field(None, description="Relationship names for relationships queries")
+    start_date: Optional[str] = Field(None, description="Timeline start date (ISO format)")
+    end_date: Optional[str] = Field(None, description="Timeline end date (ISO format)")
+
+
+class BatchSearchInput(BaseModel):
+    """Input for running several knowledge graph lookups in one call."""
+    queries: List[BatchQuery] = Field(..., description="Lookups to run concurrently")
+    namespace: Optional[str] = Field(None, description="Event namespace to read (default: the active event)")
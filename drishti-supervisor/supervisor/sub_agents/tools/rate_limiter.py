@@ -0,0 +1,170 @@
+"""
+Adaptive rate limiting for calls that hit the Gemini / Vertex AI quota.
+"""
+
+import re
+import asyncio
+import logging
+import random
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+# Phrases Gemini / Vertex AI use when a request is rejected for quota reasons
+RATE_LIMIT_MARKERS = ("rate limit", "quota", "resource_exhausted", "resource exhausted", "too many requests")
+
+# A bare 429 status in an error message (not part of an id, uuid or name like zone_429)
+_STATUS_429 = re.compile(r"(?<![\w-])429(?![\w-])")
+
+# gRPC / Google API status name of quota errors
+RESOURCE_EXHAUSTED = "RESOURCE_EXHAUSTED"
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """
+    Check whether an exception (or its cause) is a provider rate limit / quota error.
+
+    Args:
+        error: Exception raised by the Graphiti / Gemini client
+
+    Returns:
+        True if the error signals that we should slow down
+    """
+    while error is not None:
+        if type(error).__name__ == "RateLimitError":
+            return True
+
+        # Structured status first: HTTP code, then the gRPC / google-genai status name
+        if 429 in (getattr(error, "code", None), getattr(error, "status_code", None)):
+            return True
+        grpc_status = getattr(error, "grpc_status_code", None) or getattr(error, "status", None)
+        if getattr(grpc_status, "name", grpc_status) == RESOURCE_EXHAUSTED:
+            return True
+
+        message = str(error)
+        if _STATUS_429.search(message) or any(marker in message.lower() for marker in RATE_LIMIT_MARKERS):
+            return True
+
+        error = error.__cause__ or error.__context__
+
+    return False
+
+
+def backoff_delay(attempt: int, base_delay: float = 1.0, max_delay: float = 30.0) -> float:
+    """
+    Exponential backoff with full jitter.
+
+    Args:
+        attempt: Retry attempt number (0 for the first retry)
+        base_delay: Delay for the first retry in seconds
+        max_delay: Upper bound for a single delay in seconds
+
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+class AdaptiveRateLimiter:
+    """
+    Token-bucket rate limiter with AIMD adaptation.
+
+    The refill rate is cut multiplicatively whenever the provider reports a
+    rate limit and grows back additively on every successful call, so the
+    effective throughput settles just under the provider quota.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        min_rate: float = 0.1,
+        decrease_factor: float = 0.5,
+        increase_step: Optional[float] = None,
+        cooldown_seconds: float = 5.0
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            rate: Initial (and maximum) number of permits per second
+            burst: Bucket capacity; defaults to one second worth of permits
+            min_rate: Lower bound the rate never drops below
+            decrease_factor: Multiplier applied to the rate on a rate limit error
+            increase_step: Permits/second added back per success (default: 5% of max rate)
+            cooldown_seconds: Pause applied to all callers after a rate limit error
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.burst = burst or max(1, int(rate))
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step if increase_step is not None else rate * 0.05
+        self.cooldown_seconds = cooldown_seconds
+
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+        self.rate_limit_events = 0
+
+    def _refill(self, now: float):
+        """Add the tokens accrued since the last refill."""
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+
+    async def acquire(self):
+        """Wait until a permit is available and consume it."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        # Serialize waiters so permits are handed out in FIFO order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def on_success(self):
+        """Record a successful call (additive increase)."""
+        self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def on_rate_limited(self, retry_after: Optional[float] = None):
+        """
+        Record a rate limit error (multiplicative decrease).
+
+        Args:
+            retry_after: Provider supplied delay in seconds, if any
+        """
+        self.rate_limit_events += 1
+
+        # Concurrent callers tend to fail together; back off once per cooldown window
+        if time.monotonic() < self._blocked_until:
+            return
+
+        previous_rate = self.rate
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        self._tokens = 0.0
+
+        pause = retry_after if retry_after is not None else self.cooldown_seconds
+        self._blocked_until = max(self._blocked_until, time.monotonic() + pause)
+
+        logger.warning(
+            f"Rate limited by provider: {previous_rate:.2f} -> {self.rate:.2f} requests/sec, "
+            f"pausing {pause:.1f}s"
+        )
@@ -0,0 +1,323 @@
+"""
+Circuit breakers and hedged requests for the Gemini clients used by Graphiti.
+
+Every LLM and embedder call goes through the ResilientCaller of its
+dependency, which
+- fails fast with CircuitOpenError while the dependency's breaker is open
+  (opened after GRAPH_BREAKER_FAILURES consecutive failures, probed again
+  after GRAPH_BREAKER_RESET_SECONDS),
+- bounds the call by a timeout instead of the provider's own, and
+- for dependencies listed in GRAPH_HEDGE_DEPENDENCIES, starts a second
+  identical request once the first has been running for the dependency's
+  recent p95 latency and keeps whichever answers first.
+"""
+
+import os
+import time
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from graphiti_core.embedder.client import EmbedderClient
+from graphiti_core.llm_client import LLMClient
+
+logger = logging.getLogger(__name__)
+
+# Consecutive failures that open a dependency's breaker, and seconds it stays
+# open before a single probe request is let through
+GRAPH_BREAKER_FAILURES = int(os.getenv("GRAPH_BREAKER_FAILURES", "5"))
+GRAPH_BREAKER_RESET_SECONDS = float(os.getenv("GRAPH_BREAKER_RESET_SECONDS", "30"))
+
+# Seconds before an embedder call (search path) or an LLM call
+# (entity extraction during ingestion) is abandoned
+GRAPH_CALL_TIMEOUT = float(os.getenv("GRAPH_CALL_TIMEOUT", "5"))
+GRAPH_LLM_TIMEOUT = float(os.getenv("GRAPH_LLM_TIMEOUT", "60"))
+
+# Dependencies whose slow calls are hedged (LLM calls are long and expensive,
+# so they are not hedged unless listed), and when the hedge starts
+GRAPH_HEDGE_DEPENDENCIES = os.getenv("GRAPH_HEDGE_DEPENDENCIES", "embedder")
+GRAPH_HEDGE_PERCENTILE = float(os.getenv("GRAPH_HEDGE_PERCENTILE", "0.95"))
+GRAPH_HEDGE_MIN_DELAY = float(os.getenv("GRAPH_HEDGE_MIN_DELAY", "0.05"))  # Seconds
+
+# Successful call latencies kept per dependency, and how many are needed
+# before hedging starts
+LATENCY_WINDOW = 200
+HEDGE_MIN_SAMPLES = 20
+
+# Numeric breaker states for metrics
+BREAKER_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a dependency whose circuit breaker is open."""
+
+    def __init__(self, dependency: str, retry_after: float = 0.0):
+        """
+        Initialize error.
+
+        Args:
+            dependency: Dependency name (llm or embedder)
+            retry_after: Seconds until the breaker lets a probe through (0 while a probe is running)
+        """
+        super().__init__(f"Circuit breaker for {dependency} is open")
+        self.dependency = dependency
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    closed: calls go through. open: calls are rejected until reset_seconds
+    have passed. half_open: one probe call goes through; its success closes
+    the breaker, its failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 30.0):
+        """
+        Initialize breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            reset_seconds: Seconds the breaker stays open before a probe
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.opened = 0
+        self.rejected = 0
+        self._probing = False
+
+    def allow(self) -> bool:
+        """Whether a call may go through now (claims the probe when half open)."""
+        if self.state == "closed":
+            return True
+        if self.state == "open" and time.monotonic() - self.opened_at >= self.reset_seconds:
+            self.state = "half_open"
+            self._probing = False
+        if self.state == "half_open" and not self._probing:
+            self._probing = True
+            return True
+        self.rejected += 1
+        return False
+
+    def retry_after(self) -> float:
+        """Seconds until an open breaker lets a probe through (0 when closed, half open or due)."""
+        if self.state != "open":
+            return 0.0
+        return max(0.0, self.opened_at + self.reset_seconds - time.monotonic())
+
+    def record_success(self):
+        if self.state != "closed":
+            logger.info("✓ Circuit breaker closed after a successful probe")
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self._probing = False
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        if self.state == "half_open" or (
+            self.state == "closed" and self.consecutive_failures >= self.failure_threshold
+        ):
+            self.state = "open"
+            self.opened_at = time.monotonic()
+            self.opened += 1
+        self._probing = False
+
+    def release(self):
+        """Give up a claimed probe without an outcome (the call was cancelled)."""
+        self._probing = False
+
+
+class ResilientCaller:
+    """Breaker, timeout and hedging around the calls to one dependency."""
+
+    def __init__(
+        self,
+        name: str,
+        timeout: float = GRAPH_CALL_TIMEOUT,
+        hedge: bool = False,
+        breaker: Optional[CircuitBreaker] = None
+    ):
+        """
+        Initialize caller.
+
+        Args:
+            name: Dependency name (llm or embedder)
+            timeout: Seconds before a call is abandoned and counted as a failure
+            hedge: Start a second request when the first is slower than the p95 latency
+            breaker: Circuit breaker (default: GRAPH_BREAKER_* settings)
+        """
+        self.name = name
+        self.timeout = timeout
+        self.hedge = hedge
+        self.breaker = breaker or CircuitBreaker(GRAPH_BREAKER_FAILURES, GRAPH_BREAKER_RESET_SECONDS)
+        self.latencies: deque = deque(maxlen=LATENCY_WINDOW)
+
+        self.calls = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.fallbacks = 0
+
+    @property
+    def available(self) -> bool:
+        """False while the breaker is open and not yet due for a probe."""
+        breaker = self.breaker
+        return breaker.state != "open" or time.monotonic() - breaker.opened_at >= breaker.reset_seconds
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds after which a hedge is started, or None (hedging off or too few samples)."""
+        if not self.hedge or len(self.latencies) < HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(self.latencies)
+        return max(GRAPH_HEDGE_MIN_DELAY, ordered[int(GRAPH_HEDGE_PERCENTILE * (len(ordered) - 1))])
+
+    async def call(self, make_request: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Call the dependency.
+
+        Args:
+            make_request: Creates a new request coroutine (called again for a hedge)
+
+        Returns:
+            Result of the first request to succeed
+
+        Raises:
+            CircuitOpenError: The breaker is open
+            asyncio.TimeoutError: No request finished within the timeout
+        """
+        if not self.breaker.allow():
+            raise CircuitOpenError(self.name, self.breaker.retry_after())
+
+        self.calls += 1
+        try:
+            result = await asyncio.wait_for(self._race(make_request), self.timeout)
+        except asyncio.CancelledError:
+            self.breaker.release()
+            raise
+        except Exception as e:
+            self.failures += 1
+            if isinstance(e, asyncio.TimeoutError):
+                self.timeouts += 1
+            self.breaker.record_failure()
+            if self.breaker.state == "open":
+                logger.warning(f"Circuit breaker for {self.name} is open after: {e!r}")
+            raise
+
+        self.breaker.record_success()
+        return result
+
+    async def _timed(self, make_request: Callable[[], Awaitable[Any]]) -> Any:
+        started = time.perf_counter()
+        result = await make_request()
+        self.latencies.append(time.perf_counter() - started)
+        return result
+
+    async def _race(self, make_request: Callable[[], Awaitable[Any]]) -> Any:
+        """Run the request, hedged after hedge_delay(); losers are cancelled."""
+        attempts = [asyncio.ensure_future(self._timed(make_request))]
+        try:
+            done, pending = await asyncio.wait(attempts, timeout=self.hedge_delay())
+            if not done:
+                self.hedged += 1
+                attempts.append(asyncio.ensure_future(self._timed(make_request)))
+                pending = set(attempts)
+
+            error: Optional[BaseException] = None
+            while True:
+                for attempt in done:
+                    if attempt.exception() is None:
+                        if attempt is not attempts[0]:
+                            self.hedge_wins += 1
+                        return attempt.result()
+                    error = attempt.exception()
+                if not pending:
+                    raise error
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for attempt in attempts:
+                if not attempt.done():
+                    attempt.cancel()
+                elif not attempt.cancelled():
+                    attempt.exception()  # Mark a failed loser's error as retrieved
+
+    def stats(self) -> Dict[str, Any]:
+        """Breaker state, call counters and the current hedge delay."""
+        return {
+            "state": self.breaker.state,
+            "calls": self.calls,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "rejected": self.breaker.rejected,
+            "opened": self.breaker.opened,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "fallbacks": self.fallbacks,
+            "hedge_delay": self.hedge_delay()
+        }
+
+
+def create_callers() -> Dict[str, ResilientCaller]:
+    """One ResilientCaller per Gemini dependency, configured from the environment."""
+    hedged = {name.strip() for name in GRAPH_HEDGE_DEPENDENCIES.split(",") if name.strip()}
+    return {
+        "llm": ResilientCaller("llm", timeout=GRAPH_LLM_TIMEOUT, hedge="llm" in hedged),
+        "embedder": ResilientCaller("embedder", timeout=GRAPH_CALL_TIMEOUT, hedge="embedder" in hedged)
+    }
+
+
+class ResilientEmbedder(EmbedderClient):
+    """Embedder wrapper that sends every call through a ResilientCaller."""
+
+    def __init__(self, embedder: EmbedderClient, caller: ResilientCaller):
+        """
+        Initialize resilient embedder.
+
+        Args:
+            embedder: Embedder to call
+            caller: Breaker/hedging policy of the embedder dependency
+        """
+        self.embedder = embedder
+        self.caller = caller
+        self.config = getattr(embedder, "config", None)
+
+    async def create(self, input_data) -> List[float]:
+        return await self.caller.call(lambda: self.embedder.create(input_data))
+
+    async def create_batch(self, input_data_list: List[str]) -> List[List[float]]:
+        return await self.caller.call(lambda: self.embedder.create_batch(input_data_list))
+
+
+class ResilientLLMClient(LLMClient):
+    """LLM client wrapper that sends generate_response through a ResilientCaller."""
+
+    def __init__(self, client: LLMClient, caller: ResilientCaller):
+        """
+        Initialize resilient LLM client.
+
+        Args:
+            client: LLM client to call
+            caller: Breaker/hedging policy of the LLM dependency
+        """
+        super().__init__(client.config, cache=False)
+        self.client = client
+        self.caller = caller
+        self.model = client.model
+        self.small_model = client.small_model
+        self.token_tracker = client.token_tracker
+
+    def set_tracer(self, tracer):
+        super().set_tracer(tracer)
+        self.client.set_tracer(tracer)
+
+    async def generate_response(self, *args, **kwargs) -> Dict[str, Any]:
+        return await self.caller.call(lambda: self.client.generate_response(*args, **kwargs))
+
+    async def _generate_response(self, *args, **kwargs) -> Dict[str, Any]:
+        return await self.client._generate_response(*args, **kwargs)
+
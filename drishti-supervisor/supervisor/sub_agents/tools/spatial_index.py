@@ -0,0 +1,397 @@
+"""
+In-process spatial index over venue zones, infrastructure and entry/exit points.
+
+Items are packed bottom-up into a Sort-Tile-Recursive (STR) R-tree whose
+levels are plain numpy arrays, and answer k-nearest, within-radius and
+bounding-box queries without touching the knowledge graph. Distances are in
+meters on a local equirectangular projection, which is accurate at venue
+scale. A zone's distance is measured to its bounding box (0 inside it).
+"""
+
+import os
+import json
+import math
+import heapq
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+try:
+    from .zone_model import normalize_feature
+    from .geometry_store import GeometryStore, METERS_PER_DEGREE
+except ImportError:
+    # For direct execution or testing
+    import zone_model
+    import geometry_store
+    normalize_feature = zone_model.normalize_feature
+    GeometryStore = geometry_store.GeometryStore
+    METERS_PER_DEGREE = geometry_store.METERS_PER_DEGREE
+
+logger = logging.getLogger(__name__)
+
+# Venue file indexed by the spatial tools
+VENUE_GEOJSON_PATH = os.getenv(
+    "VENUE_GEOJSON_PATH",
+    os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))),
+        "complete_all_108_zones_enhanced.geojson"
+    )
+)
+
+ZONE = "zone"
+INFRASTRUCTURE = "infrastructure"
+ENTRY_EXIT = "entry_exit"
+
+# Entries per tree node
+NODE_CAPACITY = 16
+
+
+class SpatialItem:
+    """A zone, infrastructure point or entry/exit point in the index."""
+
+    __slots__ = ("kind", "id", "name", "zone_id", "type", "coordinates", "bbox", "operational_status")
+
+    def __init__(
+        self,
+        kind: str,
+        id: str,
+        name: Optional[str],
+        zone_id: Optional[str],
+        type: Optional[str],
+        coordinates: Tuple[float, float],
+        bbox: Tuple[float, float, float, float],
+        operational_status: bool = True
+    ):
+        self.kind = kind
+        self.id = id
+        self.name = name
+        self.zone_id = zone_id
+        self.type = type
+        self.coordinates = coordinates
+        self.bbox = bbox
+        self.operational_status = operational_status
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "id": self.id,
+            "name": self.name,
+            "zone_id": self.zone_id,
+            "type": self.type,
+            "coordinates": list(self.coordinates),
+            "operational_status": self.operational_status
+        }
+
+    def __repr__(self) -> str:
+        return f"SpatialItem({self.kind}, {self.id!r})"
+
+
+def _str_order(boxes: np.ndarray, capacity: int) -> np.ndarray:
+    """Sort-Tile-Recursive order: vertical slabs by x center, each sorted by y center."""
+    count = len(boxes)
+    centers_x = (boxes[:, 0] + boxes[:, 2]) / 2
+    centers_y = (boxes[:, 1] + boxes[:, 3]) / 2
+    slab_count = max(1, math.ceil(math.sqrt(math.ceil(count / capacity))))
+    slab_size = slab_count * capacity
+
+    by_x = np.argsort(centers_x, kind="stable")
+    return np.concatenate([
+        slab[np.argsort(centers_y[slab], kind="stable")]
+        for slab in (by_x[start:start + slab_size] for start in range(0, count, slab_size))
+    ])
+
+
+def _expand(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Concatenate the ranges [start, end) without a Python loop."""
+    lengths = ends - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return offsets + np.arange(total)
+
+
+class SpatialIndex:
+    """STR-packed R-tree over SpatialItems."""
+
+    def __init__(self, items: Sequence[SpatialItem], node_capacity: int = NODE_CAPACITY):
+        """
+        Build the index.
+
+        Args:
+            items: Items to index
+            node_capacity: Maximum entries per tree node
+        """
+        self.node_capacity = max(2, node_capacity)
+        self.zone_centroids: Dict[str, Tuple[float, float]] = {}
+        self._filtered: Dict[Tuple[Any, ...], "SpatialIndex"] = {}
+
+        if not items:
+            self.items: List[SpatialItem] = []
+            self.boxes = np.empty((0, 4))
+            self.levels: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+            return
+
+        boxes = np.asarray([item.bbox for item in items], dtype=np.float64)
+        order = _str_order(boxes, self.node_capacity)
+        self.items = [items[i] for i in order]
+        self.boxes = boxes[order]
+
+        # Pack levels bottom-up; each level is (node boxes, child start, child end)
+        levels = []
+        child_boxes = self.boxes
+        while True:
+            starts = np.arange(0, len(child_boxes), self.node_capacity)
+            ends = np.minimum(starts + self.node_capacity, len(child_boxes))
+            node_boxes = np.column_stack([
+                np.minimum.reduceat(child_boxes[:, 0], starts),
+                np.minimum.reduceat(child_boxes[:, 1], starts),
+                np.maximum.reduceat(child_boxes[:, 2], starts),
+                np.maximum.reduceat(child_boxes[:, 3], starts)
+            ])
+            if len(node_boxes) > 1:
+                node_order = _str_order(node_boxes, self.node_capacity)
+                node_boxes, starts, ends = node_boxes[node_order], starts[node_order], ends[node_order]
+            levels.append((node_boxes, starts, ends))
+            if len(node_boxes) == 1:
+                break
+            child_boxes = node_boxes
+
+        self.levels = levels[::-1]  # Root first
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @classmethod
+    def from_features(cls, features: Iterable[Any], node_capacity: int = NODE_CAPACITY) -> "SpatialIndex":
+        """
+        Build an index from GeoJSON features (EnhancedGeometry objects or raw dicts).
+
+        Args:
+            features: Venue features
+            node_capacity: Maximum entries per tree node
+
+        Returns:
+            Spatial index over every zone and its infrastructure and entry/exit points
+        """
+        store = GeometryStore()
+        items: List[SpatialItem] = []
+        centroids: Dict[str, Tuple[float, float]] = {}
+
+        for index, feature in enumerate(features):
+            zone, geometry = normalize_feature(feature)
+            zone_id = zone.id or f"zone_{index}"
+            geometry_index = store.add(zone_id, geometry)
+
+            bbox = store.bounding_box(geometry_index)
+            centroid = store.centroid(geometry_index)
+            if bbox and centroid:
+                centroids[zone_id] = (centroid[0], centroid[1])
+                items.append(SpatialItem(
+                    ZONE, zone_id, zone.name, zone_id, zone.zone_type, centroids[zone_id],
+                    (bbox["min_lon"], bbox["min_lat"], bbox["max_lon"], bbox["max_lat"]),
+                    bool(zone.operational_status)
+                ))
+
+            for infra in zone.infrastructure_points:
+                if infra.coordinates and len(infra.coordinates) >= 2:
+                    lon, lat = float(infra.coordinates[0]), float(infra.coordinates[1])
+                    items.append(SpatialItem(
+                        INFRASTRUCTURE, infra.id, infra.name, zone_id, infra.type, (lon, lat),
+                        (lon, lat, lon, lat), bool(infra.operational_status)
+                    ))
+
+            for point in zone.entry_exit_points:
+                if point.coordinates and len(point.coordinates) >= 2:
+                    lon, lat = float(point.coordinates[0]), float(point.coordinates[1])
+                    point_type = "entry_exit" if point.is_entry and point.is_exit else ("entry" if point.is_entry else "exit")
+                    items.append(SpatialItem(
+                        ENTRY_EXIT, point.id, point.name, zone_id, point_type, (lon, lat),
+                        (lon, lat, lon, lat), bool(point.current_status)
+                    ))
+
+        index = cls(items, node_capacity)
+        index.zone_centroids = centroids
+        return index
+
+    @classmethod
+    def from_geojson(cls, file_path: str, node_capacity: int = NODE_CAPACITY) -> "SpatialIndex":
+        """Build an index from a venue GeoJSON file."""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        index = cls.from_features(data.get("features", []), node_capacity)
+        logger.info(f"Built spatial index with {len(index)} items from {file_path}")
+        return index
+
+    def _box_distances(self, boxes: np.ndarray, lon: float, lat: float) -> np.ndarray:
+        """Meters from a point to each box (0 inside)."""
+        meters_per_lon = METERS_PER_DEGREE * math.cos(math.radians(lat))
+        dx = np.maximum(np.maximum(boxes[:, 0] - lon, lon - boxes[:, 2]), 0) * meters_per_lon
+        dy = np.maximum(np.maximum(boxes[:, 1] - lat, lat - boxes[:, 3]), 0) * METERS_PER_DEGREE
+        return np.hypot(dx, dy)
+
+    def _matches(
+        self,
+        item: SpatialItem,
+        kinds: Optional[Set[str]],
+        item_type: Optional[str],
+        operational_only: bool
+    ) -> bool:
+        return (
+            (not kinds or item.kind in kinds)
+            and (item_type is None or item.type == item_type)
+            and (not operational_only or item.operational_status)
+        )
+
+    def _filtered_index(
+        self,
+        kinds: Optional[Iterable[str]],
+        item_type: Optional[str],
+        operational_only: bool
+    ) -> "SpatialIndex":
+        """
+        Index over the items matching a filter (built once per filter).
+        
+        Filtered nearest-neighbour queries such as "nearest open medical
+        station" would otherwise walk most of the tree rejecting items.
+        """
+        kinds = frozenset(kinds) if kinds else None
+        if not kinds and item_type is None and not operational_only:
+            return self
+
+        key = (kinds, item_type, operational_only)
+        if key not in self._filtered:
+            self._filtered[key] = SpatialIndex(
+                [item for item in self.items if self._matches(item, kinds, item_type, operational_only)],
+                self.node_capacity
+            )
+        return self._filtered[key]
+
+    def _query_box(self, min_lon: float, min_lat: float, max_lon: float, max_lat: float) -> np.ndarray:
+        """Positions of items whose boxes intersect the query box."""
+        if not self.levels:
+            return np.empty(0, dtype=np.int64)
+
+        nodes = np.zeros(1, dtype=np.int64)
+        for node_boxes, starts, ends in self.levels:
+            boxes = node_boxes[nodes]
+            hit = nodes[
+                (boxes[:, 0] <= max_lon) & (boxes[:, 2] >= min_lon)
+                & (boxes[:, 1] <= max_lat) & (boxes[:, 3] >= min_lat)
+            ]
+            nodes = _expand(starts[hit], ends[hit])
+
+        boxes = self.boxes[nodes]
+        return nodes[
+            (boxes[:, 0] <= max_lon) & (boxes[:, 2] >= min_lon)
+            & (boxes[:, 1] <= max_lat) & (boxes[:, 3] >= min_lat)
+        ]
+
+    def within_bbox(
+        self,
+        min_lon: float,
+        min_lat: float,
+        max_lon: float,
+        max_lat: float,
+        kinds: Optional[Iterable[str]] = None,
+        item_type: Optional[str] = None,
+        operational_only: bool = False
+    ) -> List[SpatialItem]:
+        """
+        Items intersecting a bounding box.
+
+        Args:
+            min_lon, min_lat, max_lon, max_lat: Query box in degrees
+            kinds: Restrict to these item kinds (zone, infrastructure, entry_exit)
+            item_type: Restrict to a zone/infrastructure type (e.g. medical_station)
+            operational_only: Skip items that are not operational/open
+        """
+        kinds = set(kinds) if kinds else None
+        return [
+            self.items[position] for position in self._query_box(min_lon, min_lat, max_lon, max_lat)
+            if self._matches(self.items[position], kinds, item_type, operational_only)
+        ]
+
+    def within_radius(
+        self,
+        lon: float,
+        lat: float,
+        radius_meters: float,
+        kinds: Optional[Iterable[str]] = None,
+        item_type: Optional[str] = None,
+        operational_only: bool = False
+    ) -> List[Tuple[SpatialItem, float]]:
+        """
+        Items within a radius of a point, nearest first.
+
+        Returns:
+            (item, distance in meters) pairs
+        """
+        index = self._filtered_index(kinds, item_type, operational_only)
+        d_lat = radius_meters / METERS_PER_DEGREE
+        d_lon = radius_meters / (METERS_PER_DEGREE * max(math.cos(math.radians(lat)), 1e-6))
+        positions = index._query_box(lon - d_lon, lat - d_lat, lon + d_lon, lat + d_lat)
+
+        distances = index._box_distances(index.boxes[positions], lon, lat)
+        order = np.argsort(distances, kind="stable")
+        return [
+            (index.items[positions[i]], float(distances[i])) for i in order
+            if distances[i] <= radius_meters
+        ]
+
+    def nearest(
+        self,
+        lon: float,
+        lat: float,
+        k: int = 5,
+        kinds: Optional[Iterable[str]] = None,
+        item_type: Optional[str] = None,
+        operational_only: bool = False,
+        max_distance: Optional[float] = None
+    ) -> List[Tuple[SpatialItem, float]]:
+        """
+        k nearest matching items to a point (best-first tree search).
+
+        Returns:
+            (item, distance in meters) pairs, nearest first
+        """
+        index = self._filtered_index(kinds, item_type, operational_only)
+        if index is not self:
+            return index.nearest(lon, lat, k=k, max_distance=max_distance)
+
+        if not self.levels or k <= 0:
+            return []
+
+        leaf_level = len(self.levels)
+        # Heap entries: (distance, level, position); level == leaf_level marks an item
+        heap = [(0.0, 0, 0)]
+        results = []
+
+        while heap and len(results) < k:
+            distance, level, position = heapq.heappop(heap)
+            if max_distance is not None and distance > max_distance:
+                break
+
+            if level == leaf_level:
+                results.append((self.items[position], distance))
+                continue
+
+            _, starts, ends = self.levels[level]
+            children = np.arange(starts[position], ends[position])
+            child_boxes = self.boxes[children] if level + 1 == leaf_level else self.levels[level + 1][0][children]
+            for child, child_distance in zip(children.tolist(), self._box_distances(child_boxes, lon, lat).tolist()):
+                heapq.heappush(heap, (child_distance, level + 1, child))
+
+        return results
+
+
+_venue_index: Optional[SpatialIndex] = None
+
+
+def get_venue_spatial_index() -> SpatialIndex:
+    """Spatial index of the venue at VENUE_GEOJSON_PATH (built on first use)."""
+    global _venue_index
+    if _venue_index is None:
+        _venue_index = SpatialIndex.from_geojson(VENUE_GEOJSON_PATH)
+    return _venue_index
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Check that concurrent writers to one embedding cache keep every text mapped to its own vector.
+
+Two processes (like --prewarm-embeddings next to a running agent) append
+overlapping sets of texts to the same store in small batches; afterwards
+every cached text must resolve to the vector its writer computed for it.
+"""
+
+import os
+import sys
+import hashlib
+import tempfile
+import multiprocessing
+
+import numpy as np
+
+try:
+    from embedding_cache import EmbeddingStore
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from embedding_cache import EmbeddingStore
+
+MODEL = "test-embedding"
+DIMENSION = 8
+
+
+def vector_for(text: str):
+    """Deterministic vector of a text, so any process can check any entry."""
+    seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:4], "little")
+    return np.random.default_rng(seed).standard_normal(DIMENSION).astype(np.float32).tolist()
+
+
+def writer(directory: str, texts, batch_size: int, start):
+    """Append texts in small batches once both writers are ready."""
+    store = EmbeddingStore(directory, MODEL, DIMENSION)
+    start.wait()
+    for offset in range(0, len(texts), batch_size):
+        batch = texts[offset:offset + batch_size]
+        store.put_many(batch, [vector_for(text) for text in batch])
+
+
+def test_embedding_cache(texts_per_writer: int = 2000) -> bool:
+    """Run two writers against one store and verify every row."""
+    directory = tempfile.mkdtemp(prefix="embedding_cache_")
+
+    # Half of each writer's texts are shared with the other writer
+    shared = [f"shared text {i}" for i in range(texts_per_writer // 2)]
+    texts_a = shared + [f"writer a text {i}" for i in range(texts_per_writer // 2)]
+    texts_b = list(reversed(shared)) + [f"writer b text {i}" for i in range(texts_per_writer // 2)]
+
+    start = multiprocessing.Barrier(2)
+    processes = [
+        multiprocessing.Process(target=writer, args=(directory, texts_a, 3, start)),
+        multiprocessing.Process(target=writer, args=(directory, texts_b, 5, start))
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    if any(process.exitcode for process in processes):
+        print("❌ A writer process failed")
+        return False
+
+    store = EmbeddingStore(directory, MODEL, DIMENSION)
+    expected = set(texts_a) | set(texts_b)
+    failures = 0
+    for text in expected:
+        cached = store.get(text)
+        if cached is None or not np.allclose(cached, vector_for(text)):
+            failures += 1
+
+    rows = os.path.getsize(store.vectors_path) // (DIMENSION * 4)
+    if failures or len(store) != len(expected):
+        print(f"❌ {failures} of {len(expected)} texts resolve to the wrong vector ({len(store)} cached)")
+        return False
+    print(f"✓ {len(expected)} texts from two concurrent writers resolve to their own vectors ({rows} rows on disk)")
+
+    # A torn row and a torn index line from a crashed writer are skipped, not misread
+    with open(store.vectors_path, 'ab') as f:
+        f.write(b"\0" * 5)
+    with open(store.index_path, 'a', encoding='utf-8') as f:
+        f.write('{"key": "torn", "ro')
+    store.put_many(["after crash"], [vector_for("after crash")])
+    reloaded = EmbeddingStore(directory, MODEL, DIMENSION)
+    if not np.allclose(reloaded.get("after crash"), vector_for("after crash")) or len(reloaded) != len(expected) + 1:
+        print("❌ Appending after a crashed writer corrupted the cache")
+        return False
+    print("✓ Appends after a crashed writer stay aligned")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if test_embedding_cache() else 1)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Check the incremental GeoJSON reader against json.load.
+
+Tiny read sizes make features, keys, strings, escape sequences and numbers
+straddle the boundaries between buffer refills.
+"""
+
+import io
+import os
+import sys
+import json
+
+try:
+    from geojson_stream import iter_feature_collection
+    from spatial_index import VENUE_GEOJSON_PATH
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from geojson_stream import iter_feature_collection
+    from spatial_index import VENUE_GEOJSON_PATH
+
+# Escapes, unicode (incl. a surrogate pair), nested values, numbers of every
+# form and members on both sides of "features"
+TRICKY_DOCUMENT = r'''
+{ "type" : "FeatureCollection",
+  "metadata": {"name": "Gate \"A\" \\ North", "levels": [1, 2.5, -3e2, 1E-2], "ok": true, "none": null},
+  "features" : [
+    {"type": "Feature", "properties": {"id": "zone_001", "name": "Café 😀 \ud83d\ude00 \u00e9 \/ \b\f\n\r\t"},
+     "geometry": {"type": "Point", "coordinates": [77.123456789, 28.987654321]}},
+    {"type":"Feature","properties":{"id":"zone_002","tags":[],"nested":{"a":{"b":[{"c":"}]"}]}}},
+     "geometry":null} ,
+    {"type": "Feature", "properties": {"id": "zone_003", "capacity": 12345678901234567890, "ratio": 0.000001}}
+  ],
+  "bbox": [0, 0, 1, 1]
+}
+'''
+
+READ_SIZES = [1, 2, 3, 7, 64]
+
+
+def stream(text: str, read_size: int):
+    """Features and top-level members read with the given buffer size."""
+    top_level = {}
+    features = list(iter_feature_collection(io.StringIO(text), top_level, read_size=read_size))
+    return features, top_level
+
+
+def check_document(label: str, text: str, read_sizes=READ_SIZES) -> int:
+    """Compare streamed output with json.load for every read size; return the failure count."""
+    expected = json.loads(text)
+    expected_features = expected.get("features", [])
+    expected_top_level = {key: value for key, value in expected.items() if key != "features"}
+
+    failures = 0
+    for read_size in read_sizes:
+        features, top_level = stream(text, read_size)
+        if features != expected_features or top_level != expected_top_level:
+            print(f"❌ {label}: read_size={read_size} differs from json.load")
+            failures += 1
+    return failures
+
+
+def test_geojson_stream() -> bool:
+    """Stream hand-written edge cases and the venue file with small buffers."""
+    failures = check_document("tricky document", TRICKY_DOCUMENT)
+    failures += check_document("empty collection", '{"type": "FeatureCollection", "features": []}')
+    failures += check_document("no members", "{ }")
+
+    # Pretty-printed and compact layouts put boundaries in different places
+    compact = json.dumps(json.loads(TRICKY_DOCUMENT), separators=(",", ":"), ensure_ascii=False)
+    failures += check_document("compact document", compact)
+
+    for malformed in ('{"features": [{"id": 1} {"id": 2}]}', '{"features": [', '["not", "an", "object"]'):
+        try:
+            stream(malformed, 3)
+        except ValueError:
+            continue
+        print(f"❌ Malformed input was accepted: {malformed}")
+        failures += 1
+
+    if os.path.exists(VENUE_GEOJSON_PATH):
+        with open(VENUE_GEOJSON_PATH, 'r', encoding='utf-8') as f:
+            venue = f.read()
+        failures += check_document("venue file", venue, read_sizes=[257, 4096])
+    else:
+        print(f"⚠️ GeoJSON file not found at: {VENUE_GEOJSON_PATH}, skipping venue check")
+
+    if failures:
+        return False
+    print("✓ Streamed features match json.load for every read size")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if test_geojson_stream() else 1)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Check resume and incremental retirement against the in-memory backend.
+
+A first run loses a few chunks to a simulated quota outage after retries run
+out; resuming must submit only those chunks, and only a run that completed
+cleanly makes the next --resume start over. Incremental runs must never leave
+a superseded episode behind: not when its removal fails, not when a resumed
+run repairs a lost manifest update, and not when the source becomes empty.
+"""
+
+import os
+import sys
+import shutil
+import asyncio
+import tempfile
+import dataclasses
+
+try:
+    from memory_backend import InMemoryGraphitiClient
+    from graph_builder import GraphBuilder
+    from ingest_state import IngestJournal, IngestManifest
+    from spatial_index import VENUE_GEOJSON_PATH
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from memory_backend import InMemoryGraphitiClient
+    from graph_builder import GraphBuilder
+    from ingest_state import IngestJournal, IngestManifest
+    from spatial_index import VENUE_GEOJSON_PATH
+
+
+class FlakyClient(InMemoryGraphitiClient):
+    """In-memory client whose add_episode fails for the zones in failing_zones."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.failing_zones = set()
+        self.failing_removals = False
+
+    async def add_episode(self, episode_id: str, *args, **kwargs) -> str:
+        if any(f"_{zone_id}_" in episode_id for zone_id in self.failing_zones):
+            raise RuntimeError("429 Resource exhausted (simulated)")
+        return await super().add_episode(episode_id, *args, **kwargs)
+
+    async def remove_episode(self, episode_uuid: str):
+        if self.failing_removals:
+            raise RuntimeError("503 Service unavailable (simulated)")
+        await super().remove_episode(episode_uuid)
+
+
+def revised(chunk):
+    """Copy of a chunk with changed content."""
+    return dataclasses.replace(chunk, content=chunk.content + "\nRevised")
+
+
+async def episode_count(client) -> int:
+    client.stats_cache.clear()  # Counts are otherwise reused for GRAPH_STATS_TTL seconds
+    return (await client.get_graph_statistics())["nodes_by_label"].get("Episodic", 0)
+
+
+async def test_ingest_state() -> bool:
+    """Run with failures, resume, then resume again after a clean completion."""
+    if not os.path.exists(VENUE_GEOJSON_PATH):
+        print(f"❌ GeoJSON file not found at: {VENUE_GEOJSON_PATH}")
+        return False
+
+    client = FlakyClient(namespace="resume_test")
+    builder = GraphBuilder(graph_client=client)
+    chunks = builder.create_geochunks_from_geojson(builder.load_geojson_from_file(VENUE_GEOJSON_PATH))
+    journal_path = os.path.join(tempfile.mkdtemp(prefix="ingest_state_"), "journal.jsonl")
+    options = {"rate_limit": 1e6, "max_retries": 0, "batch_size": 1}
+
+    async def run():
+        return await builder.add_geojson_to_graph(chunks, "venue", journal=IngestJournal(journal_path), resume=True, **options)
+
+    failures = []
+    client.failing_zones = {chunk.zone_id for chunk in chunks[:3]}
+    first = await run()
+    if first["episodes_created"] != len(chunks) - 3 or len(first["errors"]) != 3:
+        failures.append(f"first run created {first['episodes_created']} episodes with {len(first['errors'])} errors")
+
+    # The outage is over: only the failed chunks are submitted again
+    client.failing_zones = set()
+    second = await run()
+    if second["resumed_chunks"] != len(chunks) - 3 or second["episodes_created"] != 3 or second["errors"]:
+        failures.append(f"resume after failed chunks: {second}")
+    if await episode_count(client) != len(chunks):
+        failures.append(f"graph holds {await episode_count(client)} episodes after resuming, expected {len(chunks)}")
+
+    # The last run completed cleanly, so --resume starts a new one
+    third = await run()
+    if third["resumed_chunks"] != 0 or third["episodes_created"] != len(chunks):
+        failures.append(f"resume after a clean run reused {third['resumed_chunks']} chunks")
+
+    if not failures:
+        print(f"✓ Resume submitted only the 3 failed of {len(chunks)} chunks; a clean run starts over")
+    failures += await test_incremental_retirement(builder, chunks)
+    for failure in failures:
+        print(f"❌ {failure}")
+    return not failures
+
+
+async def test_incremental_retirement(builder: GraphBuilder, chunks) -> list:
+    """Superseded episodes are retired even after failed removals, repairs and an emptied source."""
+    failures = []
+    client = FlakyClient(namespace="retire_test")
+    builder = GraphBuilder(graph_client=client)
+    state_dir = tempfile.mkdtemp(prefix="ingest_state_")
+    manifest_path = os.path.join(state_dir, "manifest.json")
+    journal_path = os.path.join(state_dir, "journal.jsonl")
+    options = {"rate_limit": 1e6, "max_retries": 0, "batch_size": 1, "incremental": True}
+
+    async def run(source, resume=False):
+        return await builder.add_geojson_to_graph(
+            source, "venue", manifest=IngestManifest(manifest_path),
+            journal=IngestJournal(journal_path), resume=resume, **options
+        )
+
+    await run(chunks)
+
+    # Removing the superseded episode fails: its uuid is kept and retired by the next run
+    client.failing_removals = True
+    source = [revised(chunk) if i == 0 else chunk for i, chunk in enumerate(chunks)]
+    await run(source)
+    pending = IngestManifest(manifest_path).pending_retirements("venue")
+    client.failing_removals = False
+    result = await run(source)
+    if len(pending) != 1 or result["episodes_retired"] != 1 or await episode_count(client) != len(chunks):
+        failures.append(f"failed retirement left {await episode_count(client) - len(chunks)} duplicate episodes")
+
+    # A hard stop loses the manifest update of a finished chunk; the resumed run retires its old episode
+    source = [revised(revised(chunk)) if i < 2 else chunk for i, chunk in enumerate(chunks)]
+    shutil.copy(manifest_path, f"{manifest_path}.before")
+    client.failing_zones = {chunks[1].zone_id}
+    await run(source)
+    shutil.copy(f"{manifest_path}.before", manifest_path)
+    client.failing_zones = set()
+    result = await run(source, resume=True)
+    if result["resumed_chunks"] != 1 or await episode_count(client) != len(chunks):
+        failures.append(f"repaired manifest left {await episode_count(client) - len(chunks)} duplicate episodes")
+
+    # An emptied source retires every zone
+    result = await run([])
+    if await episode_count(client) or IngestManifest(manifest_path).get_source("venue"):
+        failures.append(f"empty source left {await episode_count(client)} episodes ({result})")
+
+    if not failures:
+        print("✓ Incremental runs retire superseded episodes after failed removals, repairs and an emptied source")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(test_ingest_state()) else 1)
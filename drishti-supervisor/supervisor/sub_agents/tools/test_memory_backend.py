@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Build the venue graph on the in-memory backend and exercise the graph tool paths.
+
+Needs no Neo4j or Vertex AI. Also reports local queries per second for
+search, hybrid search, traversal and timeline lookups.
+"""
+
+import os
+import sys
+import time
+import asyncio
+
+try:
+    from memory_backend import InMemoryGraphitiClient
+    from graph_builder import GraphBuilder
+    from spatial_index import VENUE_GEOJSON_PATH
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from memory_backend import InMemoryGraphitiClient
+    from graph_builder import GraphBuilder
+    from spatial_index import VENUE_GEOJSON_PATH
+
+SEARCH_KEYS = {"fact", "uuid", "valid_at", "invalid_at", "source_node_uuid", "score"}
+TIMELINE_KEYS = {"fact", "uuid", "name", "source_node_uuid", "target_node_uuid", "valid_at", "invalid_at"}
+
+
+async def measure(label: str, calls: int, make_call) -> float:
+    """Run calls concurrently in waves of 50 and print the rate."""
+    started = time.perf_counter()
+    for start in range(0, calls, 50):
+        await asyncio.gather(*(make_call(i) for i in range(start, min(calls, start + 50))))
+    rate = calls / (time.perf_counter() - started)
+    print(f"  {label}: {rate:,.0f} queries/sec")
+    return rate
+
+
+async def test_memory_backend(queries: int = 2000) -> bool:
+    """Ingest the venue, check result shapes and namespaces, and measure throughput."""
+    if not os.path.exists(VENUE_GEOJSON_PATH):
+        print(f"❌ GeoJSON file not found at: {VENUE_GEOJSON_PATH}")
+        return False
+
+    client = InMemoryGraphitiClient(namespace="drill")
+    builder = GraphBuilder(graph_client=client)
+    chunks = builder.create_geochunks_from_geojson(builder.load_geojson_from_file(VENUE_GEOJSON_PATH))
+    result = await builder.add_geojson_to_graph(chunks, "venue", rate_limit=1e6, batch_size=10)
+    stats = await client.get_graph_statistics()
+    print(f"✓ Ingested {result['episodes_created']} episodes: {stats['nodes_by_label']}, {stats['edges_by_type']}")
+
+    failures = []
+    zone_id = chunks[3].zone_id
+
+    results = await client.search(f"security gate {zone_id}")
+    if not results or any(set(r) != SEARCH_KEYS for r in results):
+        failures.append(f"search returned {results[:1]}")
+
+    hybrid = await client.hybrid_search(zone_id)
+    if hybrid["search_method"] != "lexical_exact":
+        failures.append(f"identifier hybrid search used {hybrid['search_method']}")
+
+    # Concurrent searches after a write share one lexical index reload; later writes update it in place
+    loads = []
+    load_episode_records = client._load_episode_records
+
+    async def slow_load(group_id):
+        loads.append(group_id)
+        await asyncio.sleep(0.01)  # Like a Neo4j round trip
+        return await load_episode_records(group_id)
+
+    client._load_episode_records = slow_load
+    client.lexical_indexes.clear()
+    await asyncio.gather(*(client.hybrid_search(f"medical station {i}") for i in range(20)))
+    episode_uuid = await client.add_episode("drill_note", "zone_999 closed for cleaning", "drill")
+    added = await client.hybrid_search("zone_999")
+    await client.remove_episode(episode_uuid)
+    removed = await client.hybrid_search("zone_999")
+    client._load_episode_records = load_episode_records
+    if len(loads) != 1:
+        failures.append(f"lexical index loaded {len(loads)} times")
+    if [hit["uuid"] for hit in added["results"]] != [episode_uuid] or any(
+        hit.get("uuid") == episode_uuid for hit in removed["results"]
+    ):
+        failures.append("lexical index missed an added or removed episode")
+
+    related = await client.get_related_entities(zone_id, depth=2)
+    if not related["related_entities"] or related["search_method"] != "cypher_traversal":
+        failures.append(f"traversal of {zone_id} found nothing")
+
+    timeline = await client.get_entity_timeline(zone_id, limit=2)
+    if not timeline["facts"] or any(set(f) != TIMELINE_KEYS for f in timeline["facts"]):
+        failures.append(f"timeline returned {timeline}")
+    elif timeline["next_cursor"]:
+        second = await client.get_entity_timeline(zone_id, limit=2, cursor=timeline["next_cursor"])
+        if {f["uuid"] for f in second["facts"]} & {f["uuid"] for f in timeline["facts"]}:
+            failures.append("timeline pages overlap")
+
+    batch = await client.batch_search([
+        {"query": "medical station"}, {"query_type": "relationships", "query": zone_id}
+    ])
+    if set(batch["results"]) != {"q0", "q1"}:
+        failures.append(f"batch search returned {list(batch['results'])}")
+
+    if await client.search("medical station", namespace="other_event"):
+        failures.append("search leaked across namespaces")
+    await client.drop_namespace("drill")
+    if (await client.get_graph_statistics())["total_nodes"]:
+        failures.append("drop_namespace left nodes behind")
+
+    await builder.add_geojson_to_graph(chunks, "venue", rate_limit=1e6, batch_size=10)
+    terms = [chunk.zone_id for chunk in chunks] + [f"{chunk.zone_type} {chunk.zone_name}" for chunk in chunks]
+    print("Throughput (cache disabled):")
+    client.search_cache.max_size = 0
+    await measure("search", queries, lambda i: client.search(terms[i % len(terms)] + f" {i}"))
+    await measure("hybrid_search", queries, lambda i: client.hybrid_search(terms[i % len(terms)] + f" {i}"))
+    await measure("get_related_entities", queries,
+                  lambda i: client.get_related_entities(chunks[i % len(chunks)].zone_id, depth=2))
+    await measure("get_entity_timeline", queries,
+                  lambda i: client.get_entity_timeline(chunks[i % len(chunks)].zone_id))
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✓ In-memory backend returns GraphitiClient result shapes")
+    return not failures
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(test_memory_backend()) else 1)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Check the circuit breaker, hedged requests and how ingestion waits out an open breaker.
+
+Uses fake dependencies with short timeouts; needs no Neo4j or Vertex AI.
+"""
+
+import os
+import sys
+import time
+import asyncio
+
+try:
+    from resilience import CircuitBreaker, CircuitOpenError, ResilientCaller, HEDGE_MIN_SAMPLES
+    from rate_limiter import AdaptiveRateLimiter
+    from memory_backend import InMemoryGraphitiClient
+    from graph_builder import GraphBuilder
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from resilience import CircuitBreaker, CircuitOpenError, ResilientCaller, HEDGE_MIN_SAMPLES
+    from rate_limiter import AdaptiveRateLimiter
+    from memory_backend import InMemoryGraphitiClient
+    from graph_builder import GraphBuilder
+
+RESET_SECONDS = 0.2
+
+
+class FakeDependency:
+    """Request factory with scripted failures and latencies that records cancellations."""
+
+    def __init__(self, failures: int = 0, delays=()):
+        self.failures = failures
+        self.delays = list(delays)
+        self.started = 0
+        self.cancelled = 0
+
+    async def request(self) -> int:
+        self.started += 1
+        attempt = self.started
+        try:
+            await asyncio.sleep(self.delays.pop(0) if self.delays else 0)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if attempt <= self.failures:
+            raise RuntimeError(f"503 from fake dependency (attempt {attempt})")
+        return attempt
+
+
+async def call(caller: ResilientCaller, dependency: FakeDependency):
+    """Result of one call, or the exception it raised."""
+    try:
+        return await caller.call(dependency.request)
+    except Exception as e:
+        return e
+
+
+async def test_breaker() -> list:
+    """closed -> open -> half_open -> open -> half_open -> closed, and probe release on cancellation."""
+    failures = []
+    caller = ResilientCaller("llm", timeout=1.0, breaker=CircuitBreaker(3, RESET_SECONDS))
+    dependency = FakeDependency(failures=4)
+
+    for _ in range(3):
+        await call(caller, dependency)
+    rejected = await call(caller, dependency)
+    if caller.breaker.state != "open" or not isinstance(rejected, CircuitOpenError):
+        failures.append(f"breaker did not open after 3 failures (state {caller.breaker.state})")
+    elif not 0 < rejected.retry_after <= RESET_SECONDS or dependency.started != 3:
+        failures.append(f"open breaker let a call through or reported retry_after={rejected.retry_after}")
+
+    # The first probe fails and reopens the breaker
+    await asyncio.sleep(RESET_SECONDS)
+    await call(caller, dependency)
+    if caller.breaker.state != "open" or caller.breaker.opened != 2:
+        failures.append(f"failed probe left the breaker {caller.breaker.state}")
+
+    # Only one probe goes through at a time; its success closes the breaker
+    await asyncio.sleep(RESET_SECONDS)
+    dependency.delays = [0.05]
+    probe = asyncio.ensure_future(call(caller, dependency))
+    await asyncio.sleep(0.01)
+    concurrent = await call(caller, dependency)
+    if caller.breaker.state != "half_open" or not isinstance(concurrent, CircuitOpenError) or concurrent.retry_after:
+        failures.append("a second call went through while the probe was running")
+    if await probe != 5 or caller.breaker.state != "closed":
+        failures.append(f"successful probe left the breaker {caller.breaker.state}")
+
+    # A cancelled probe gives the probe back instead of blocking the breaker half open
+    caller.breaker.state, caller.breaker.opened_at = "open", time.monotonic() - RESET_SECONDS
+    dependency.delays = [1.0]
+    probe = asyncio.ensure_future(caller.call(dependency.request))
+    await asyncio.sleep(0.01)
+    probe.cancel()
+    await asyncio.gather(probe, return_exceptions=True)
+    if dependency.cancelled != 1 or not caller.breaker.allow():
+        failures.append("cancelled probe was not released")
+
+    if not failures:
+        print("✓ Breaker opens, probes one call at a time when half open, and closes on success")
+    return failures
+
+
+async def test_hedging() -> list:
+    """A hedge that answers first wins and the slow original is cancelled."""
+    failures = []
+    caller = ResilientCaller("embedder", timeout=2.0, hedge=True)
+    dependency = FakeDependency(delays=[0.01] * HEDGE_MIN_SAMPLES)
+    for _ in range(HEDGE_MIN_SAMPLES):
+        await caller.call(dependency.request)
+    if caller.hedge_delay() is None:
+        return ["no hedge delay after enough samples"]
+
+    # The original stalls; the hedge started after hedge_delay() answers
+    dependency.delays = [1.0, 0.01]
+    started = time.perf_counter()
+    result = await caller.call(dependency.request)
+    elapsed = time.perf_counter() - started
+    await asyncio.sleep(0)
+    if result != HEDGE_MIN_SAMPLES + 2 or caller.hedged != 1 or caller.hedge_wins != 1:
+        failures.append(f"hedge did not win (result {result}, {caller.stats()})")
+    if dependency.cancelled != 1:
+        failures.append("the slow original request was not cancelled")
+    if elapsed > 0.5:
+        failures.append(f"hedged call took {elapsed:.2f}s")
+
+    # A fast original wins without starting a hedge
+    dependency.delays = [0.001]
+    await caller.call(dependency.request)
+    if caller.hedged != 1:
+        failures.append("a fast request was hedged")
+
+    if not failures:
+        print(f"✓ Hedge after {caller.hedge_delay() * 1000:.0f}ms wins over a stalled request, which is cancelled")
+    return failures
+
+
+async def test_ingestion_waits_for_breaker() -> list:
+    """_run_with_retry waits out an open breaker and slows the limiter, within a bounded wait."""
+    failures = []
+    builder = GraphBuilder(graph_client=InMemoryGraphitiClient())
+    caller = ResilientCaller("llm", timeout=1.0, breaker=CircuitBreaker(2, RESET_SECONDS))
+    dependency = FakeDependency(failures=2)
+    limiter = AdaptiveRateLimiter(rate=100, cooldown_seconds=RESET_SECONDS)
+
+    # Search traffic opened the breaker; ingestion must not spend (or run out of) retries on it
+    for _ in range(2):
+        await call(caller, dependency)
+    try:
+        result = await builder._run_with_retry(lambda: caller.call(dependency.request), "test chunk", limiter, 0)
+    except Exception as e:
+        return [f"ingestion gave up while the breaker was open: {e!r}"]
+    if result != 3 or caller.breaker.state != "closed":
+        failures.append(f"probe after the breaker opened returned {result} ({caller.stats()})")
+    if limiter.rate_limit_events < 1 or limiter.rate >= limiter.max_rate:
+        failures.append("an open breaker did not slow the rate limiter down")
+
+    # While another caller's probe hangs, the submission gives up once its breaker wait budget is spent
+    caller = ResilientCaller("llm", timeout=10.0, breaker=CircuitBreaker(1, RESET_SECONDS))
+    dependency = FakeDependency(failures=1, delays=[0, 5.0])
+    await call(caller, dependency)
+    await asyncio.sleep(RESET_SECONDS)
+    probe = asyncio.ensure_future(call(caller, dependency))
+    await asyncio.sleep(0.01)
+    started = time.perf_counter()
+    try:
+        await builder._run_with_retry(lambda: caller.call(dependency.request), "test chunk", limiter, 0,
+                                      max_breaker_wait=1.0)
+        failures.append("ingestion did not give up while the breaker stayed open")
+    except CircuitOpenError:
+        if time.perf_counter() - started > 2.0:
+            failures.append(f"ingestion waited {time.perf_counter() - started:.1f}s on a 1s breaker budget")
+    probe.cancel()
+    await asyncio.gather(probe, return_exceptions=True)
+
+    if not failures:
+        print(f"✓ Ingestion waited out the open breaker (limiter at {limiter.rate:.0f} requests/sec) "
+              "and gives up once the wait budget is spent")
+    return failures
+
+
+async def test_resilience() -> bool:
+    failures = await test_breaker()
+    failures += await test_hedging()
+    failures += await test_ingestion_waits_for_breaker()
+    for failure in failures:
+        print(f"❌ {failure}")
+    return not failures
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(test_resilience()) else 1)
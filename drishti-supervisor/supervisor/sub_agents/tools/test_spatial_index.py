@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Check the venue spatial index against brute-force scans of the same items.
+"""
+
+import os
+import sys
+import time
+import random
+
+try:
+    from spatial_index import SpatialIndex, VENUE_GEOJSON_PATH
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from spatial_index import SpatialIndex, VENUE_GEOJSON_PATH
+
+
+def brute_force(index, lon, lat, **filters):
+    """All matching items with their distances, nearest first."""
+    distances = index._box_distances(index.boxes, lon, lat)
+    kinds = set(filters["kinds"]) if filters.get("kinds") else None
+    return sorted(
+        (float(distances[i]), item.kind, item.id) for i, item in enumerate(index.items)
+        if index._matches(item, kinds, filters.get("item_type"), filters.get("operational_only", False))
+    )
+
+
+def test_spatial_index(queries: int = 200) -> bool:
+    """Compare nearest, within-radius and bbox queries with brute force."""
+    if not os.path.exists(VENUE_GEOJSON_PATH):
+        print(f"❌ GeoJSON file not found at: {VENUE_GEOJSON_PATH}")
+        return False
+
+    index = SpatialIndex.from_geojson(VENUE_GEOJSON_PATH)
+    print(f"✓ Indexed {len(index)} items ({len(index.zone_centroids)} zones, {len(index.levels)} tree levels)")
+
+    boxes = index.boxes
+    rng = random.Random(42)
+    filter_sets = [{}, {"kinds": ["infrastructure"]}, {"item_type": "medical_station", "operational_only": True}]
+    failures = 0
+
+    for _ in range(queries):
+        lon = rng.uniform(boxes[:, 0].min() - 0.001, boxes[:, 2].max() + 0.001)
+        lat = rng.uniform(boxes[:, 1].min() - 0.001, boxes[:, 3].max() + 0.001)
+
+        for filters in filter_sets:
+            expected = brute_force(index, lon, lat, **filters)
+
+            nearest = [round(d, 6) for _, d in index.nearest(lon, lat, k=5, **filters)]
+            if nearest != [round(d, 6) for d, _, _ in expected[:5]]:
+                failures += 1
+
+            radius = [round(d, 6) for _, d in index.within_radius(lon, lat, 150, **filters)]
+            if radius != [round(d, 6) for d, _, _ in expected if d <= 150]:
+                failures += 1
+
+        query_box = (lon - 0.0005, lat - 0.0005, lon + 0.0005, lat + 0.0005)
+        found = sorted((item.kind, item.id) for item in index.within_bbox(*query_box))
+        expected_box = sorted(
+            (item.kind, item.id) for item, box in zip(index.items, boxes)
+            if box[0] <= query_box[2] and box[2] >= query_box[0] and box[1] <= query_box[3] and box[3] >= query_box[1]
+        )
+        if found != expected_box:
+            failures += 1
+
+    if failures:
+        print(f"❌ {failures} spatial queries disagreed with brute force")
+        return False
+    print(f"✓ {queries * (len(filter_sets) * 2 + 1)} queries match brute force")
+
+    lon, lat = index.zone_centroids[next(iter(index.zone_centroids))]
+    started = time.perf_counter()
+    for _ in range(1000):
+        index.nearest(lon, lat, k=5, item_type="medical_station", operational_only=True)
+    print(f"✓ Nearest medical station: {(time.perf_counter() - started) * 1000:.1f} µs per query")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if test_spatial_index() else 1)
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Check the vectorized zone locator against a brute-force point-in-polygon scan.
+
+Covers points on shared edges and vertices, polygons with holes (and a zone
+inside the hole), overlapping zones, concave gaps and points outside every
+zone, on synthetic layouts and on the venue file.
+"""
+
+import os
+import sys
+import time
+import random
+
+import numpy as np
+
+try:
+    from zone_locator import ZoneLocator
+    from geometry_store import GeometryStore
+    from spatial_index import VENUE_GEOJSON_PATH
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from zone_locator import ZoneLocator
+    from geometry_store import GeometryStore
+    from spatial_index import VENUE_GEOJSON_PATH
+
+
+def square(x0: float, y0: float, size: float):
+    return [[x0, y0], [x0 + size, y0], [x0 + size, y0 + size], [x0, y0 + size], [x0, y0]]
+
+
+def crossings(ring, lon: float, lat: float) -> int:
+    """Edges of a ring crossed by a ray going east from the point (half-open rule)."""
+    count = 0
+    for (x1, y1), (x2, y2) in zip(ring, ring[1:] + ring[:1]):
+        if (y1 > lat) != (y2 > lat) and lon < (x2 - x1) * (lat - y1) / (y2 - y1) + x1:
+            count += 1
+    return count
+
+
+def brute_force(store: GeometryStore, lon: float, lat: float):
+    """Smallest zone whose polygon (even-odd over all rings) contains the point, or None."""
+    best = None
+    for index in range(len(store)):
+        if store.geometry_type(index) != "Polygon":
+            continue
+        rings = [ring.tolist() for ring in store.rings(index)]
+        if sum(crossings(ring, lon, lat) for ring in rings) % 2 and (best is None or store.area(index) < store.area(best)):
+            best = index
+    return store.zone_ids[best] if best is not None else None
+
+
+def build(zones):
+    store = GeometryStore()
+    for zone_id, rings in zones:
+        store.add(zone_id, {"type": "Polygon", "coordinates": rings})
+    return store, ZoneLocator(store)
+
+
+def check(label: str, store: GeometryStore, locator: ZoneLocator, points) -> int:
+    """Compare locator results with brute force; return the number of mismatches."""
+    found = locator.locate(points)
+    mismatches = [
+        (point, got, expected) for point, got in zip(points, found)
+        for expected in (brute_force(store, *point),) if got != expected
+    ]
+    for point, got, expected in mismatches[:5]:
+        print(f"❌ {label}: {point} located in {got}, expected {expected}")
+    return len(mismatches)
+
+
+def test_synthetic() -> int:
+    failures = 0
+
+    # 3x3 grid of adjacent unit squares: every shared edge and vertex belongs to exactly one zone
+    grid = [(f"cell_{x}_{y}", [square(x, y, 1)]) for x in range(3) for y in range(3)]
+    store, locator = build(grid)
+    boundary = [[x / 2, y / 2] for x in range(7) for y in range(7)]
+    failures += check("grid boundaries", store, locator, boundary)
+    interior_boundary = [[x, y] for x, y in boundary if 0 < x < 3 and 0 < y < 3]
+    if None in locator.locate(interior_boundary):
+        print("❌ A point on a shared edge/vertex fell between adjacent zones")
+        failures += 1
+
+    # Ring with a hole, a zone inside the hole, an overlapping zone and a concave (U-shaped) zone
+    zones = [
+        ("ring", [square(0, 0, 10), square(3, 3, 4)[::-1]]),
+        ("island", [square(4, 4, 2)]),
+        ("overlap", [square(8, 8, 4)]),
+        ("u_shape", [[[20, 0], [30, 0], [30, 10], [27, 10], [27, 3], [23, 3], [23, 10], [20, 10], [20, 0]]])
+    ]
+    store, locator = build(zones)
+    named = {
+        "hole": ([3.5, 3.5], None),
+        # Half-open rule: a hole's west edge belongs to the hole, its east edge to the ring
+        "hole west edge": ([3, 5], None),
+        "hole east edge": ([7, 5], "ring"),
+        "island": ([5, 5], "island"),
+        "island vertex": ([4, 4], "island"),
+        "ring body": ([1, 1], "ring"),
+        "overlap (smaller wins)": ([9, 9], "overlap"),
+        "overlap only": ([11, 11], "overlap"),
+        "u gap": ([25, 8], None),
+        "u arm": ([21, 8], "u_shape"),
+        "between zones": ([15, 5], None),
+        "far outside": ([-50, 60], None)
+    }
+    for label, (point, expected) in named.items():
+        got = locator.locate_point(*point)
+        if got != expected:
+            print(f"❌ {label}: {point} located in {got}, expected {expected}")
+            failures += 1
+
+    rng = random.Random(7)
+    vertices = [vertex for _, rings in zones for ring in rings for vertex in ring]
+    edge_points = [
+        [(x1 + x2) / 2, (y1 + y2) / 2] for _, rings in zones for ring in rings
+        for (x1, y1), (x2, y2) in zip(ring, ring[1:])
+    ]
+    scattered = [[rng.uniform(-5, 35), rng.uniform(-5, 15)] for _ in range(2000)]
+    failures += check("synthetic layout", store, locator, vertices + edge_points + scattered)
+    return failures
+
+
+def test_venue(queries: int = 2000) -> int:
+    if not os.path.exists(VENUE_GEOJSON_PATH):
+        print(f"⚠️ GeoJSON file not found at: {VENUE_GEOJSON_PATH}, skipping venue check")
+        return 0
+
+    locator = ZoneLocator.from_geojson(VENUE_GEOJSON_PATH)
+    store = locator.store
+    bboxes = store.bboxes[locator._zones]
+    rng = random.Random(42)
+
+    vertices, edge_points = [], []
+    for index in locator._zones.tolist():
+        for ring in store.rings(index):
+            vertices.extend(ring.tolist())
+            edge_points.extend(((ring + np.roll(ring, -1, axis=0)) / 2).tolist())
+    scattered = [
+        [rng.uniform(bboxes[:, 0].min() - 0.001, bboxes[:, 2].max() + 0.001),
+         rng.uniform(bboxes[:, 1].min() - 0.001, bboxes[:, 3].max() + 0.001)]
+        for _ in range(queries)
+    ]
+    points = rng.sample(vertices, min(500, len(vertices))) + rng.sample(edge_points, min(500, len(edge_points))) + scattered
+    failures = check("venue", store, locator, points)
+    if not failures:
+        located = sum(zone is not None for zone in locator.locate(scattered))
+        print(f"✓ {len(points)} venue points match brute force ({located}/{len(scattered)} scattered points inside a zone)")
+
+    batch = np.column_stack([
+        np.random.default_rng(0).uniform(bboxes[:, 0].min(), bboxes[:, 2].max(), 200_000),
+        np.random.default_rng(1).uniform(bboxes[:, 1].min(), bboxes[:, 3].max(), 200_000)
+    ])
+    started = time.perf_counter()
+    locator.locate_indices(batch)
+    print(f"✓ Located {len(batch):,} points at {len(batch) / (time.perf_counter() - started):,.0f} points/sec")
+    return failures
+
+
+def test_zone_locator() -> bool:
+    failures = test_synthetic()
+    if not failures:
+        print("✓ Shared edges/vertices, holes, overlaps and outside points match brute force")
+    failures += test_venue()
+    return failures == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if test_zone_locator() else 1)
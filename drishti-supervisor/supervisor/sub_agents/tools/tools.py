@@ -1,19 +1,26 @@
 import logging
 from typing import List, Dict, Any
 from datetime import datetime
-from google.adk.tools import LongRunningFunctionTool
+from google.adk.tools import FunctionTool, LongRunningFunctionTool
 
 from .graph_utils import (
     search_knowledge_graph,
     get_entity_relationships,
-    graph_client
+    get_graph_client
 )
 from .models import (
     GraphSearchInput,
     GraphSearchResult,
+    HybridSearchInput,
+    BatchSearchInput,
     EntityRelationshipInput,
-    EntityTimelineInput
+    EntityTimelineInput,
+    SpatialQueryInput,
+    ZoneLocateInput
 )
+from .metrics import tool_call, phase
+from .spatial_index import get_venue_spatial_index
+from .zone_locator import get_venue_zone_locator
 
 from dotenv import load_dotenv
 
@@ -32,88 +39,277 @@ async def graphiti_graph_search_tool(input_data: GraphSearchInput) -> List[Graph
     Returns:
         List of graph search results
     """
-    try:
-        results = await search_knowledge_graph(
-            query=input_data.query
-        )
-        
-        # Convert to GraphSearchResult models
-        return [
-            GraphSearchResult(
-                fact=r["fact"],
-                uuid=r["uuid"],
-                valid_at=r.get("valid_at"),
-                invalid_at=r.get("invalid_at"),
-                source_node_uuid=r.get("source_node_uuid")
+    with tool_call("graph_search") as call:
+        try:
+            results = await search_knowledge_graph(
+                query=input_data.query,
+                namespace=input_data.namespace
             )
-            for r in results
-        ]
-        
-    except Exception as e:
-        logger.error(f"Graph search failed: {e}")
-        return []
+            
+            # Convert to GraphSearchResult models
+            with phase("serialize"):
+                output = [
+                    GraphSearchResult(
+                        fact=r["fact"],
+                        uuid=r["uuid"],
+                        valid_at=r.get("valid_at"),
+                        invalid_at=r.get("invalid_at"),
+                        source_node_uuid=r.get("source_node_uuid")
+                    )
+                    for r in results
+                ]
+            call.results(len(output))
+            return output
+            
+        except Exception as e:
+            logger.error(f"Graph search failed: {e}")
+            call.error(e)
+            return []
+
+async def graphiti_hybrid_search_tool(input_data: HybridSearchInput) -> Dict[str, Any]:
+    """
+    Search zone episode content by keyword together with the knowledge graph.
+    
+    Prefer this over graph search for exact identifiers ("zone_045",
+    "checkpoint_003") and specific terms; identifier-only queries are
+    answered from the local keyword index without semantic search.
+    
+    Args:
+        input_data: Hybrid search parameters
+    
+    Returns:
+        Fused episode and fact results
+    """
+    with tool_call("hybrid_search") as call:
+        try:
+            result = await get_graph_client().hybrid_search(
+                query=input_data.query,
+                limit=input_data.limit,
+                text_weight=input_data.text_weight,
+                namespace=input_data.namespace
+            )
+            call.results(len(result["results"]))
+            return result
+            
+        except Exception as e:
+            logger.error(f"Hybrid search failed: {e}")
+            call.error(e)
+            return {"query": input_data.query, "results": [], "error": str(e)}
+
+async def graphiti_batch_search_tool(input_data: BatchSearchInput) -> Dict[str, Any]:
+    """
+    Run several knowledge graph lookups for one situation in a single call.
+    
+    Use this instead of calling the search, relationship and timeline tools
+    one after another, e.g. zone details + nearby infrastructure + assigned
+    agents + recent timeline for an incident. Each query's result is
+    returned under its key.
+    
+    Args:
+        input_data: Batch of queries
+    
+    Returns:
+        Results keyed by query key
+    """
+    with tool_call("batch_search") as call:
+        try:
+            result = await get_graph_client().batch_search(
+                [query.model_dump() for query in input_data.queries],
+                namespace=input_data.namespace
+            )
+            call.results(len(result["results"]))
+            return result
+            
+        except Exception as e:
+            logger.error(f"Batch search failed: {e}")
+            call.error(e)
+            return {"results": {}, "error": str(e)}
 
 async def graphiti_get_entity_relationships_tool(input_data: EntityRelationshipInput) -> Dict[str, Any]:
     """
     Get relationships for an entity.
     
+    Use this for structural questions ("what is connected to gate_003",
+    "which zones does this exit serve"); it walks the graph directly
+    without semantic search.
+    
     Args:
         input_data: Entity relationship parameters
     
     Returns:
         Entity relationships
     """
-    try:
-        return await get_entity_relationships(
-            entity=input_data.entity_name,
-            depth=input_data.depth
-        )
-        
-    except Exception as e:
-        logger.error(f"Entity relationship query failed: {e}")
-        return {
-            "central_entity": input_data.entity_name,
-            "related_entities": [],
-            "relationships": [],
-            "depth": input_data.depth,
-            "error": str(e)
-        }
+    with tool_call("entity_relationships") as call:
+        try:
+            result = await get_entity_relationships(
+                entity=input_data.entity_name,
+                depth=input_data.depth,
+                relationship_types=input_data.relationship_types,
+                limit=input_data.limit,
+                fan_out=input_data.fan_out,
+                namespace=input_data.namespace
+            )
+            call.results(len(result["related_entities"]))
+            return result
+            
+        except Exception as e:
+            logger.error(f"Entity relationship query failed: {e}")
+            call.error(e)
+            return {
+                "central_entity": input_data.entity_name,
+                "related_entities": [],
+                "relationships": [],
+                "depth": input_data.depth,
+                "error": str(e)
+            }
 
-async def graphiti_get_entity_timeline_tool(input_data: EntityTimelineInput) -> List[Dict[str, Any]]:
+async def graphiti_get_entity_timeline_tool(input_data: EntityTimelineInput) -> Dict[str, Any]:
     """
     Get timeline of facts for an entity.
     
+    Facts come back oldest first. When next_cursor is set, call again with
+    it as cursor to get the following page.
+    
     Args:
         input_data: Timeline query parameters
     
     Returns:
-        Timeline of facts
+        Timeline page with facts and next_cursor
+    """
+    with tool_call("entity_timeline") as call:
+        try:
+            # Parse dates if provided
+            start_date = None
+            end_date = None
+            
+            if input_data.start_date:
+                start_date = datetime.fromisoformat(input_data.start_date)
+            if input_data.end_date:
+                end_date = datetime.fromisoformat(input_data.end_date)
+            
+            # Get timeline from graph
+            timeline = await get_graph_client().get_entity_timeline(
+                entity_name=input_data.entity_name,
+                start_date=start_date,
+                end_date=end_date,
+                limit=input_data.limit,
+                cursor=input_data.cursor,
+                namespace=input_data.namespace
+            )
+            
+            call.results(len(timeline["facts"]))
+            return timeline
+            
+        except Exception as e:
+            logger.error(f"Entity timeline query failed: {e}")
+            call.error(e)
+            return {
+                "entity": input_data.entity_name,
+                "facts": [],
+                "next_cursor": None,
+                "error": str(e)
+            }
+
+def venue_spatial_query_tool(input_data: SpatialQueryInput) -> Dict[str, Any]:
+    """
+    Find zones, infrastructure and entry/exit points by location.
+    
+    Use this instead of graph search for geometric questions such as "nearest
+    open medical_station to this point", "what is within 200 m of zone_045"
+    or "everything inside this bounding box". Distances are in meters.
+    
+    Args:
+        input_data: Spatial query parameters
+    
+    Returns:
+        Matching items (nearest first for point queries) with distance_meters
     """
     try:
-        # Parse dates if provided
-        start_date = None
-        end_date = None
+        index = get_venue_spatial_index()
+        filters = {
+            "kinds": input_data.kinds,
+            "item_type": input_data.item_type,
+            "operational_only": input_data.operational_only
+        }
         
-        if input_data.start_date:
-            start_date = datetime.fromisoformat(input_data.start_date)
-        if input_data.end_date:
-            end_date = datetime.fromisoformat(input_data.end_date)
+        if input_data.query_type == "bbox":
+            if None in (input_data.min_lon, input_data.min_lat, input_data.max_lon, input_data.max_lat):
+                raise ValueError("bbox queries need min_lon, min_lat, max_lon and max_lat")
+            items = index.within_bbox(
+                input_data.min_lon, input_data.min_lat, input_data.max_lon, input_data.max_lat, **filters
+            )
+            return {"query_type": "bbox", "count": len(items), "results": [item.to_dict() for item in items]}
         
-        # Get timeline from graph
-        timeline = await graph_client.get_entity_timeline(
-            entity_name=input_data.entity_name,
-            start_date=start_date,
-            end_date=end_date
-        )
+        # Point queries: explicit coordinates or a zone's centroid
+        if input_data.longitude is not None and input_data.latitude is not None:
+            lon, lat = input_data.longitude, input_data.latitude
+        elif input_data.zone_id:
+            if input_data.zone_id not in index.zone_centroids:
+                raise ValueError(f"Unknown zone: {input_data.zone_id}")
+            lon, lat = index.zone_centroids[input_data.zone_id]
+        else:
+            raise ValueError("Point queries need longitude/latitude or zone_id")
         
-        return timeline
+        if input_data.query_type == "within_radius":
+            matches = index.within_radius(lon, lat, input_data.radius_meters, **filters)
+        elif input_data.query_type == "nearest":
+            matches = index.nearest(lon, lat, k=input_data.k, **filters)
+        else:
+            raise ValueError(f"Unknown query_type: {input_data.query_type}")
+        
+        return {
+            "query_type": input_data.query_type,
+            "origin": [lon, lat],
+            "count": len(matches),
+            "results": [
+                {**item.to_dict(), "distance_meters": round(distance, 1)}
+                for item, distance in matches
+            ]
+        }
+        
+    except Exception as e:
+        logger.error(f"Spatial query failed: {e}")
+        return {"query_type": input_data.query_type, "count": 0, "results": [], "error": str(e)}
+
+def venue_locate_zone_tool(input_data: ZoneLocateInput) -> Dict[str, Any]:
+    """
+    Find which venue zone contains each coordinate.
+    
+    Use this to turn incident locations or GPS reports ([longitude, latitude])
+    into zone IDs before querying zone details, agents or infrastructure.
+    
+    Args:
+        input_data: Points to locate
+    
+    Returns:
+        Zone ID and name per point (None when a point is outside every zone)
+    """
+    try:
+        locator = get_venue_zone_locator()
+        zone_ids = locator.locate(input_data.points)
+        results = [
+            {"point": point, "zone_id": zone_id, "zone_name": locator.zone_names.get(zone_id) if zone_id else None}
+            for point, zone_id in zip(input_data.points, zone_ids)
+        ]
+        return {
+            "count": len(results),
+            "located": sum(1 for zone_id in zone_ids if zone_id),
+            "results": results
+        }
         
     except Exception as e:
-        logger.error(f"Entity timeline query failed: {e}")
-        return []
+        logger.error(f"Zone lookup failed: {e}")
+        return {"count": 0, "located": 0, "results": [], "error": str(e)}
 
 graph_search_tool = LongRunningFunctionTool(func=graphiti_graph_search_tool)
+hybrid_search_tool = LongRunningFunctionTool(func=graphiti_hybrid_search_tool)
+batch_search_tool = LongRunningFunctionTool(func=graphiti_batch_search_tool)
 get_entity_relationships_tool = LongRunningFunctionTool(func=graphiti_get_entity_relationships_tool)
 get_entity_timeline_tool = LongRunningFunctionTool(func=graphiti_get_entity_timeline_tool)
+spatial_query_tool = FunctionTool(func=venue_spatial_query_tool)
+locate_zone_tool = FunctionTool(func=venue_locate_zone_tool)
 
-__all__ = ['graph_search_tool', 'get_entity_relationships_tool', 'get_entity_timeline_tool']
\ No newline at end of file
+__all__ = [
+    'graph_search_tool', 'get_entity_relationships_tool', 'get_entity_timeline_tool', 'spatial_query_tool',
+    'locate_zone_tool', 'hybrid_search_tool', 'batch_search_tool'
+]
\ No newline at end of file
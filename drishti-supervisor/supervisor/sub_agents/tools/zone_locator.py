@@ -0,0 +1,209 @@
+"""
+Point-in-polygon zone lookup for incident and GPS coordinates.
+
+Zone bounding boxes are bucketed into a uniform grid. A batch of points is
+turned into (point, candidate zone) pairs through the grid, filtered by
+bounding box, and every zone then ray-casts its candidate points against all
+of its polygon edges at once (even-odd rule, so holes are respected).
+"""
+
+import json
+import math
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from .zone_model import normalize_feature
+    from .geometry_store import GeometryStore
+    from .spatial_index import VENUE_GEOJSON_PATH
+except ImportError:
+    # For direct execution or testing
+    import zone_model
+    import geometry_store
+    import spatial_index
+    normalize_feature = zone_model.normalize_feature
+    GeometryStore = geometry_store.GeometryStore
+    VENUE_GEOJSON_PATH = spatial_index.VENUE_GEOJSON_PATH
+
+logger = logging.getLogger(__name__)
+
+# Points processed per vectorized block (bounds temporary memory)
+LOCATE_BLOCK_SIZE = 65536
+
+
+class ZoneLocator:
+    """Maps coordinates to the ID of the zone polygon containing them."""
+
+    def __init__(self, store: GeometryStore, zone_names: Optional[Dict[str, str]] = None):
+        """
+        Build the locator.
+
+        Args:
+            store: Packed venue geometry (Polygon zones are located, others ignored)
+            zone_names: Optional zone ID -> name mapping for results
+        """
+        self.store = store
+        self.zone_ids = list(store.zone_ids)
+        self.zone_names = zone_names or {}
+
+        polygons = [
+            index for index in range(len(store))
+            if store.geometry_type(index) == "Polygon" and store.bounding_box(index)
+        ]
+        self._zones = np.asarray(polygons, dtype=np.int64)
+        self._boxes = store.bboxes[self._zones] if polygons else np.empty((0, 4))
+        # Smaller zones win where polygons overlap
+        self._areas = store.areas[self._zones] if polygons else np.empty(0)
+
+        # All polygon edges (x1, y1, x2, y2), contiguous per zone
+        edges = []
+        offsets = [0]
+        for index in polygons:
+            for ring in store.rings(index):
+                edges.append(np.column_stack([ring, np.roll(ring, -1, axis=0)]))
+            offsets.append(offsets[-1] + sum(len(ring) for ring in store.rings(index)))
+        self._edges = np.concatenate(edges) if edges else np.empty((0, 4))
+        self._edge_offsets = np.asarray(offsets, dtype=np.int64)
+
+        self._build_grid()
+
+    @classmethod
+    def from_geojson(cls, file_path: str) -> "ZoneLocator":
+        """Build a locator from a venue GeoJSON file."""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        store = GeometryStore()
+        names = {}
+        for index, feature in enumerate(data.get("features", [])):
+            zone, geometry = normalize_feature(feature)
+            zone_id = zone.id or f"zone_{index}"
+            store.add(zone_id, geometry)
+            names[zone_id] = zone.name
+
+        locator = cls(store, names)
+        logger.info(f"Built zone locator over {len(locator._zones)} zone polygons from {file_path}")
+        return locator
+
+    def _build_grid(self):
+        """Bucket zone boxes into a uniform grid (CSR layout: cell -> zone positions)."""
+        count = len(self._zones)
+        self._grid_size = max(1, math.ceil(math.sqrt(count)))
+        if count == 0:
+            self._extent = np.zeros(4)
+            self._cell_offsets = np.zeros(2, dtype=np.int64)
+            self._cell_zones = np.empty(0, dtype=np.int64)
+            return
+
+        self._extent = np.concatenate([self._boxes[:, :2].min(axis=0), self._boxes[:, 2:].max(axis=0)])
+        cells_x0, cells_y0 = self._cells(self._boxes[:, 0], self._boxes[:, 1])
+        cells_x1, cells_y1 = self._cells(self._boxes[:, 2], self._boxes[:, 3])
+
+        buckets: List[List[int]] = [[] for _ in range(self._grid_size * self._grid_size)]
+        for position in range(count):
+            for cell_y in range(cells_y0[position], cells_y1[position] + 1):
+                for cell_x in range(cells_x0[position], cells_x1[position] + 1):
+                    buckets[cell_y * self._grid_size + cell_x].append(position)
+
+        self._cell_offsets = np.cumsum([0] + [len(bucket) for bucket in buckets]).astype(np.int64)
+        self._cell_zones = np.asarray([p for bucket in buckets for p in bucket], dtype=np.int64)
+
+    def _cells(self, lons: np.ndarray, lats: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Grid cell coordinates of points (clamped to the grid)."""
+        min_lon, min_lat, max_lon, max_lat = self._extent
+        width = max(max_lon - min_lon, 1e-12)
+        height = max(max_lat - min_lat, 1e-12)
+        last = self._grid_size - 1
+        cell_x = np.clip(((lons - min_lon) / width * self._grid_size).astype(np.int64), 0, last)
+        cell_y = np.clip(((lats - min_lat) / height * self._grid_size).astype(np.int64), 0, last)
+        return cell_x, cell_y
+
+    def locate_indices(self, points: np.ndarray) -> np.ndarray:
+        """
+        Locate a batch of points.
+
+        Args:
+            points: (N, 2) array of [lon, lat]
+
+        Returns:
+            (N,) array of store indexes of the containing zones (-1 outside every zone)
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        result = np.full(len(points), -1, dtype=np.int64)
+        for start in range(0, len(points), LOCATE_BLOCK_SIZE):
+            result[start:start + LOCATE_BLOCK_SIZE] = self._locate_block(points[start:start + LOCATE_BLOCK_SIZE])
+        return result
+
+    def _locate_block(self, points: np.ndarray) -> np.ndarray:
+        result = np.full(len(points), -1, dtype=np.int64)
+        if len(points) == 0 or len(self._zones) == 0:
+            return result
+
+        lons, lats = points[:, 0], points[:, 1]
+        min_lon, min_lat, max_lon, max_lat = self._extent
+        in_extent = np.flatnonzero((lons >= min_lon) & (lons <= max_lon) & (lats >= min_lat) & (lats <= max_lat))
+        if len(in_extent) == 0:
+            return result
+
+        # (point, candidate zone) pairs from the grid
+        cell_x, cell_y = self._cells(lons[in_extent], lats[in_extent])
+        cells = cell_y * self._grid_size + cell_x
+        starts, ends = self._cell_offsets[cells], self._cell_offsets[cells + 1]
+        counts = ends - starts
+        pair_points = np.repeat(in_extent, counts)
+        pair_zones = self._cell_zones[np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())]
+
+        # Bounding box filter
+        boxes = self._boxes[pair_zones]
+        px, py = lons[pair_points], lats[pair_points]
+        keep = (px >= boxes[:, 0]) & (px <= boxes[:, 2]) & (py >= boxes[:, 1]) & (py <= boxes[:, 3])
+        pair_points, pair_zones = pair_points[keep], pair_zones[keep]
+
+        best_area = np.full(len(points), np.inf)
+        order = np.argsort(pair_zones, kind="stable")
+        pair_points, pair_zones = pair_points[order], pair_zones[order]
+        boundaries = np.flatnonzero(np.diff(pair_zones)) + 1
+
+        # Ray casting, one zone (all candidate points x all edges) at a time
+        for zone_points, zone in zip(np.split(pair_points, boundaries), pair_zones[np.r_[0, boundaries]] if len(pair_zones) else []):
+            edges = self._edges[self._edge_offsets[zone]:self._edge_offsets[zone + 1]]
+            x1, y1, x2, y2 = edges[:, 0], edges[:, 1], edges[:, 2], edges[:, 3]
+            qx, qy = lons[zone_points][:, None], lats[zone_points][:, None]
+
+            straddles = (y1 > qy) != (y2 > qy)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                crossing_x = (x2 - x1) * (qy - y1) / (y2 - y1) + x1
+            inside = (np.count_nonzero(straddles & (qx < crossing_x), axis=1) % 2) == 1
+
+            winners = zone_points[inside & (self._areas[zone] < best_area[zone_points])]
+            best_area[winners] = self._areas[zone]
+            result[winners] = self._zones[zone]
+
+        return result
+
+    def locate(self, points: Sequence[Sequence[float]]) -> List[Optional[str]]:
+        """
+        Locate a batch of [lon, lat] points.
+
+        Returns:
+            Zone ID per point (None outside every zone)
+        """
+        indices = self.locate_indices(np.asarray(points, dtype=np.float64).reshape(-1, 2))
+        return [self.zone_ids[index] if index >= 0 else None for index in indices.tolist()]
+
+    def locate_point(self, lon: float, lat: float) -> Optional[str]:
+        """Zone ID containing a single point (None outside every zone)."""
+        return self.locate([[lon, lat]])[0]
+
+
+_venue_locator: Optional[ZoneLocator] = None
+
+
+def get_venue_zone_locator() -> ZoneLocator:
+    """Zone locator of the venue at VENUE_GEOJSON_PATH (built on first use)."""
+    global _venue_locator
+    if _venue_locator is None:
+        _venue_locator = ZoneLocator.from_geojson(VENUE_GEOJSON_PATH)
+    return _venue_locator
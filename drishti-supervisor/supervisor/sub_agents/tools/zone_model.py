@@ -0,0 +1,207 @@
+"""
+Compact, normalized zone representation used by the graph builder.
+
+Venue features arrive either as validated pydantic models or as raw GeoJSON
+dicts. They are normalized once into __slots__ records with plain attributes,
+so downstream code never has to probe the input format again. Missing optional
+values take the enhanced location schema defaults, required values that are
+missing become None, and enum values are reduced to interned strings.
+"""
+
+import sys
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from .enhanced_location_schema import InfrastructurePoint, EntryExitPoint, ZoneProperties
+except ImportError:
+    # For direct execution or testing
+    import enhanced_location_schema
+    InfrastructurePoint = enhanced_location_schema.InfrastructurePoint
+    EntryExitPoint = enhanced_location_schema.EntryExitPoint
+    ZoneProperties = enhanced_location_schema.ZoneProperties
+
+_MISSING = object()
+
+
+def intern_enum(value: Any) -> Any:
+    """Reduce an enum member to its value and intern string values."""
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def _get(obj: Any, attr: str, default: Any = None) -> Any:
+    """Read a field from a pydantic object or a dict."""
+    if isinstance(obj, dict):
+        return obj.get(attr, default)
+    return getattr(obj, attr, default)
+
+
+def _schema_defaults(model: Any) -> Dict[str, Callable[[], Any]]:
+    """
+    Default factory of every optional field of a schema model.
+
+    Enum defaults are reduced to interned strings. Per-instance factories other
+    than list/dict (e.g. timestamps) are not applied, so those fields stay None
+    and normalized records do not change from run to run.
+    """
+    defaults: Dict[str, Callable[[], Any]] = {}
+    for name, field in model.model_fields.items():
+        if field.default_factory is not None:
+            if field.default_factory in (list, dict):
+                defaults[name] = field.default_factory
+        elif not field.is_required():
+            defaults[name] = lambda value=intern_enum(field.default): value
+    return defaults
+
+
+INFRASTRUCTURE_DEFAULTS = _schema_defaults(InfrastructurePoint)
+ENTRY_EXIT_DEFAULTS = _schema_defaults(EntryExitPoint)
+ZONE_DEFAULTS = _schema_defaults(ZoneProperties)
+
+
+def _point_coordinates(point: Any) -> Optional[List[float]]:
+    """Extract [lon, lat(, alt)] from a Point object, Point dict or bare coordinate list."""
+    if not point:
+        return None
+    coordinates = _get(point, "coordinates", _MISSING)
+    if coordinates is _MISSING:
+        return point if isinstance(point, list) else None
+    return coordinates
+
+
+class _SlotRecord:
+    """Base for normalized records: equality, repr and dict export over __slots__."""
+
+    __slots__ = ()
+
+    # Field name -> default factory (see _schema_defaults)
+    _defaults: Dict[str, Callable[[], Any]] = {}
+
+    def _read(self, source: Any, name: str) -> Any:
+        """Read a field, falling back to its schema default (None for required fields)."""
+        value = _get(source, name, _MISSING)
+        if value is _MISSING:
+            factory = self._defaults.get(name)
+            return factory() if factory else None
+        return value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            name: (
+                [item.to_dict() if isinstance(item, _SlotRecord) else item for item in value]
+                if isinstance(value, list) else value
+            )
+            for name in self.__slots__
+            for value in (getattr(self, name),)
+        }
+
+    def __eq__(self, other: Any) -> bool:
+        if type(self) is not type(other):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={getattr(self, 'id', None)!r})"
+
+
+class InfrastructureRecord(_SlotRecord):
+    """Normalized infrastructure point."""
+
+    __slots__ = (
+        "id", "name", "type", "coordinates", "capacity", "operational_status", "access_level",
+        "emergency_priority", "contact_info", "resources_available", "supported_incidents"
+    )
+    _defaults = INFRASTRUCTURE_DEFAULTS
+
+    def __init__(self, source: Any):
+        self.id = self._read(source, "id")
+        self.name = self._read(source, "name")
+        self.type = intern_enum(self._read(source, "type"))
+        self.coordinates = _point_coordinates(self._read(source, "coordinates"))
+        self.capacity = self._read(source, "capacity")
+        self.operational_status = self._read(source, "operational_status")
+        self.access_level = intern_enum(self._read(source, "access_level"))
+        self.emergency_priority = self._read(source, "emergency_priority")
+        self.contact_info = self._read(source, "contact_info")
+        self.resources_available = self._read(source, "resources_available")
+        self.supported_incidents = [intern_enum(incident) for incident in (self._read(source, "supported_incidents") or [])]
+
+
+class EntryExitRecord(_SlotRecord):
+    """Normalized entry/exit point."""
+
+    __slots__ = (
+        "id", "name", "coordinates", "is_entry", "is_exit", "access_level", "operational_hours",
+        "max_throughput", "current_status", "connected_zones"
+    )
+    _defaults = ENTRY_EXIT_DEFAULTS
+
+    def __init__(self, source: Any):
+        self.id = self._read(source, "id")
+        self.name = self._read(source, "name")
+        self.coordinates = _point_coordinates(self._read(source, "coordinates"))
+        self.is_entry = self._read(source, "is_entry")
+        self.is_exit = self._read(source, "is_exit")
+        self.access_level = intern_enum(self._read(source, "access_level"))
+        self.operational_hours = self._read(source, "operational_hours")
+        self.max_throughput = self._read(source, "max_throughput")
+        self.current_status = self._read(source, "current_status")
+        self.connected_zones = self._read(source, "connected_zones")
+
+
+class ZoneRecord(_SlotRecord):
+    """Normalized zone properties, including its infrastructure and entry/exit points."""
+
+    __slots__ = (
+        "id", "name", "zone_type", "security_level", "population_capacity", "current_population",
+        "access_level", "evacuation_time_minutes", "emergency_protocols", "response_team_coverage",
+        "infrastructure_points", "entry_exit_points", "last_updated", "operational_status",
+        "special_considerations", "assigned_agents", "communication_channels", "resource_requirements"
+    )
+    _defaults = ZONE_DEFAULTS
+
+    def __init__(self, source: Any):
+        source = source or {}
+        self.id = self._read(source, "id")
+        self.name = self._read(source, "name")
+        self.zone_type = intern_enum(self._read(source, "zone_type"))
+        self.security_level = intern_enum(self._read(source, "security_level"))
+        self.population_capacity = self._read(source, "population_capacity")
+        self.current_population = self._read(source, "current_population")
+        self.access_level = intern_enum(self._read(source, "access_level"))
+        self.evacuation_time_minutes = self._read(source, "evacuation_time_minutes")
+        self.emergency_protocols = self._read(source, "emergency_protocols")
+        self.response_team_coverage = self._read(source, "response_team_coverage")
+        self.infrastructure_points = [
+            InfrastructureRecord(infra) for infra in (self._read(source, "infrastructure_points") or [])
+        ]
+        self.entry_exit_points = [
+            EntryExitRecord(point) for point in (self._read(source, "entry_exit_points") or [])
+        ]
+        self.last_updated = self._read(source, "last_updated")
+        self.operational_status = self._read(source, "operational_status")
+        self.special_considerations = self._read(source, "special_considerations")
+        self.assigned_agents = self._read(source, "assigned_agents")
+        self.communication_channels = self._read(source, "communication_channels")
+        self.resource_requirements = self._read(source, "resource_requirements")
+
+
+def normalize_feature(feature: Any) -> Tuple[ZoneRecord, Dict[str, Any]]:
+    """
+    Normalize a GeoJSON feature (pydantic or dict) into a zone record and a geometry dict.
+
+    Args:
+        feature: EnhancedGeometry object or raw GeoJSON feature dict
+
+    Returns:
+        (zone record, GeoJSON geometry as a plain dict)
+    """
+    properties = _get(feature, "properties") or {}
+    geometry = _get(feature, "geometry") or {}
+    if not isinstance(geometry, dict):
+        geometry = {"type": _get(geometry, "type"), "coordinates": _get(geometry, "coordinates")}
+    return ZoneRecord(properties), geometry